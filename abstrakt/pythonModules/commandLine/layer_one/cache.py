@@ -0,0 +1,32 @@
+import typer
+import pytz
+
+from datetime import datetime
+from typing_extensions import Annotated
+
+from abstrakt.pythonModules.kubernetesOps.helmChartCache import HelmChartCache
+from abstrakt.pythonModules.customLogging.customLogging import CustomLogger
+
+uk_timezone = pytz.timezone('Europe/London')
+uk_time = datetime.now(uk_timezone)
+uk_time_str = uk_time.strftime('%d%m%Y')
+
+cache_app = typer.Typer()
+
+
+@cache_app.command(help='Prune Local Helm Chart Cache', rich_help_panel='Helm Charts')
+def prune(
+  keep: Annotated[int, typer.Option('--keep', help='Most Recently Used Versions to Keep per Chart | '
+                                                   'Example: 0 to Empty the Cache',
+                                    rich_help_panel='Prune Options')] = 1
+):
+  crwd_sensor_log_filename = f'/var/log/crowdstrike/sensors/sensor-{uk_time_str}.log'
+  crwd_sensor_logger = CustomLogger(__name__, crwd_sensor_log_filename).logger
+
+  chart_cache = HelmChartCache(logger=crwd_sensor_logger)
+  removed = chart_cache.prune(keep=keep)
+
+  for path in removed:
+    print(f'Removed {path}')
+
+  print(f'{len(removed)} chart archive/s pruned from {chart_cache.cache_dir}')
@@ -1,9 +1,19 @@
 import typer
+import pytz
 
+from datetime import datetime
+from typing_extensions import Annotated
+
+from abstrakt.pythonModules.customLogging.customLogging import CustomLogger
+from abstrakt.pythonModules.opsManager.fleetOperationsManager import FleetOperationsManager
 from abstrakt.pythonModules.commandLine.layer_one.layer_two.createAWS import create_aws_app
 from abstrakt.pythonModules.commandLine.layer_one.layer_two.createAzure import create_azure_app
 from abstrakt.pythonModules.commandLine.layer_one.layer_two.createGCP import create_gke_app
 
+uk_timezone = pytz.timezone('Europe/London')
+uk_time = datetime.now(uk_timezone)
+uk_time_str = uk_time.strftime('%d%m%Y')
+
 # Create a Typer application
 app = typer.Typer()
 
@@ -14,3 +24,35 @@ app.add_typer(create_azure_app, name="azure", help='Create Azure Infrastructure'
               rich_help_panel="Public Cloud Providers")
 app.add_typer(create_gke_app, name="gcp", help='Create GCP Infrastructure',
               rich_help_panel="Public Cloud Providers")
+
+
+@app.command(help='Fleet of Clusters from a Manifest', rich_help_panel='Fleets')
+def fleet(
+  manifest: Annotated[str, typer.Option('--manifest', help='Fleet Manifest | Example: fleet.yaml',
+                                        rich_help_panel='Fleet Options')] = './abstrakt/conf/fleet/fleet.yaml',
+  parallelism: Annotated[int, typer.Option('--parallelism',
+                                           help='Clusters to Create Concurrently | Defaults to 4',
+                                           show_default=False,
+                                           rich_help_panel='Fleet Options')] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently per Cluster | '
+                                                   'Number or auto | Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None,
+  output_dir: Annotated[str, typer.Option('--output-dir',
+                                          help='Directory for Cluster Output and Summary | '
+                                               'Defaults to /var/log/crowdstrike/fleet/<manifest>-<time>',
+                                          show_default=False,
+                                          rich_help_panel='Fleet Options')] = None
+):
+  fleet_log_filename = f'/var/log/crowdstrike/fleet/fleet-{uk_time_str}.log'
+  fleet_logger = CustomLogger('fleet', fleet_log_filename).logger
+
+  manager = FleetOperationsManager(manifest=manifest,
+                                   logger=fleet_logger,
+                                   parallelism=parallelism,
+                                   tf_parallelism=tf_parallelism,
+                                   output_dir=output_dir)
+
+  if not manager.start_fleet_operations():
+    raise typer.Exit(code=1)
@@ -35,9 +35,18 @@ def crowdstrike(
   repository: Annotated[str, typer.Option('--repository', help='Image Repository for all Images | '
                                           'Example: falcon-sensor', show_default=False,
                                           rich_help_panel="CrowdStrike EDR Sensor Options")] = None,
+  mirror_platforms: Annotated[str, typer.Option('--mirror-platforms',
+                                                help='Image Platforms to Mirror to Registry | Defaults to Cluster '
+                                                     'Node Architectures | Example: linux/amd64,linux/arm64',
+                                                rich_help_panel="CrowdStrike EDR Sensor Options",
+                                                show_default=False)] = None,
   sensor_image_tag: Annotated[str, typer.Option('--sensor-image-tag', help='Falcon Sensor Image Tag | '
                                                 'Example: 7.10.0-16303-1.falcon-linux.x86_64.Release.US-1',
                                                 rich_help_panel="CrowdStrike EDR Sensor Options")] = 'latest',
+  sensor_chart_version: Annotated[str, typer.Option('--sensor-chart-version', help='Falcon Sensor Helm Chart Version | '
+                                                    'Defaults to Latest | Example: 1.27.1',
+                                                    rich_help_panel="CrowdStrike EDR Sensor Options",
+                                                    show_default=False)] = None,
   proxy_server: Annotated[str, typer.Option('--proxy-server', help='Proxy Server IP or FQDN | '
                                                                    'Example: 10.10.10.10 OR proxy.internal.com',
                                             rich_help_panel="CrowdStrike EDR Sensor Options",
@@ -115,6 +124,10 @@ def crowdstrike(
   kac_image_tag: Annotated[str, typer.Option('--kac-image-tag', help='KAC Image Tag | '
                                              'Example: 7.18.0-1603.container.x86_64.Release.US-1',
                                              rich_help_panel="CrowdStrike Kubernetes Admission Controller")] = 'latest',
+  kac_chart_version: Annotated[str, typer.Option('--kac-chart-version', help='KAC Helm Chart Version | '
+                                                 'Defaults to Latest | Example: 1.1.7',
+                                                 rich_help_panel="CrowdStrike Kubernetes Admission Controller",
+                                                 show_default=False)] = None,
   iar: Annotated[bool, typer.Option('--iar',
                                     help='Install Image Assessment at Runtime',
                                     rich_help_panel='CrowdStrike Image Assessment at Runtime',
@@ -122,10 +135,18 @@ def crowdstrike(
   iar_image_tag: Annotated[str, typer.Option('--iar-image-tag', help='IAR Image Tag | '
                                                                      'Example: 1.0.9',
                                              rich_help_panel="CrowdStrike Image Assessment at Runtime")] = 'latest',
+  iar_chart_version: Annotated[str, typer.Option('--iar-chart-version', help='IAR Helm Chart Version | '
+                                                 'Defaults to Latest | Example: 1.1.8',
+                                                 rich_help_panel="CrowdStrike Image Assessment at Runtime",
+                                                 show_default=False)] = None,
   kpa: Annotated[bool, typer.Option('--kpa',
                                     help='Install Kubernetes Protection Agent',
                                     rich_help_panel='CrowdStrike Kubernetes Agents',
                                     show_default=False)] = False,
+  kpa_chart_version: Annotated[str, typer.Option('--kpa-chart-version', help='KPA Helm Chart Version | '
+                                                 'Defaults to Latest | Example: 0.2117.0',
+                                                 rich_help_panel='CrowdStrike Kubernetes Agents',
+                                                 show_default=False)] = None,
   falcon_client_id: Annotated[str, typer.Option('--falcon-client-id',
                                                 help='Client ID to Install Falcon Sensor | Example: QWERT',
                                                 rich_help_panel='CrowdStrike API Keys',
@@ -145,7 +166,11 @@ def crowdstrike(
   generate_misconfigs: Annotated[bool, typer.Option('--generate-misconfigs',
                                                     help='Generate Misconfigurations',
                                                     rich_help_panel='CrowdStrike Artificial Detections Generator',
-                                                    show_default=False)] = False
+                                                    show_default=False)] = False,
+  parallelism: Annotated[int, typer.Option('--parallelism',
+                                           help='Components to Install Concurrently | Defaults to 4',
+                                           rich_help_panel='Install Options',
+                                           show_default=False)] = None
 ):
   crwd_sensor_log_filename = f'/var/log/crowdstrike/sensors/sensor-{uk_time_str}.log'
   crwd_sensor_logger = CustomLogger(__name__, crwd_sensor_log_filename).logger
@@ -187,6 +212,12 @@ def crowdstrike(
                                                       detections_container=detections_container,
                                                       vulnerable_apps=vulnerable_apps,
                                                       generate_misconfigs=generate_misconfigs,
+                                                      mirror_platforms=mirror_platforms,
+                                                      sensor_chart_version=sensor_chart_version,
+                                                      kac_chart_version=kac_chart_version,
+                                                      iar_chart_version=iar_chart_version,
+                                                      kpa_chart_version=kpa_chart_version,
+                                                      parallelism=parallelism,
                                                       logger=crwd_sensor_logger)
 
   manager.start_crowdstrike_sensor_operations()
@@ -100,6 +100,15 @@ def eks_managed_node(
                                                            show_default=False,
                                                            rich_help_panel='CrowdStrike Artificial '
                                                            'Detections Generator')] = False,
+  parallelism: Annotated[int, typer.Option('--parallelism',
+                                           help='Components to Install Concurrently | Defaults to 4',
+                                           show_default=False,
+                                           rich_help_panel='Install Options')] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None
 ):
   eks_managed_node_log_filename = f'/var/log/crowdstrike/aws/eks-managed-node-{uk_time_str}.log'
   eks_managed_node_logger = CustomLogger('eks_managed_node', eks_managed_node_log_filename).logger
@@ -130,9 +139,11 @@ def eks_managed_node(
                                           generate_misconfigs=generate_misconfigurations,
                                           cloud_type='aws',
                                           cluster_type='eks-managed-node',
-                                          logger=eks_managed_node_logger
+                                          logger=eks_managed_node_logger,
+                                          parallelism=parallelism,
+                                          tf_parallelism=tf_parallelism
                                           )
-  manager.start_cluster_operations()
+  return manager.start_cluster_operations()
 
 
 @create_aws_app.command(help='EKS Fargate Cluster', rich_help_panel="AWS Kubernetes Clusters")
@@ -229,7 +240,17 @@ def eks_fargate(
                                                 show_default=True,
                                                 rich_help_panel='AWS Options')] = 'CrowdStrikeKACIAMRole',
   ecr_iar_iam_role: Annotated[str, typer.Option('--ecr-iar-iam-role', help='AWS IAM Role Name for IAR',
-                                                show_default=True, rich_help_panel='AWS Options')] = 'CrowdStrikeIARIAMRole'
+                                                show_default=True,
+                                                rich_help_panel='AWS Options')] = 'CrowdStrikeIARIAMRole',
+  parallelism: Annotated[int, typer.Option('--parallelism',
+                                           help='Components to Install Concurrently | Defaults to 4',
+                                           show_default=False,
+                                           rich_help_panel='Install Options')] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None
 ):
   eks_fargate_log_filename = f'/var/log/crowdstrike/aws/eks-fargate-{uk_time_str}.log'
   eks_fargate_logger = CustomLogger('eks_fargate', eks_fargate_log_filename).logger
@@ -261,12 +282,14 @@ def eks_fargate(
                                         cloud_type='aws',
                                         cluster_type='eks-fargate',
                                         logger=eks_fargate_logger,
+                                        parallelism=parallelism,
+                                        tf_parallelism=tf_parallelism,
                                         ecr_iam_policy=ecr_iam_policy,
                                         ecr_sensor_iam_role=ecr_sensor_iam_role,
                                         ecr_kac_iam_role=ecr_kac_iam_role,
                                         ecr_iar_iam_role=ecr_iar_iam_role)
 
-  manager.start_cluster_operations()
+  return manager.start_cluster_operations()
 
 
 # @create_aws_app.command(help='ECS Fargate Cluster', rich_help_panel="AWS Kubernetes Clusters")
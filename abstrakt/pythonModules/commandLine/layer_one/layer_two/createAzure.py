@@ -114,6 +114,15 @@ def aks(
                                                     show_default=False,
                                                     rich_help_panel='CrowdStrike Artificial '
                                                     'Detections Generator')] = False,
+  parallelism: Annotated[int, typer.Option('--parallelism',
+                                           help='Components to Install Concurrently | Defaults to 4',
+                                           show_default=False,
+                                           rich_help_panel='Install Options')] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None
 ):
   azure_log_filename = f'/var/log/crowdstrike/azure/aks-{uk_time_str}.log'
   aks_logger = CustomLogger(__name__, azure_log_filename).logger
@@ -146,10 +155,12 @@ def aks(
                                           install_vulnerable_apps=install_vulnerable_apps,
                                           generate_misconfigs=generate_misconfigs,
                                           logger=aks_logger,
+                                          parallelism=parallelism,
+                                          tf_parallelism=tf_parallelism,
                                           kernel_mode=kernel_mode,
                                           ebpf_mode=ebpf_mode)
 
-  manager.start_azure_cluster_operations()
+  return manager.start_azure_cluster_operations()
 
 
 azure_aci_help_message = """Azure ACI Cluster"""
@@ -91,6 +91,15 @@ def gke_standard(
                                                     help='Generate Misconfigurations',
                                                     rich_help_panel='CrowdStrike Artificial '
                                                                     'Detections Generator')] = False,
+  parallelism: Annotated[int, typer.Option('--parallelism',
+                                           help='Components to Install Concurrently | Defaults to 4',
+                                           show_default=False,
+                                           rich_help_panel='Install Options')] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None
 ):
   gke_standard_log_filename = f'/var/log/crowdstrike/gcp/gke-standard-{uk_time_str}.log'
   gke_standard_logger = CustomLogger(__name__, gke_standard_log_filename).logger
@@ -121,9 +130,11 @@ def gke_standard(
                                         install_detections_container=install_detections_container,
                                         install_vulnerable_apps=install_vulnerable_apps,
                                         generate_misconfigs=generate_misconfigs,
-                                        logger=gke_standard_logger)
+                                        logger=gke_standard_logger,
+                                        parallelism=parallelism,
+                                        tf_parallelism=tf_parallelism)
 
-  manager.start_gcp_cluster_operations()
+  return manager.start_gcp_cluster_operations()
 
 
 gke_autopilot_help_message = """GKE Autopilot Cluster"""
@@ -203,6 +214,15 @@ def gke_autopilot(
                                                     help='Generate Misconfigurations',
                                                     rich_help_panel='CrowdStrike Artificial '
                                                                     'Detections Generator')] = False,
+  parallelism: Annotated[int, typer.Option('--parallelism',
+                                           help='Components to Install Concurrently | Defaults to 4',
+                                           show_default=False,
+                                           rich_help_panel='Install Options')] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None
 ):
   gke_autopilot_log_filename = f'/var/log/crowdstrike/gcp/gke-autopilot-{uk_time_str}.log'
   gke_autopilot_logger = CustomLogger(__name__, gke_autopilot_log_filename).logger
@@ -233,6 +253,8 @@ def gke_autopilot(
                                         install_detections_container=install_detections_container,
                                         install_vulnerable_apps=install_vulnerable_apps,
                                         generate_misconfigs=generate_misconfigs,
-                                        logger=gke_autopilot_logger)
+                                        logger=gke_autopilot_logger,
+                                        parallelism=parallelism,
+                                        tf_parallelism=tf_parallelism)
 
-  manager.start_gcp_cluster_operations()
+  return manager.start_gcp_cluster_operations()
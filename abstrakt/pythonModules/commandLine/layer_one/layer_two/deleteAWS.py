@@ -1,4 +1,3 @@
-import os
 import typer
 import pytz
 
@@ -6,6 +5,7 @@ from datetime import datetime
 from typing_extensions import Annotated
 
 from abstrakt.pythonModules.terraformOps.executeTerraform import ExecuteTerraform
+from abstrakt.pythonModules.terraformOps.terraformWorkspace import TerraformWorkspace
 from abstrakt.pythonModules.kubernetesOps.helmOps import HelmOps
 from abstrakt.pythonModules.customLogging.customLogging import CustomLogger
 from abstrakt.pythonModules.vendors.cloudServiceProviders.aws.awsCli.awsOps import AWSOps
@@ -16,17 +16,6 @@ uk_time = datetime.now(uk_timezone)
 uk_time_str = uk_time.strftime('%d%m%Y')
 
 
-def delete_string_file(logger):
-  string_file = './abstrakt/conf/aws/eks/string.txt'
-
-  if os.path.exists(string_file):
-    try:
-      os.remove(string_file)
-      logger.info(f"The file '{string_file}' has been deleted successfully.")
-    except Exception as e:
-      logger.error(f"Error occurred while trying to delete the file: {e}")
-
-
 delete_aws_app = typer.Typer()
 
 
@@ -36,6 +25,11 @@ def eks_managed_node(
                                        show_default=False)] = None,
   region: Annotated[str, typer.Option('--region', help='Cluster Region or Zone', rich_help_panel='AWS Options',
                                       show_default=False)] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None,
 ):
   # TODO: Include cluster name and region as runtime parameters and run Kubeconfig update
   eks_managed_node_log_filename = f'/var/log/crowdstrike/aws/eks-managed-node-{uk_time_str}.log'
@@ -83,11 +77,16 @@ def eks_managed_node(
 
   print('\nDeleting EKS Managed Node Cluster...')
 
-  tf = ExecuteTerraform(logger=managed_node_logger)
+  tf = ExecuteTerraform(logger=managed_node_logger, parallelism=tf_parallelism)
+
+  module_path = './abstrakt/terraformModules/aws/eks/eks-managed-node/'
+  workspace = TerraformWorkspace.find(logger=managed_node_logger, module_path=module_path, name=cluster)
+
+  if tf.execute_terraform_destroy(path=module_path, workspace=workspace):
+    if workspace:
+      workspace.remove()
 
-  if tf.execute_terraform_destroy('./abstrakt/terraformModules/aws/eks/eks-managed-node/'):
     print('EKS Managed Node cluster successfully deleted\n')
-    delete_string_file(logger=managed_node_logger)
   else:
     print('The program failed to delete EKS Managed Node cluster. Exiting the program.\n')
     exit()
@@ -99,6 +98,11 @@ def eks_fargate(
                                        show_default=False)] = None,
   region: Annotated[str, typer.Option('--region', help='Cluster Region or Zone', rich_help_panel='AWS Options',
                                       show_default=False)] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None,
 ):
   eks_fargate_log_filename = f'/var/log/crowdstrike/aws/eks-fargate-{uk_time_str}.log'
   eks_fargate_logger = CustomLogger('eks_fargate', eks_fargate_log_filename).logger
@@ -145,11 +149,16 @@ def eks_fargate(
 
   print('\nDeleting EKS Fargate Cluster...')
 
-  tf = ExecuteTerraform(logger=eks_fargate_logger)
+  tf = ExecuteTerraform(logger=eks_fargate_logger, parallelism=tf_parallelism)
+
+  module_path = './abstrakt/terraformModules/aws/eks/eks-fargate/'
+  workspace = TerraformWorkspace.find(logger=eks_fargate_logger, module_path=module_path, name=cluster)
+
+  if tf.execute_terraform_destroy(path=module_path, workspace=workspace):
+    if workspace:
+      workspace.remove()
 
-  if tf.execute_terraform_destroy('./abstrakt/terraformModules/aws/eks/eks-fargate/'):
     print('EKS Fargate cluster successfully deleted\n')
-    delete_string_file(logger=eks_fargate_logger)
   else:
     print('The program failed to delete EKS Fargate cluster. Exiting the program.\n')
     exit()
@@ -174,7 +183,6 @@ def ecs_fargate():
 
   if tf.execute_terraform_destroy('./abstrakt/terraformModules/aws/ecs/fargate/'):
     print('ECS Fargate cluster successfully deleted\n')
-    delete_string_file(logger=ecs_fargate_logger)
   else:
     print('The program failed to delete ECS Fargate cluster. Exiting the program.\n')
     exit()
@@ -199,7 +207,6 @@ def ecs_ec2():
 
   if tf.execute_terraform_destroy('./abstrakt/terraformModules/aws/ecs/ec2/'):
     print('ECS EC2 cluster successfully deleted\n')
-    delete_string_file(logger=ecs_ec2_logger)
   else:
     print('The program failed to delete ECS Fargate cluster. Exiting the program.\n')
     exit()
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing_extensions import Annotated
 
 from abstrakt.pythonModules.terraformOps.executeTerraform import ExecuteTerraform
+from abstrakt.pythonModules.terraformOps.terraformWorkspace import TerraformWorkspace
 from abstrakt.pythonModules.kubernetesOps.helmOps import HelmOps
 from abstrakt.pythonModules.customLogging.customLogging import CustomLogger
 from abstrakt.pythonModules.vendors.cloudServiceProviders.azure.azOps.azOps import AZOps
@@ -27,6 +28,11 @@ def aks(
                                               help='Azure Resource Group Name',
                                               rich_help_panel='Azure Options',
                                               show_default=False)] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None,
 ):
   aks_log_filename = f'/var/log/crowdstrike/azure/aks-{uk_time_str}.log'
   aks_logger = CustomLogger('aks', aks_log_filename).logger
@@ -72,9 +78,15 @@ def aks(
 
   print('\nDeleting AKS Cluster...')
 
-  tf = ExecuteTerraform(logger=aks_logger)
+  tf = ExecuteTerraform(logger=aks_logger, parallelism=tf_parallelism)
+
+  module_path = './abstrakt/terraformModules/azure/aks/'
+  workspace = TerraformWorkspace.find(logger=aks_logger, module_path=module_path, name=cluster)
+
+  if tf.execute_terraform_destroy(path=module_path, workspace=workspace):
+    if workspace:
+      workspace.remove()
 
-  if tf.execute_terraform_destroy(path='./abstrakt/terraformModules/azure/aks/'):
     print('AKS cluster successfully deleted\n')
   else:
     print('The program failed to delete AKS cluster. Exiting the program.\n')
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing_extensions import Annotated
 
 from abstrakt.pythonModules.terraformOps.executeTerraform import ExecuteTerraform
+from abstrakt.pythonModules.terraformOps.terraformWorkspace import TerraformWorkspace
 from abstrakt.pythonModules.kubernetesOps.helmOps import HelmOps
 from abstrakt.pythonModules.customLogging.customLogging import CustomLogger
 from abstrakt.pythonModules.vendors.cloudServiceProviders.gcp.gcpOps import GCPOps
@@ -25,6 +26,11 @@ def gke_standard(
                                       show_default=False)] = None,
   project_id: Annotated[str, typer.Option('--project-id', help='GCP Project Name', rich_help_panel='GCP Options',
                                           show_default=False)] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None,
 ):
   gke_standard_log_filename = f'/var/log/crowdstrike/gcp/gke-standard-{uk_time_str}.log'
   gke_standard_logger = CustomLogger('gke-standard', gke_standard_log_filename).logger
@@ -71,9 +77,15 @@ def gke_standard(
 
   print('\nDeleting GKE Standard Cluster...')
 
-  tf = ExecuteTerraform(logger=gke_standard_logger)
+  tf = ExecuteTerraform(logger=gke_standard_logger, parallelism=tf_parallelism)
+
+  module_path = './abstrakt/terraformModules/gcp/gke/standard/'
+  workspace = TerraformWorkspace.find(logger=gke_standard_logger, module_path=module_path, name=cluster)
+
+  if tf.execute_terraform_destroy(path=module_path, workspace=workspace):
+    if workspace:
+      workspace.remove()
 
-  if tf.execute_terraform_destroy(path='./abstrakt/terraformModules/gcp/gke/standard/'):
     print('GKE Standard cluster successfully deleted\n')
   else:
     print('The program failed to delete GKE Standard cluster. Exiting the program.\n')
@@ -88,6 +100,11 @@ def gke_autopilot(
                                       show_default=False)] = None,
   project_id: Annotated[str, typer.Option('--project-id', help='GCP Project Name', rich_help_panel='GCP Options',
                                           show_default=False)] = None,
+  tf_parallelism: Annotated[str, typer.Option('--tf-parallelism',
+                                              help='Terraform Operations to Run Concurrently | Number or auto | '
+                                                   'Defaults to 10',
+                                              show_default=False,
+                                              rich_help_panel='Terraform Options')] = None,
 ):
   gke_autopilot_log_filename = f'/var/log/crowdstrike/gcp/gke-autopilot-{uk_time_str}.log'
   gke_autopilot_logger = CustomLogger('gke-autopilot', gke_autopilot_log_filename).logger
@@ -134,9 +151,15 @@ def gke_autopilot(
 
   print('\nDeleting GKE Autopilot Cluster...')
 
-  tf = ExecuteTerraform(logger=gke_autopilot_logger)
+  tf = ExecuteTerraform(logger=gke_autopilot_logger, parallelism=tf_parallelism)
+
+  module_path = './abstrakt/terraformModules/gcp/gke/autopilot/'
+  workspace = TerraformWorkspace.find(logger=gke_autopilot_logger, module_path=module_path, name=cluster)
+
+  if tf.execute_terraform_destroy(path=module_path, workspace=workspace):
+    if workspace:
+      workspace.remove()
 
-  if tf.execute_terraform_destroy(path='./abstrakt/terraformModules/gcp/gke/autopilot/'):
     print('GKE Autopilot cluster successfully deleted\n')
   else:
     print('The program failed to delete GKE Autopilot cluster. Exiting the program.\n')
@@ -1,4 +1,5 @@
 import typer
+from abstrakt.pythonModules.commandLine.layer_one.cache import cache_app
 from abstrakt.pythonModules.commandLine.layer_one.create import app as create_app
 from abstrakt.pythonModules.commandLine.layer_one.delete import app as delete_app
 from abstrakt.pythonModules.commandLine.layer_one.install import install_sensor_app
@@ -17,6 +18,7 @@ class InfrastructureManager:
                            rich_help_panel='Operations')
         self.app.add_typer(uninstall_sensor_app, name="uninstall", help='Uninstall Runtime Agents and Sensors',
                            rich_help_panel='Operations')
+        self.app.add_typer(cache_app, name="cache", help='Manage Local Caches', rich_help_panel='Operations')
         # self.app.add_typer(upgrade_sensor_app, name="upgrade", help='Upgrade Runtime Agents and Sensors',
         #                    rich_help_panel='Operations')
 
@@ -9,7 +9,8 @@ log_dirs = ['/var/log/',
             '/var/log/crowdstrike/aws/',
             '/var/log/crowdstrike/azure',
             '/var/log/crowdstrike/gcp/',
-            '/var/log/crowdstrike/sensors']
+            '/var/log/crowdstrike/sensors',
+            '/var/log/crowdstrike/fleet']
 
 for log_dir in log_dirs:
     if not os.path.exists(log_dir):
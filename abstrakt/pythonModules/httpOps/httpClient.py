@@ -0,0 +1,89 @@
+import os
+import threading
+
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient:
+  """
+  Shared HTTP client for the Falcon API and CrowdStrike registry calls.
+
+  Every HttpClient in a process uses the same requests.Session. That session keeps TLS connections alive
+  in per-host connection pools, applies default connect and read timeouts, and retries idempotent requests
+  (GET and HEAD) on connection errors, 429 and 5xx responses with exponential backoff and jitter. A new
+  session is created after a fork, so child processes never share sockets with their parent.
+  """
+
+  # (connect, read) timeouts in seconds applied when the caller passes none
+  default_timeout: tuple[int, int] = (10, 60)
+
+  pool_connections: int = 10
+  pool_maxsize: int = 20
+
+  retry_total: int = 5
+  retry_backoff_factor: float = 0.5
+  retry_backoff_jitter: float = 0.5
+  retry_status_codes: tuple = (429, 500, 502, 503, 504)
+  retry_methods: frozenset = frozenset(['GET', 'HEAD'])
+
+  _sessions: dict[int, requests.Session] = {}
+  _sessions_lock = threading.Lock()
+
+  def __init__(self, logger=None):
+    self.logger = logger
+
+  @classmethod
+  def get_retry_policy(cls) -> Retry:
+    retry_options: dict = {
+      'total': cls.retry_total,
+      'backoff_factor': cls.retry_backoff_factor,
+      'status_forcelist': cls.retry_status_codes,
+      'allowed_methods': cls.retry_methods,
+      'respect_retry_after_header': True,
+      'raise_on_status': False,
+    }
+
+    try:
+      return Retry(backoff_jitter=cls.retry_backoff_jitter, **retry_options)
+    except TypeError:
+      # urllib3 < 2.0 has no jitter support
+      return Retry(**retry_options)
+
+  @classmethod
+  def get_session(cls) -> requests.Session:
+    pid: int = os.getpid()
+
+    with cls._sessions_lock:
+      session: requests.Session | None = cls._sessions.get(pid)
+
+      if session is None:
+        session = requests.Session()
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=cls.pool_connections,
+                                           pool_maxsize=cls.pool_maxsize,
+                                           max_retries=cls.get_retry_policy())
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        cls._sessions[pid] = session
+
+      return session
+
+  def request(self, method: str, url: str, **kwargs) -> Response:
+    kwargs.setdefault('timeout', self.default_timeout)
+
+    if self.logger:
+      self.logger.debug(f'{method} {url}')
+
+    return self.get_session().request(method, url, **kwargs)
+
+  def get(self, url: str, **kwargs) -> Response:
+    return self.request('GET', url, **kwargs)
+
+  def head(self, url: str, **kwargs) -> Response:
+    return self.request('HEAD', url, **kwargs)
+
+  def post(self, url: str, **kwargs) -> Response:
+    return self.request('POST', url, **kwargs)
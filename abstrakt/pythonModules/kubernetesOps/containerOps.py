@@ -1,62 +1,36 @@
-import subprocess
-
-from time import sleep
 from kubernetes import client, config
 from kubernetes.client import ApiException
 
 from abstrakt.pythonModules.multiProcess.multiProcessing import MultiProcessing
+from abstrakt.pythonModules.kubernetesOps.kubeClientFactory import KubeClientFactory
+from abstrakt.pythonModules.kubernetesOps.podReadinessWaiter import PodReadinessWaiter
+from abstrakt.pythonModules.kubernetesOps.rolloutTracker import RolloutTracker
 
 
 class ContainerOps:
-  def __init__(self, logger):
+  def __init__(self, logger, kube_client_factory: KubeClientFactory | None = None):
     self.logger = logger
+    self.kube_client_factory = kube_client_factory or KubeClientFactory(logger=logger)
+    self.pod_readiness_waiter = PodReadinessWaiter(logger=logger, kube_client_factory=self.kube_client_factory)
+    self.rollout_tracker = RolloutTracker(logger=logger, kube_client_factory=self.kube_client_factory)
 
-  def get_running_container_name(self, container_name, container_namespace='default', logger=None):
+  def get_running_container_name(self, container_name, container_namespace='default', label_selector=None,
+                                 logger=None):
     logger = logger or self.logger
 
     try:
-      sensors = []
-
-      # Run the kubectl command to get pod names in the specified namespace
-      cmd = (f"kubectl get pods -n {container_namespace} -o custom-columns=NAME:.metadata.name,"
-             f"CONTAINERS:.spec.containers[*].name,STATUS:.status.phase --no-headers=true")
-
-      self.logger.info(f'Executing command: {cmd}')
-
-      output = subprocess.check_output(cmd, shell=True, stderr=subprocess.PIPE, text=True)
-
-      # Split the output into lines
-      lines = output.strip().split('\n')
-
-      # Iterate through the lines and find the running container with a name
-      for line in lines:
-        parts = line.split()
-        pod_name = parts[0]
-
-        if container_name in pod_name:
-          cmd = (f"kubectl get pod {pod_name} -n {container_namespace} -o custom-columns=NAME:.metadata.name,"
-                 f"CONTAINERS:.spec.containers[*].name,STATUS:.status.phase --no-headers=true")
-
-          self.logger.info(f'Executing command: {cmd}')
-
-          counter = 0
+      # wait for every matching pod on one watch instead of polling kubectl per pod
+      pods, down = self.pod_readiness_waiter.wait_for_pods(namespace=container_namespace,
+                                                           label_selector=label_selector,
+                                                           name_filter=container_name,
+                                                           timeout=300,
+                                                           logger=logger)
 
-          while counter < 60:
-            output = subprocess.check_output(cmd, shell=True, stderr=subprocess.PIPE, text=True).split()
+      sensors = [pod for pod, status in pods.items() if status['podStatus'] == 'Running']
 
-            self.logger.info(output)
-
-            if output[-1] == 'Running':
-              sensors.append(output[0])
-              break
-            else:
-              counter += 1
-              sleep(5)
-      else:
-        return sensors if sensors else 'None'
-    except subprocess.CalledProcessError as e:
-      # Handle any errors that occur when running the kubectl command
-      logger.error(f"Error running kubectl: {e}")
+      return sensors if sensors else 'None'
+    except ApiException as e:
+      logger.error(f"Error listing pods: {e}")
       return 'None'
 
   def check_namespace_exists(self, namespace, kubeconfig_path: str = '~/.kube/config', logger=None):
@@ -73,8 +47,7 @@ class ContainerOps:
     logger = logger or self.logger
 
     try:
-      config.load_kube_config(config_file=kubeconfig_path)
-      v1 = client.CoreV1Api()
+      v1 = self.kube_client_factory.core_v1(kubeconfig_path=kubeconfig_path)
       v1.read_namespace(namespace)  # Raises exception if not found
 
       return True
@@ -84,6 +57,7 @@ class ContainerOps:
 
   def are_pods_and_containers_running(self, pod_name: str, namespace: str,
                                       kubeconfig_path: str = '~/.kube/config',
+                                      label_selector: str | None = None,
                                       logger=None) -> tuple[dict, int]:
     """
       Check if pods with a given name substring are running in a Kubernetes namespace.
@@ -92,6 +66,7 @@ class ContainerOps:
           pod_name (str): Substring to match in pod names.
           namespace (str): The Kubernetes namespace to search for pods.
           kubeconfig_path (str): Path to the Kubernetes configuration file.
+          label_selector (str): Label selector of the pods, so only matching pods are listed and watched.
           logger: Logger object
 
       Returns:
@@ -103,110 +78,14 @@ class ContainerOps:
 
     if self.check_namespace_exists(namespace=namespace, kubeconfig_path=kubeconfig_path, logger=logger):
       try:
-        # Load Kubernetes configuration
-        config.load_kube_config(config_file=kubeconfig_path)
-        v1 = client.CoreV1Api()
-
-        # Initialize variables
-        pods: dict = {}
-        down: int = 0
-
-        # Get pods in the specified namespace
-        pod_list = v1.list_namespaced_pod(namespace)
-
-        for pod in pod_list.items:
-          if pod_name in pod.metadata.name:  # Check for pod name substring match
-            while True:
-              pod_status = v1.read_namespaced_pod_status(name=pod.metadata.name, namespace=namespace)
-
-              # Check if the pod phase is 'Running'
-              if pod_status.status.phase == 'Running':
-                pods[pod.metadata.name] = {'podStatus': 'Running'}
-
-                # Check if all containers within the pod are running
-                for container_status in pod_status.status.container_statuses:
-                  pods[pod.metadata.name]['containerName'] = container_status.name
-                  pods[pod.metadata.name]['containerStatus'] = container_status.state.running
-                break
-              elif pod_status.status.phase == 'ContainerCreating':
-                continue
-              elif pod_status.status.phase == 'Pending':
-                if (pod_status.status and pod_status.status.init_container_statuses and len(
-                  pod_status.status.init_container_statuses) > 0 and
-                  pod_status.status.init_container_statuses[0].state and
-                  pod_status.status.init_container_statuses[0].state.waiting and
-                  pod_status.status.init_container_statuses[0].state.waiting.reason):
-
-                  if pod_status.status.init_container_statuses[0].state.waiting.reason == 'ErrImagePull':
-                    pods[pod.metadata.name] = {'podStatus': 'ErrImagePull'}
-                    down += 1
-                    break
-                  elif pod_status.status.init_container_statuses[0].state.waiting.reason == 'CrashLoopBackOff':
-                    pods[pod.metadata.name] = {'podStatus': 'CrashLoopBackOff'}
-                    down += 1
-                    break
-                  elif pod_status.status.init_container_statuses[0].state.waiting.reason == 'ImagePullBackOff':
-                    pods[pod.metadata.name] = {'podStatus': 'ImagePullBackOff'}
-                    down += 1
-                    break
-                  elif pod_status.status.init_container_statuses[0].state.waiting.reason == 'Failed':
-                    pods[pod.metadata.name] = {'podStatus': 'Failed'}
-                    down += 1
-                    break
-                  else:
-                    continue
-                elif (pod_status.status and pod_status.status.container_statuses and len(
-                  pod_status.status.container_statuses) > 0 and
-                      pod_status.status.container_statuses[0].state and
-                      pod_status.status.container_statuses[0].state.waiting and
-                      pod_status.status.container_statuses[0].state.waiting.reason):
-
-                  if pod_status.status.container_statuses[0].state.waiting.reason == 'ErrImagePull':
-                    pods[pod.metadata.name] = {'podStatus': 'ErrImagePull'}
-                    down += 1
-                    break
-                  elif pod_status.status.container_statuses[0].state.waiting.reason == 'CrashLoopBackOff':
-                    pods[pod.metadata.name] = {'podStatus': 'CrashLoopBackOff'}
-                    down += 1
-                    break
-                  elif pod_status.status.container_statuses[0].state.waiting.reason == 'ImagePullBackOff':
-                    pods[pod.metadata.name] = {'podStatus': 'ImagePullBackOff'}
-                    down += 1
-                    break
-                  elif pod_status.status.container_statuses[0].state.waiting.reason == 'Failed':
-                    pods[pod.metadata.name] = {'podStatus': 'Failed'}
-                    down += 1
-                    break
-                  else:
-                    continue
-                else:
-                  continue
-              elif pod_status.status.phase == 'Failed':
-                pods[pod.metadata.name] = {'podStatus': 'Failed'}
-                down += 1
-                break
-              elif pod_status.status.phase == 'Unknown':
-                pods[pod.metadata.name] = {'podStatus': 'Unknown'}
-                down += 1
-                break
-              elif pod_status.status.phase == 'CrashLoopBackOff':
-                pods[pod.metadata.name] = {'podStatus': 'CrashLoopBackOff'}
-                down += 1
-                break
-              elif pod_status.status.phase == 'ImagePullBackOff':
-                pods[pod.metadata.name] = {'podStatus': 'ImagePullBackOff'}
-                down += 1
-                break
-              elif pod_status.status.phase == 'ErrImagePull':
-                pods[pod.metadata.name] = {'podStatus': 'ErrImagePull'}
-                down += 1
-                break
-              else:
-                pods[pod.metadata.name] = {'podStatus': 'Undefined'}
-                down += 1
-                break
-
-        return pods, down
+        # a single watch tracks every matching pod until all are running or have failed
+        # stays inside the 600 second limit pod_checker puts on this call
+        return self.pod_readiness_waiter.wait_for_pods(namespace=namespace,
+                                                       label_selector=label_selector,
+                                                       name_filter=pod_name,
+                                                       timeout=570,
+                                                       kubeconfig_path=kubeconfig_path,
+                                                       logger=logger)
       except Exception as e:
         logger.error(f"Exception when calling CoreV1Api: {e}")
         return {}, -1  # Return an error code
@@ -214,26 +93,44 @@ class ContainerOps:
       logger.error(f'Namespace {namespace} does not exist\n')
       return {}, -1  # Return an error code
 
-  def pod_checker(self, pod_name: str, namespace: str, kubeconfig_path: str = '~/.kube/config', logger=None) -> list:
+  def pod_checker(self, pod_name: str, namespace: str, kubeconfig_path: str = '~/.kube/config',
+                  label_selector: str | None = None, logger=None) -> list:
     logger = logger or self.logger
 
     try:
       print(f"Checking {pod_name} status...")
-      sleep(5)
       pod_names: list = []
 
       pods: dict
       down: int
 
+      # follow the DaemonSet/Deployment status first, pods are only listed once it has rolled out
+      rollout_complete: bool | None = None
+
+      if label_selector:
+        rollout_complete = self.rollout_tracker.wait_for_rollouts(namespace=namespace,
+                                                                  label_selector=label_selector,
+                                                                  timeout=600,
+                                                                  kubeconfig_path=kubeconfig_path,
+                                                                  logger=logger)
+
       try:
-        with MultiProcessing() as mp:
-          pods, down = mp.execute_with_progress_indicator(self.are_pods_and_containers_running,
-                                                          self.logger,
-                                                          0.5,
-                                                          600,
-                                                          pod_name,
-                                                          namespace,
-                                                          kubeconfig_path)
+        if rollout_complete is not None:
+          pods, down = self.pod_readiness_waiter.get_pod_statuses(namespace=namespace,
+                                                                  label_selector=label_selector,
+                                                                  name_filter=pod_name,
+                                                                  kubeconfig_path=kubeconfig_path,
+                                                                  logger=logger)
+        else:
+          with MultiProcessing() as mp:
+            pods, down = mp.execute_with_progress_indicator(self.are_pods_and_containers_running,
+                                                            self.logger,
+                                                            0.5,
+                                                            600,
+                                                            pod_name,
+                                                            namespace,
+                                                            kubeconfig_path,
+                                                            label_selector)
       except Exception as e:
         self.logger.error(f'Error: {e}')
         pods = {}
@@ -264,8 +161,7 @@ class ContainerOps:
     logger = logger or self.logger
 
     try:
-      config.load_kube_config(config_file=kubeconfig_path)
-      v1 = client.CoreV1Api()
+      v1 = self.kube_client_factory.core_v1(kubeconfig_path=kubeconfig_path)
     except config.config_exception.ConfigException:
       print("Error: Could not load configuration from ~/.kube/config.")
       return False
@@ -307,21 +203,17 @@ class ContainerOps:
       print(f"Error retrieving service information: {e}")
       return False
 
-  def list_pods_in_namespace(self, namespace, logger=None) -> list | None:
+  def list_pods_in_namespace(self, namespace, label_selector=None, field_selector=None, logger=None) -> list | None:
     logger = logger or self.logger
 
-    # Load Kubernetes configuration from the default location (~/.kube/config)
-    config.load_kube_config()
-
-    # Create a client for the CoreV1 API
-    v1 = client.CoreV1Api()
-
     try:
-      # List all the pods in the specified namespace
-      pod_list = v1.list_namespaced_pod(namespace)
+      # List the matching pods in the specified namespace, page by page
+      pod_list, _ = self.kube_client_factory.list_namespaced_pods(namespace=namespace,
+                                                                  label_selector=label_selector,
+                                                                  field_selector=field_selector)
 
       # Extract the names of the pods and return them as a list
-      pod_names = [pod.metadata.name for pod in pod_list.items]
+      pod_names = [pod.metadata.name for pod in pod_list]
       return pod_names
 
     except Exception as e:
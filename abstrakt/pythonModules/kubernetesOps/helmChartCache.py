@@ -0,0 +1,284 @@
+import os
+import re
+import json
+import fcntl
+import shutil
+import typing
+import inspect
+import contextlib
+import tempfile
+import threading
+import subprocess
+
+
+class HelmChartCache:
+  """
+  Local store of helm chart archives, one .tgz per chart and version.
+
+  Each chart version is pulled once into $XDG_CACHE_HOME/abstrakt/charts (or ~/.cache/abstrakt/charts) and
+  installed from the local file, so repeated installs download no chart and every cluster of a fleet gets the
+  same chart. A version can be pinned per chart; unpinned charts resolve to the newest version of the local
+  repository index. Archives are listed by last use, and prune removes all but the most recently used versions.
+  """
+
+  download_suffix: str = '.download'
+
+  # chart names may contain dashes and so may versions (1.2.0-rc1), the version starts at the first number.number
+  archive_name_pattern = re.compile(r'^(?P<chart>.+?)-(?P<version>v?\d+\.\d+.*)\.tgz$')
+
+  _pinned_versions: dict[str, str] = {}
+  _chart_paths: dict[tuple[str, str | None], str] = {}
+  _archive_locks: dict[str, typing.TextIO] = {}
+  _lock = threading.Lock()
+
+  def __init__(self, logger, cache_dir: str | None = None):
+    self.logger = logger
+
+    self.cache_dir: str = cache_dir or os.path.join(
+      os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'abstrakt', 'charts')
+
+  @classmethod
+  def pin_versions(cls, versions: dict[str, str]):
+    # charts installed by installers forked after this call use the pinned versions
+    with cls._lock:
+      cls._pinned_versions.update({chart: version for chart, version in versions.items() if version})
+
+  def get_archive_path(self, chart: str, version: str) -> str:
+    repo_name, _, chart_name = chart.partition('/')
+
+    return os.path.join(self.cache_dir, repo_name, f'{chart_name}-{version}.tgz')
+
+  def get_latest_version(self, chart: str, logger=None) -> str | None:
+    logger = logger or self.logger
+
+    # reads the local repository index only, it is kept fresh by HelmRepoManager
+    process = subprocess.run(['helm', 'search', 'repo', chart, '-o', 'json'], stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, text=True)
+
+    if process.returncode != 0:
+      logger.error(process.stderr)
+      return None
+
+    return next((entry['version'] for entry in json.loads(process.stdout or '[]') if entry['name'] == chart), None)
+
+  def pull_chart(self, chart: str, version: str, logger=None) -> str | None:
+    """
+    Pulls one chart version into the cache unless it is already there.
+
+    The archive stays share-locked until this process exits, forked installers included, so that prune leaves
+    it alone while helm installs from it.
+
+    Returns:
+        str | None: Path of the chart archive, or None if it could not be pulled.
+    """
+    logger = logger or self.logger
+
+    archive_path: str = self.get_archive_path(chart=chart, version=version)
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+
+    with self._lock:
+      if archive_path in self._archive_locks and os.path.exists(archive_path):
+        os.utime(archive_path)
+        return archive_path
+
+      lock_file = open(f'{archive_path}.lock', 'a')
+
+      try:
+        while True:
+          # guards concurrent abstrakt runs pulling the same chart version
+          fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+          if os.path.exists(archive_path):
+            logger.info(f'Using cached chart {archive_path}')
+            os.utime(archive_path)
+          elif not self.download_chart(chart=chart, version=version, archive_path=archive_path, logger=logger):
+            lock_file.close()
+            return None
+
+          fcntl.flock(lock_file, fcntl.LOCK_SH)
+
+          # a prune can slip in while the lock is converted, in which case the chart is pulled again
+          if os.path.exists(archive_path):
+            break
+      except Exception:
+        lock_file.close()
+        raise
+
+      self._archive_locks[archive_path] = lock_file
+
+      return archive_path
+
+  def download_chart(self, chart: str, version: str, archive_path: str, logger=None) -> bool:
+    logger = logger or self.logger
+
+    # named after the archive, so prune can tell from its lock whether the pull is still running
+    download_dir: str = tempfile.mkdtemp(prefix=f'{os.path.basename(archive_path)}.', suffix=self.download_suffix,
+                                         dir=os.path.dirname(archive_path))
+
+    try:
+      logger.info(f'Caching chart {chart} {version} in {archive_path}')
+      process = subprocess.run(['helm', 'pull', chart, '--version', version, '--destination', download_dir],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+      if process.returncode != 0:
+        logger.error(process.stderr)
+        return False
+
+      archives: list = [file for file in os.listdir(download_dir) if file.endswith('.tgz')]
+
+      if not archives:
+        return False
+
+      os.replace(os.path.join(download_dir, archives[0]), archive_path)
+
+      with open(f'{archive_path}.json', 'w') as metadata_file:
+        json.dump({'chart': chart, 'version': version}, metadata_file)
+
+      return True
+    finally:
+      shutil.rmtree(download_dir, ignore_errors=True)
+
+  def cache_chart(self, chart: str, version: str | None = None, logger=None) -> str | None:
+    """
+    Returns the local archive of a chart, pulling it on first use.
+
+    Args:
+        chart (str): Chart reference, e.g. 'crowdstrike/falcon-sensor'.
+        version (str): Chart version. Defaults to the pinned version, then to the newest version in the index.
+        logger: Logger object
+
+    Returns:
+        str | None: Path of the chart archive, or None if the chart could not be cached.
+    """
+    logger = logger or self.logger
+
+    version = version or self._pinned_versions.get(chart)
+    key: tuple[str, str | None] = (chart, version)
+
+    if key in self._chart_paths and os.path.exists(self._chart_paths[key]):
+      return self._chart_paths[key]
+
+    try:
+      resolved_version: str | None = version or self.get_latest_version(chart=chart, logger=logger)
+
+      if not resolved_version:
+        logger.error(f'No version of chart {chart} found in the local repository index')
+        return None
+
+      archive_path: str | None = self.pull_chart(chart=chart, version=resolved_version, logger=logger)
+
+      if archive_path:
+        with self._lock:
+          self._chart_paths[key] = archive_path
+
+      return archive_path
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  def get_chart(self, chart: str, logger=None) -> str:
+    """
+    Returns what to pass to 'helm upgrade --install' for a chart: its cached archive, or the chart reference
+    itself if the chart could not be cached.
+    """
+    logger = logger or self.logger
+
+    archive_path: str | None = self.cache_chart(chart=chart, logger=logger)
+
+    if archive_path:
+      return archive_path
+
+    logger.info(f'Installing chart {chart} from its remote repository')
+
+    return chart
+
+  def get_archive_chart(self, archive_path: str) -> str:
+    # recorded when the chart was cached, archives cached before that are parsed by their name
+    try:
+      with open(f'{archive_path}.json', 'r') as metadata_file:
+        return json.load(metadata_file)['chart']
+    except (OSError, ValueError, KeyError):
+      match = self.archive_name_pattern.match(os.path.basename(archive_path))
+
+      return match.group('chart') if match else os.path.basename(archive_path)[:-len('.tgz')]
+
+  @staticmethod
+  @contextlib.contextmanager
+  def try_lock(archive_path: str):
+    """
+    Takes the lock of an archive without waiting, yields False while another process holds it.
+    """
+    with open(f'{archive_path}.lock', 'a') as lock_file:
+      try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+      except BlockingIOError:
+        yield False
+        return
+
+      yield True
+
+  def remove_archive(self, archive_path: str):
+    # the lock file stays, a process that opened it before the removal would otherwise lock a file no one else sees
+    for path in (archive_path, f'{archive_path}.json'):
+      if os.path.exists(path):
+        os.remove(path)
+
+  def prune(self, keep: int = 1, logger=None) -> list[str]:
+    """
+    Removes all but the keep most recently used versions of every cached chart. Archives that are being pulled,
+    or that a running abstrakt installs from, are left alone.
+
+    Args:
+        keep (int): Versions to keep per chart. 0 empties the cache.
+        logger: Logger object
+
+    Returns:
+        list[str]: Paths of the removed archives.
+    """
+    logger = logger or self.logger
+
+    removed: list[str] = []
+
+    try:
+      if not os.path.isdir(self.cache_dir):
+        return removed
+
+      for repo_name in os.listdir(self.cache_dir):
+        repo_dir: str = os.path.join(self.cache_dir, repo_name)
+
+        if not os.path.isdir(repo_dir):
+          continue
+
+        charts: dict[str, list] = {}
+
+        for file in os.listdir(repo_dir):
+          path: str = os.path.join(repo_dir, file)
+
+          if os.path.isdir(path) and file.endswith(self.download_suffix):
+            # <archive>.<random>.download, left behind by an interrupted pull unless its pull still holds the lock
+            archive_path: str = os.path.join(repo_dir, file[:-len(self.download_suffix)].rsplit('.', 1)[0])
+
+            with self.try_lock(archive_path) as locked:
+              if locked:
+                shutil.rmtree(path, ignore_errors=True)
+          elif file.endswith('.tgz'):
+            charts.setdefault(self.get_archive_chart(archive_path=path), []).append((os.path.getmtime(path), path))
+
+        for archives in charts.values():
+          for _, path in sorted(archives, reverse=True)[keep:]:
+            with self.try_lock(path) as locked:
+              if not locked:
+                logger.info(f'Not pruning {path}, it is in use')
+                continue
+
+              logger.info(f'Pruning {path} from chart cache')
+              self.remove_archive(archive_path=path)
+
+            removed.append(path)
+
+      return removed
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return removed
@@ -1,10 +1,17 @@
+import os
+import json
+import base64
+import shlex
+import inspect
 import subprocess
-from kubernetes import client, config
+
+from abstrakt.pythonModules.kubernetesOps.helmReleaseIndex import HelmReleaseIndex
 
 
 class HelmOps:
   def __init__(self, logger):
     self.logger = logger
+    self.release_index = HelmReleaseIndex(logger=logger)
 
   def run_helm_delete(self, release_name, namespace):
     try:
@@ -16,27 +23,280 @@ class HelmOps:
       if process.stderr:
         self.logger.info(process.stderr)
 
+      self.release_index.record_delete(release_name=release_name, namespace=namespace)
+
       self.logger.info(f"Deleted Helm release {release_name} in namespace {namespace}")
     except subprocess.CalledProcessError as e:
       self.logger.info(f"Error deleting Helm release {release_name} in namespace {namespace}: {e}")
 
   def is_helm_chart_deployed(self, release_name, namespace="default"):
+    # answered from the release snapshot, which runs 'helm list -A' once per cluster
+    return self.release_index.is_deployed(release_name=release_name, namespace=namespace)
+
+  @staticmethod
+  def split_unescaped(text: str, separator: str) -> list[str]:
+    # helm treats a backslash as escaping the character that follows it, e.g. falcon.tags=a\,b or eks\.amazonaws\.com
+    parts: list[str] = ['']
+    escaped: bool = False
+
+    for character in text:
+      if escaped:
+        parts[-1] += character
+        escaped = False
+      elif character == '\\':
+        escaped = True
+      elif character == separator:
+        parts.append('')
+      else:
+        parts[-1] += character
+
+    return parts
+
+  @staticmethod
+  def get_typed_value(value: str):
+    # mirrors how 'helm --set' types a value, everything else stays a string
+    if value in ('true', 'false'):
+      return value == 'true'
+
+    if value == 'null':
+      return None
+
+    if value == '0' or (value.lstrip('-').isdigit() and not value.lstrip('-').startswith('0')):
+      return int(value)
+
+    return value
+
+  def parse_set_values(self, assignments: str, values: dict, typed: bool = True) -> bool:
+    """
+    Adds the key=value pairs of one --set argument to a nested values map.
+
+    Returns:
+        bool: False if the argument uses syntax that is not understood here, e.g. list indexes.
+    """
+    for assignment in self.split_unescaped(text=assignments.replace('\\.', '\0'), separator=','):
+      if '=' not in assignment:
+        return False
+
+      key, value = assignment.split('=', 1)
+
+      if '[' in key:
+        return False
+
+      path: list[str] = [part.replace('\0', '.') for part in key.split('.')]
+      value: str = value.replace('\0', '.')
+
+      target: dict = values
+      for part in path[:-1]:
+        if not isinstance(target.get(part), dict):
+          target[part] = {}
+        target = target[part]
+
+      target[path[-1]] = self.get_typed_value(value) if typed else value
+
+    return True
+
+  def parse_helm_command(self, command: str | list) -> dict | None:
+    """
+    Extracts the release, chart, namespace and --set values of a 'helm upgrade --install' command.
+
+    Args:
+        command (str | list): The command as run by the shell, or as a list of arguments.
+
+    Returns:
+        dict | None: {'release', 'chart', 'version', 'namespace', 'values'}, or None if the command is not a helm
+        upgrade or takes values from elsewhere (values files, --reuse-values, ...), in which case it can't be diffed.
+    """
+    if isinstance(command, str):
+      arguments: list[str] = shlex.split(command.replace('\\\n', ' '))
+    else:
+      arguments: list[str] = list(command)
+
+    if arguments[:2] != ['helm', 'upgrade']:
+      return None
+
+    value_flags: tuple = ('-n', '--namespace', '--set', '--set-string', '--version', '--timeout', '--kube-context',
+                          '--kubeconfig', '-f', '--values', '--set-file', '--set-json', '--description')
+    undiffable_flags: tuple = ('-f', '--values', '--set-file', '--set-json', '--reuse-values',
+                               '--reset-then-reuse-values')
+
+    positional: list[str] = []
+    namespace: str = 'default'
+    version: str | None = None
+    values: dict = {}
+
+    index: int = 2
+    while index < len(arguments):
+      argument: str = arguments[index]
+
+      if argument.startswith('-'):
+        flag, _, value = argument.partition('=')
+
+        if flag in value_flags and not _:
+          index += 1
+          value = arguments[index] if index < len(arguments) else ''
+
+        if flag in undiffable_flags:
+          return None
+        elif flag in ('-n', '--namespace'):
+          namespace = value
+        elif flag == '--version':
+          version = value
+        elif flag in ('--set', '--set-string'):
+          if not self.parse_set_values(assignments=value, values=values, typed=flag == '--set'):
+            return None
+      else:
+        positional.append(argument)
+
+      index += 1
+
+    if len(positional) != 2:
+      return None
+
+    return {'release': positional[0], 'chart': positional[1], 'version': version, 'namespace': namespace,
+            'values': values}
+
+  @staticmethod
+  def get_chart_version(chart: str, version: str | None = None) -> str | None:
+    """
+    Returns the chart as listed by 'helm list', e.g. falcon-sensor-1.25.0, if the command pins it.
+    """
+    if chart.endswith('.tgz'):
+      # archives from the local chart cache and 'helm pull' are named <chart>-<version>.tgz
+      return os.path.basename(chart)[:-len('.tgz')]
+
+    if version:
+      return f'{chart.split("/")[-1]}-{version}'
+
+    return None
+
+  def get_deployed_values(self, release_name: str, namespace: str, logger=None) -> dict | None:
+    logger = logger or self.logger
+
     try:
-        # Run the Helm command to list releases in the specified namespace
-        result = subprocess.run(
-            ["helm", "list", "-n", namespace, "--filter", release_name, "--output", "json"],
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-
-        # Parse the output
-        output = result.stdout.decode("utf-8")
-        if release_name in output:
-            return True
-        else:
-            return False
+      process = subprocess.run(['helm', 'get', 'values', release_name, '-n', namespace, '-o', 'json'],
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
 
+      return json.loads(process.stdout or 'null') or {}
     except subprocess.CalledProcessError as e:
-        self.logger.error(f"Error running Helm command: {e.stderr.decode('utf-8')}")
-        return False
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e.stderr}')
+      return None
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  def flatten_values(self, values: dict, prefix: tuple = ()) -> dict[tuple, object]:
+    flattened: dict[tuple, object] = {}
+
+    for key, value in values.items():
+      if isinstance(value, dict) and value:
+        flattened.update(self.flatten_values(values=value, prefix=prefix + (key,)))
+      else:
+        flattened[prefix + (key,)] = value
+
+    return flattened
+
+  @staticmethod
+  def format_value(path: tuple, value) -> str:
+    if any(secret in path[-1].lower() for secret in ('secret', 'token', 'password', 'registryconfigjson')):
+      return '********'
+
+    return json.dumps(value)
+
+  @staticmethod
+  def get_registry_hosts(registry_config_json) -> set[str] | None:
+    # registryConfigJSON is a base64 encoded docker config, {"auths": {"<registry>": {"auth": "<token>"}}}
+    try:
+      return set(json.loads(base64.b64decode(str(registry_config_json)))['auths'])
+    except (ValueError, TypeError, KeyError):
+      return None
+
+  def is_same_value(self, path: tuple, desired, deployed) -> bool:
+    """
+    Pull secrets are compared by the registries they authenticate with, not by their tokens, which are issued anew
+    on every run (ECR tokens are valid for 12 hours only). A rotated token alone therefore never upgrades a release.
+    """
+    if desired == deployed:
+      return True
+
+    if path[-1].lower() == 'registryconfigjson':
+      desired_hosts: set[str] | None = self.get_registry_hosts(desired)
+
+      return desired_hosts is not None and desired_hosts == self.get_registry_hosts(deployed)
+
+    return False
+
+  def diff_values(self, desired_values: dict, deployed_values: dict) -> list[str]:
+    """
+    Returns one line per value that differs, prefixed with + (added), - (removed) or ~ (changed).
+    """
+    desired: dict[tuple, object] = self.flatten_values(values=desired_values)
+    deployed: dict[tuple, object] = self.flatten_values(values=deployed_values)
+
+    diff: list[str] = []
+
+    for path in sorted(set(desired) | set(deployed)):
+      key: str = '.'.join(path)
+
+      if path not in deployed:
+        diff.append(f'+ {key}: {self.format_value(path, desired[path])}')
+      elif path not in desired:
+        diff.append(f'- {key}: {self.format_value(path, deployed[path])}')
+      elif not self.is_same_value(path=path, desired=desired[path], deployed=deployed[path]):
+        diff.append(f'~ {key}: {self.format_value(path, deployed[path])} -> {self.format_value(path, desired[path])}')
+
+    return diff
+
+  def is_upgrade_needed(self, command: str | list, logger=None) -> bool:
+    """
+    Compares a 'helm upgrade --install' command with the release already deployed and prints what would change.
+
+    The upgrade is needed unless the release is deployed with the same chart version and the same user-supplied
+    values, pull secrets for the same registries counting as the same. Commands that can't be diffed are always run.
+    """
+    logger = logger or self.logger
+
+    try:
+      desired: dict | None = self.parse_helm_command(command=command)
+
+      if desired is None:
+        return True
+
+      release_name: str = desired['release']
+      namespace: str = desired['namespace']
+
+      release: dict | None = self.release_index.get_release(release_name=release_name, namespace=namespace,
+                                                            logger=logger)
+
+      if not release or release.get('status') != 'deployed':
+        return True
+
+      chart_version: str | None = self.get_chart_version(chart=desired['chart'], version=desired['version'])
+
+      if chart_version and release.get('chart') and chart_version != release['chart']:
+        print(f"Helm release {release_name} chart: {release['chart']} -> {chart_version}")
+        return True
+
+      deployed_values: dict | None = self.get_deployed_values(release_name=release_name, namespace=namespace,
+                                                              logger=logger)
+
+      if deployed_values is None:
+        return True
+
+      diff: list[str] = self.diff_values(desired_values=desired['values'], deployed_values=deployed_values)
+
+      if diff:
+        print(f'Helm release {release_name} in namespace {namespace} will be upgraded:')
+        for line in diff:
+          print(f'  {line}')
+          logger.info(f'{release_name}: {line}')
+
+        return True
+
+      logger.info(f'Helm release {release_name} in namespace {namespace} is up to date')
+      return False
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return True
@@ -0,0 +1,97 @@
+import os
+import json
+import inspect
+import threading
+import subprocess
+
+from abstrakt.pythonModules.kubernetesOps.kubeClientFactory import KubeClientFactory
+
+
+class HelmReleaseIndex:
+  """
+  In-memory snapshot of the helm releases on the current cluster.
+
+  'helm list -A -o json' runs once, and every "is release X deployed in namespace Y" question is answered from
+  the snapshot. Installs and deletes made through abstrakt update the snapshot in place. The snapshot is taken
+  again when the kubeconfig file changes, i.e. when abstrakt switches to another cluster.
+  """
+
+  _releases: dict[tuple[str, str], dict] | None = None
+  _kubeconfig_state: tuple | None = None
+  _lock = threading.Lock()
+
+  def __init__(self, logger):
+    self.logger = logger
+
+  @staticmethod
+  def get_kubeconfig_state() -> tuple:
+    kubeconfig_path: str = KubeClientFactory().get_kubeconfig_path()
+    modified_time: float = os.path.getmtime(kubeconfig_path) if os.path.exists(kubeconfig_path) else 0
+
+    return kubeconfig_path, modified_time
+
+  def load(self, logger=None) -> dict[tuple[str, str], dict]:
+    """
+    Returns the release snapshot, running 'helm list' only if there is none for the current kubeconfig.
+
+    Returns:
+        dict: Maps (release name, namespace) to the release entry of 'helm list -o json'.
+    """
+    logger = logger or self.logger
+
+    with self._lock:
+      kubeconfig_state: tuple = self.get_kubeconfig_state()
+
+      if HelmReleaseIndex._releases is not None and HelmReleaseIndex._kubeconfig_state == kubeconfig_state:
+        return HelmReleaseIndex._releases
+
+      try:
+        process = subprocess.run(['helm', 'list', '-A', '-o', 'json'], stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE, check=True, text=True)
+
+        releases: dict[tuple[str, str], dict] = {(release['name'], release['namespace']): release
+                                                 for release in json.loads(process.stdout or '[]')}
+      except subprocess.CalledProcessError as e:
+        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+        logger.error(f'{e.stderr}')
+        return {}
+      except Exception as e:
+        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+        logger.error(f'{e}')
+        return {}
+
+      logger.info(f'Loaded {len(releases)} helm releases')
+
+      HelmReleaseIndex._releases = releases
+      HelmReleaseIndex._kubeconfig_state = kubeconfig_state
+
+      return releases
+
+  def is_deployed(self, release_name: str, namespace: str, logger=None) -> bool:
+    return (release_name, namespace) in self.load(logger=logger)
+
+  def get_release(self, release_name: str, namespace: str, logger=None) -> dict | None:
+    return self.load(logger=logger).get((release_name, namespace))
+
+  def get_releases(self, namespace: str | None = None, logger=None) -> list[dict]:
+    return [release for (_, release_namespace), release in self.load(logger=logger).items()
+            if namespace is None or release_namespace == namespace]
+
+  def record_install(self, release_name: str, namespace: str, chart: str | None = None,
+                     app_version: str | None = None):
+    with self._lock:
+      if HelmReleaseIndex._releases is not None:
+        HelmReleaseIndex._releases[(release_name, namespace)] = {'name': release_name, 'namespace': namespace,
+                                                                 'chart': chart, 'app_version': app_version,
+                                                                 'status': 'deployed'}
+
+  def record_delete(self, release_name: str, namespace: str):
+    with self._lock:
+      if HelmReleaseIndex._releases is not None:
+        HelmReleaseIndex._releases.pop((release_name, namespace), None)
+
+  @classmethod
+  def invalidate(cls):
+    # releases were changed outside this process, e.g. by an installer running in a child process
+    with cls._lock:
+      cls._releases = None
@@ -0,0 +1,152 @@
+import os
+import json
+import time
+import fcntl
+import inspect
+import threading
+import subprocess
+
+
+class HelmRepoManager:
+  """
+  Adds and refreshes helm chart repositories at most once per run.
+
+  Each repository is added only if helm does not know it yet, and its index is refreshed only if the cached
+  index file is older than ABSTRAKT_HELM_REPO_TTL seconds (default 3600). Only the repositories a component
+  needs are refreshed, instead of 'helm repo update' refreshing every configured repository. What has been
+  ensured is remembered for the rest of the process, so installers forked after the first check skip it, and a
+  file lock keeps concurrent abstrakt runs from editing the helm repository config at the same time.
+  """
+
+  default_ttl: int = 3600
+
+  repositories: dict[str, str] = {
+    'crowdstrike': 'https://crowdstrike.github.io/falcon-helm',
+    'kpagent-helm': 'https://registry.crowdstrike.com/kpagent-helm'
+  }
+
+  _ensured: set = set()
+  _configured: dict[str, str] | None = None
+  _helm_env: dict[str, str] | None = None
+  _lock = threading.Lock()
+
+  def __init__(self, logger, ttl: int | None = None):
+    self.logger = logger
+
+    self.ttl: int = ttl if ttl is not None else int(os.environ.get('ABSTRAKT_HELM_REPO_TTL', self.default_ttl))
+    self.lock_path: str = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                                       'abstrakt', 'helm-repositories.lock')
+
+  @staticmethod
+  def run_helm(arguments: list, logger) -> subprocess.CompletedProcess:
+    process = subprocess.run(['helm'] + arguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+    if process.stdout:
+      logger.info(process.stdout)
+    if process.stderr:
+      logger.info(process.stderr)
+
+    return process
+
+  def get_helm_env(self) -> dict[str, str]:
+    if HelmRepoManager._helm_env is None:
+      process = subprocess.run(['helm', 'env'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+      helm_env: dict[str, str] = {}
+
+      for line in process.stdout.splitlines():
+        key, _, value = line.partition('=')
+        helm_env[key.strip()] = value.strip().strip('"')
+
+      HelmRepoManager._helm_env = helm_env
+
+    return HelmRepoManager._helm_env
+
+  def get_configured_repos(self) -> dict[str, str]:
+    if HelmRepoManager._configured is None:
+      process = subprocess.run(['helm', 'repo', 'list', '-o', 'json'], stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, text=True)
+
+      # helm exits non-zero when no repository is configured yet
+      repos: list = json.loads(process.stdout) if process.returncode == 0 and process.stdout.strip() else []
+
+      HelmRepoManager._configured = {repo['name']: repo['url'] for repo in repos}
+
+    return HelmRepoManager._configured
+
+  def get_index_age(self, repo_name: str) -> float | None:
+    repository_cache: str | None = self.get_helm_env().get('HELM_REPOSITORY_CACHE')
+
+    if not repository_cache:
+      return None
+
+    index_path: str = os.path.join(repository_cache, f'{repo_name}-index.yaml')
+
+    return time.time() - os.path.getmtime(index_path) if os.path.exists(index_path) else None
+
+  def ensure_repos(self, repo_names: list[str], update: bool = True, logger=None) -> bool:
+    """
+    Makes sure the given repositories are configured and their indexes are fresh.
+
+    Args:
+        repo_names (list[str]): Repository names, e.g. ['crowdstrike']. Their URLs come from repositories.
+        update (bool): Refresh the indexes that are older than the TTL.
+        logger: Logger object
+
+    Returns:
+        bool: True if every repository is available.
+    """
+    logger = logger or self.logger
+
+    pending: list[str] = [name for name in repo_names if (name, update) not in self._ensured]
+
+    if not pending:
+      return True
+
+    try:
+      os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+
+      with self._lock, open(self.lock_path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        configured: dict[str, str] = self.get_configured_repos()
+        stale: list[str] = []
+
+        for name in pending:
+          url: str = self.repositories[name]
+
+          if configured.get(name) != url:
+            process = self.run_helm(['repo', 'add', name, url, '--force-update'], logger=logger)
+
+            if process.returncode != 0:
+              return False
+
+            configured[name] = url
+            # a freshly added repository comes with a fresh index
+            continue
+
+          if update:
+            index_age: float | None = self.get_index_age(repo_name=name)
+
+            if index_age is None or index_age >= self.ttl:
+              stale.append(name)
+            else:
+              logger.info(f'Helm repository {name} index is {int(index_age)} seconds old. Skipping update.')
+
+        if stale:
+          process = self.run_helm(['repo', 'update'] + stale, logger=logger)
+
+          if process.returncode != 0:
+            return False
+
+        for name in pending:
+          self._ensured.add((name, update))
+
+          if update:
+            # an updated repository also satisfies later calls that do not need an update
+            self._ensured.add((name, False))
+
+      return True
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return False
@@ -0,0 +1,131 @@
+import os
+import inspect
+import threading
+
+from kubernetes import client, config
+
+
+class KubeClientFactory:
+  """
+  Shared, cached Kubernetes API clients.
+
+  Loading a kubeconfig parses the file and may run an exec credential plugin (aws eks get-token,
+  gke-gcloud-auth-plugin, kubelogin), which takes hundreds of milliseconds. Clients are therefore built once per
+  process, kubeconfig path and context, and reused together with their connection pools. The kubernetes client
+  re-runs the exec plugin only when the credential it returned has expired. A cached client is rebuilt when its
+  kubeconfig file changes, e.g. after 'aws eks update-kubeconfig'. After a fork, child processes reuse the
+  parent's loaded credentials with a connection pool of their own, so they never share sockets with it.
+  """
+
+  default_kubeconfig_path: str = '~/.kube/config'
+
+  _api_clients: dict[tuple, tuple[client.ApiClient, float]] = {}
+  _api_clients_lock = threading.Lock()
+
+  def __init__(self, logger=None):
+    self.logger = logger
+
+  def get_kubeconfig_path(self, kubeconfig_path: str | None = None) -> str:
+    if not kubeconfig_path or kubeconfig_path == self.default_kubeconfig_path:
+      # like kubectl, KUBECONFIG wins over the default path, it may hold several paths and kubectl writes the first
+      kubeconfig_path = (os.environ.get('KUBECONFIG') or self.default_kubeconfig_path).split(os.pathsep)[0]
+
+    return os.path.abspath(os.path.expanduser(kubeconfig_path))
+
+  def get_api_client(self, kubeconfig_path: str | None = None, context: str | None = None,
+                     logger=None) -> client.ApiClient:
+    """
+    Returns the cached API client for a kubeconfig and context, building it on first use.
+
+    Args:
+        kubeconfig_path (str): Path to the kubeconfig file. Defaults to $KUBECONFIG or ~/.kube/config.
+        context (str): Kubeconfig context. Defaults to the current context of the file.
+        logger: Logger object
+
+    Returns:
+        client.ApiClient: API client to pass to the typed APIs, e.g. client.CoreV1Api(api_client).
+    """
+    logger = logger or self.logger
+
+    kubeconfig_path = self.get_kubeconfig_path(kubeconfig_path=kubeconfig_path)
+    modified_time: float = os.path.getmtime(kubeconfig_path) if os.path.exists(kubeconfig_path) else 0
+    key: tuple = (os.getpid(), kubeconfig_path, context)
+
+    with self._api_clients_lock:
+      cached_client: tuple[client.ApiClient, float] | None = self._api_clients.get(key)
+
+      if cached_client and cached_client[1] == modified_time:
+        return cached_client[0]
+
+      # a client built before a fork still holds valid credentials, only its connection pool must not be shared
+      inherited_client: client.ApiClient | None = next(
+        (api_client for (pid, path, ctx), (api_client, mtime) in self._api_clients.items()
+         if path == kubeconfig_path and ctx == context and mtime == modified_time), None)
+
+      if inherited_client is not None:
+        api_client: client.ApiClient = client.ApiClient(configuration=inherited_client.configuration)
+      else:
+        if logger:
+          logger.info(f"Loading kubeconfig {kubeconfig_path} (context: {context or 'current'})")
+
+        api_client: client.ApiClient = config.new_client_from_config(config_file=kubeconfig_path, context=context,
+                                                                     persist_config=True)
+
+      self._api_clients[key] = (api_client, modified_time)
+
+      return api_client
+
+  def core_v1(self, kubeconfig_path: str | None = None, context: str | None = None) -> client.CoreV1Api:
+    return client.CoreV1Api(self.get_api_client(kubeconfig_path=kubeconfig_path, context=context))
+
+  def apps_v1(self, kubeconfig_path: str | None = None, context: str | None = None) -> client.AppsV1Api:
+    return client.AppsV1Api(self.get_api_client(kubeconfig_path=kubeconfig_path, context=context))
+
+  def list_namespaced_pods(self, namespace: str, label_selector: str | None = None, field_selector: str | None = None,
+                           limit: int = 100, kubeconfig_path: str | None = None) -> tuple[list, str | None]:
+    """
+    Lists the pods matching server-side label and field selectors, one page of at most limit pods at a time.
+
+    Returns:
+        tuple[list, str | None]: The pods and the resource version of the list, to start a watch from.
+    """
+    v1 = self.core_v1(kubeconfig_path=kubeconfig_path)
+    selectors: dict = {key: value for key, value in (('label_selector', label_selector),
+                                                     ('field_selector', field_selector)) if value}
+
+    pods: list = []
+    continue_token: str | None = None
+
+    while True:
+      if continue_token:
+        selectors['_continue'] = continue_token
+
+      pod_list = v1.list_namespaced_pod(namespace, limit=limit, **selectors)
+      pods.extend(pod_list.items)
+
+      continue_token = pod_list.metadata._continue
+
+      if not continue_token:
+        return pods, pod_list.metadata.resource_version
+
+  def invalidate(self, kubeconfig_path: str | None = None, context: str | None = None, logger=None):
+    """
+    Drops a cached client, e.g. after its credentials were rejected with a 401.
+    """
+    logger = logger or self.logger
+
+    try:
+      kubeconfig_path = self.get_kubeconfig_path(kubeconfig_path=kubeconfig_path)
+
+      with self._api_clients_lock:
+        for key in [key for key in self._api_clients if key[1:] == (kubeconfig_path, context)]:
+          self._api_clients.pop(key, None)
+    except Exception as e:
+      if logger:
+        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+        logger.error(f'{e}')
+
+  @classmethod
+  def clear_clients(cls):
+    with cls._api_clients_lock:
+      cls._api_clients.clear()
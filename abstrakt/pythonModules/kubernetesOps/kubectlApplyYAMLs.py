@@ -19,6 +19,7 @@ class KubectlApplyYAMLs:
     logger = logger or self.logger
 
     yaml_files = self.find_yaml_files()
+    applied: bool = True
 
     for yaml_file in yaml_files:
       try:
@@ -32,3 +33,6 @@ class KubectlApplyYAMLs:
           logger.info(process.stderr)
       except Exception as e:
         logger.info(f"Error applying {yaml_file}: {e}")
+        applied = False
+
+    return applied
@@ -1,12 +1,15 @@
 import subprocess
 
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 
+from abstrakt.pythonModules.kubernetesOps.kubeClientFactory import KubeClientFactory
+
 
 class KubectlOps:
-  def __init__(self, logger):
+  def __init__(self, logger, kube_client_factory: KubeClientFactory | None = None):
     self.logger = logger
+    self.kube_client_factory = kube_client_factory or KubeClientFactory(logger=logger)
 
   def run_kubectl_command(self, command):
     try:
@@ -28,11 +31,8 @@ class KubectlOps:
     """Retrieves a list of all Kubernetes namespaces."""
 
     try:
-      # Load the configuration from your kubeconfig file
-      config.load_kube_config(kubeconfig_path)
-
-      # Create a Kubernetes client object
-      v1 = client.CoreV1Api()
+      # Get a cached client for the kubeconfig file
+      v1 = self.kube_client_factory.core_v1(kubeconfig_path=kubeconfig_path)
 
       # Get a list of all namespaces
       namespaces = v1.list_namespace()
@@ -47,11 +47,8 @@ class KubectlOps:
 
   def namespace_exists(self, namespace_name):
     try:
-      # Load the kubeconfig file
-      config.load_kube_config()
-
-      # Create a client for the CoreV1Api
-      v1 = client.CoreV1Api()
+      # Get a cached client for the CoreV1Api
+      v1 = self.kube_client_factory.core_v1()
 
       # Try to get the namespace
       v1.read_namespace(name=namespace_name)
@@ -64,22 +61,16 @@ class KubectlOps:
         self.logger.error(f"An error occurred: {e}")
         return False
 
-  def find_pods_with_status(self, pod_string, namespace):
+  def find_pods_with_status(self, pod_string, namespace, label_selector=None):
     try:
       status = True
 
-      # Load the kubeconfig file
-      config.load_kube_config()
-
-      # Create a client for the CoreV1Api
-      v1 = client.CoreV1Api()
-
-      # List all pods in the specified namespace
-      pods = v1.list_namespaced_pod(namespace)
+      # List only the pods matching the label selector, page by page
+      pods, _ = self.kube_client_factory.list_namespaced_pods(namespace=namespace, label_selector=label_selector)
 
       captured_pods = {'running': [], 'initiating': [], 'failed': [], 'succeeded': [], 'terminated': [], 'evicted': []}
 
-      for pod in pods.items:
+      for pod in pods:
         if pod_string in pod.metadata.name:
           if pod.status.phase == 'Running':
             captured_pods['running'].append(pod.metadata.name)
@@ -0,0 +1,211 @@
+import time
+import inspect
+
+from kubernetes import watch
+from kubernetes.client import ApiException
+
+from abstrakt.pythonModules.kubernetesOps.kubeClientFactory import KubeClientFactory
+
+
+class PodReadinessWaiter:
+  """
+  Waits for a group of pods to become ready using the Kubernetes watch API.
+
+  The pods are listed once, then a single watch stream on the namespace delivers every status change of the
+  whole group, so no pod is polled and the API server only pushes what changed. Waiting reasons such as
+  ErrImagePull or CrashLoopBackOff are classified as they arrive, and the wait ends as soon as every pod is
+  ready or has failed, or the deadline passes.
+  """
+
+  # waiting reasons that will not resolve on their own
+  failure_reasons: frozenset = frozenset(['ErrImagePull', 'ImagePullBackOff', 'CrashLoopBackOff', 'InvalidImageName',
+                                          'CreateContainerConfigError', 'CreateContainerError', 'RunContainerError',
+                                          'Failed'])
+
+  def __init__(self, logger, kube_client_factory: KubeClientFactory | None = None):
+    self.logger = logger
+    self.kube_client_factory = kube_client_factory or KubeClientFactory(logger=logger)
+
+  def classify_pod(self, pod) -> tuple[str, str]:
+    """
+    Classifies a pod as 'ready', 'failed' or 'pending'.
+
+    Returns:
+        tuple[str, str]: The state and the reason, e.g. ('failed', 'CrashLoopBackOff') or ('ready', 'Running').
+    """
+    status = pod.status
+    phase: str = status.phase if status and status.phase else 'Unknown'
+
+    if pod.metadata.deletion_timestamp:
+      return 'pending', 'Terminating'
+
+    if phase in ('Failed', 'Unknown', 'Succeeded'):
+      return 'failed', status.reason or phase
+
+    for container_status in (status.init_container_statuses or []) + (status.container_statuses or []):
+      waiting = container_status.state.waiting if container_status.state else None
+
+      if waiting and waiting.reason in self.failure_reasons:
+        return 'failed', waiting.reason
+
+    if (phase == 'Running' and status.container_statuses and
+       all(container_status.ready for container_status in status.container_statuses)):
+      return 'ready', 'Running'
+
+    for container_status in (status.init_container_statuses or []) + (status.container_statuses or []):
+      waiting = container_status.state.waiting if container_status.state else None
+
+      if waiting and waiting.reason:
+        return 'pending', waiting.reason
+
+    return 'pending', phase
+
+  @staticmethod
+  def is_tracked(pod, pod_names: set | None, name_filter: str | None) -> bool:
+    if pod_names is not None and pod.metadata.name not in pod_names:
+      return False
+
+    if name_filter and name_filter not in pod.metadata.name:
+      return False
+
+    return True
+
+  def update_pod(self, pods: dict, pod, logger=None):
+    logger = logger or self.logger
+
+    state, reason = self.classify_pod(pod)
+    previous: dict | None = pods.get(pod.metadata.name)
+
+    if previous is None or previous['reason'] != reason:
+      logger.info(f'Pod {pod.metadata.name}: {reason}')
+
+    pods[pod.metadata.name] = {'state': state, 'reason': reason, 'pod': pod}
+
+  @staticmethod
+  def is_settled(pods: dict) -> bool:
+    return bool(pods) and all(pod['state'] != 'pending' for pod in pods.values())
+
+  def wait_for_pods(self, namespace: str, label_selector: str | None = None, field_selector: str | None = None,
+                    pod_names: set | None = None, name_filter: str | None = None, timeout: int = 600,
+                    appear_timeout: int = 120, kubeconfig_path: str | None = None, logger=None) -> tuple[dict, int]:
+    """
+    Waits until every matching pod is ready or failed, or the deadline passes.
+
+    Args:
+        namespace (str): Namespace of the pods.
+        label_selector (str): Server-side label selector, e.g. 'app.kubernetes.io/name=falcon-kac'.
+        field_selector (str): Server-side field selector.
+        pod_names (set): Only track these pods.
+        name_filter (str): Only track pods whose name contains this substring.
+        timeout (int): Seconds to wait for the whole group.
+        appear_timeout (int): Seconds to wait for the first matching pod to appear.
+        kubeconfig_path (str): Path to the kubeconfig file.
+        logger: Logger object
+
+    Returns:
+        tuple[dict, int]: Pod name to {'podStatus', 'containerName', 'containerStatus'}, and the number of pods
+                          that are not running.
+    """
+    logger = logger or self.logger
+
+    start_time: float = time.time()
+    deadline: float = start_time + timeout
+    pods: dict[str, dict] = {}
+
+    v1 = self.kube_client_factory.core_v1(kubeconfig_path=kubeconfig_path)
+    selectors: dict = {key: value for key, value in (('label_selector', label_selector),
+                                                     ('field_selector', field_selector)) if value}
+
+    resource_version: str | None = None
+
+    while time.time() < deadline:
+      if resource_version is None:
+        # (re)list to get a consistent starting point for the watch
+        pod_items, resource_version = self.kube_client_factory.list_namespaced_pods(namespace=namespace,
+                                                                                    kubeconfig_path=kubeconfig_path,
+                                                                                    **selectors)
+
+        pods.clear()
+
+        for pod in pod_items:
+          if self.is_tracked(pod=pod, pod_names=pod_names, name_filter=name_filter):
+            self.update_pod(pods=pods, pod=pod, logger=logger)
+
+      if self.is_settled(pods=pods):
+        break
+
+      if not pods and time.time() - start_time >= appear_timeout:
+        logger.info(f'No matching pods appeared in namespace {namespace}')
+        break
+
+      watch_deadline: float = deadline if pods else min(deadline, start_time + appear_timeout)
+      remaining: int = max(1, int(watch_deadline - time.time()))
+      pod_watch = watch.Watch()
+
+      try:
+        for event in pod_watch.stream(v1.list_namespaced_pod, namespace, resource_version=resource_version,
+                                      timeout_seconds=remaining, **selectors):
+          pod = event['object']
+
+          if event['type'] == 'ERROR':
+            resource_version = None
+            break
+
+          resource_version = pod.metadata.resource_version
+
+          if not self.is_tracked(pod=pod, pod_names=pod_names, name_filter=name_filter):
+            continue
+
+          if event['type'] == 'DELETED':
+            pods.pop(pod.metadata.name, None)
+          else:
+            self.update_pod(pods=pods, pod=pod, logger=logger)
+
+          if self.is_settled(pods=pods) or time.time() >= deadline:
+            break
+      except ApiException as e:
+        # 410 Gone: the resource version expired, start again from a fresh list
+        if e.status != 410:
+          logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+          logger.error(f'{e}')
+          time.sleep(1)
+
+        resource_version = None
+      finally:
+        pod_watch.stop()
+
+    return self.get_results(pods=pods)
+
+  def get_pod_statuses(self, namespace: str, label_selector: str | None = None, name_filter: str | None = None,
+                       kubeconfig_path: str | None = None, logger=None) -> tuple[dict, int]:
+    """
+    Returns the current status of the matching pods from a single list, without waiting.
+    """
+    logger = logger or self.logger
+
+    pods: dict[str, dict] = {}
+    pod_items, _ = self.kube_client_factory.list_namespaced_pods(namespace=namespace, label_selector=label_selector,
+                                                                 kubeconfig_path=kubeconfig_path)
+
+    for pod in pod_items:
+      if self.is_tracked(pod=pod, pod_names=None, name_filter=name_filter):
+        self.update_pod(pods=pods, pod=pod, logger=logger)
+
+    return self.get_results(pods=pods)
+
+  @staticmethod
+  def get_results(pods: dict) -> tuple[dict, int]:
+    results: dict = {}
+    down: int = 0
+
+    for name, tracked_pod in pods.items():
+      results[name] = {'podStatus': tracked_pod['reason']}
+
+      if tracked_pod['state'] == 'ready':
+        for container_status in tracked_pod['pod'].status.container_statuses or []:
+          results[name]['containerName'] = container_status.name
+          results[name]['containerStatus'] = container_status.state.running
+      else:
+        down += 1
+
+    return results, down
@@ -0,0 +1,225 @@
+import sys
+import time
+import inspect
+
+from kubernetes import watch
+from kubernetes.client import ApiException
+
+from abstrakt.pythonModules.kubernetesOps.kubeClientFactory import KubeClientFactory
+from abstrakt.pythonModules.kubernetesOps.podReadinessWaiter import PodReadinessWaiter
+
+
+class RolloutTracker:
+  """
+  Tracks the rollout of DaemonSets and Deployments from their controller status.
+
+  Rollout progress is read from the workload object itself (desiredNumberScheduled, numberReady,
+  updatedNumberScheduled and observedGeneration for a DaemonSet, replicas, updatedReplicas and availableReplicas
+  for a Deployment) through a watch, so confirming an install costs the same few API reads on a 3 node or a
+  200 node cluster. Individual pods are only inspected when the rollout makes no progress for stall_timeout
+  seconds.
+  """
+
+  kinds: tuple = ('DaemonSet', 'Deployment')
+
+  def __init__(self, logger, kube_client_factory: KubeClientFactory | None = None):
+    self.logger = logger
+    self.kube_client_factory = kube_client_factory or KubeClientFactory(logger=logger)
+    self.pod_readiness_waiter = PodReadinessWaiter(logger=logger, kube_client_factory=self.kube_client_factory)
+
+  @staticmethod
+  def get_rollout_progress(kind: str, workload) -> dict:
+    """
+    Returns desired, ready and updated counts of a workload and whether its rollout is complete.
+    """
+    status = workload.status
+    observed: bool = (status.observed_generation or 0) >= (workload.metadata.generation or 0)
+
+    if kind == 'DaemonSet':
+      desired: int = status.desired_number_scheduled or 0
+      ready: int = status.number_ready or 0
+      updated: int = status.updated_number_scheduled or 0
+      available: int = status.number_available or 0
+      complete: bool = observed and updated == desired and available == desired
+      failed: bool = False
+    else:
+      desired: int = workload.spec.replicas if workload.spec.replicas is not None else 1
+      ready: int = status.ready_replicas or 0
+      updated: int = status.updated_replicas or 0
+      available: int = status.available_replicas or 0
+      complete: bool = (observed and updated == desired and available == desired and
+                        (status.replicas or 0) == desired)
+      failed: bool = any(condition.type == 'Progressing' and condition.reason == 'ProgressDeadlineExceeded'
+                         for condition in status.conditions or [])
+
+    return {'desired': desired, 'ready': ready, 'updated': updated, 'available': available,
+            'complete': complete, 'failed': failed}
+
+  @staticmethod
+  def print_progress(workloads: dict):
+    progress: str = ' | '.join(f"{name}: {rollout['ready']}/{rollout['desired']} ready, "
+                               f"{rollout['updated']}/{rollout['desired']} updated"
+                               for (_, name), rollout in workloads.items())
+
+    sys.stdout.write(f'\r{progress}')
+    sys.stdout.flush()
+
+  def inspect_stalled_pods(self, namespace: str, label_selector: str, kubeconfig_path: str | None = None,
+                           logger=None) -> bool:
+    """
+    Looks at the pods of a stalled rollout.
+
+    Returns:
+        bool: True if every pod that is not ready has failed, i.e. the rollout cannot finish on its own.
+    """
+    logger = logger or self.logger
+
+    pods, _ = self.kube_client_factory.list_namespaced_pods(namespace=namespace, label_selector=label_selector,
+                                                            kubeconfig_path=kubeconfig_path)
+    not_ready: dict = {}
+
+    for pod in pods:
+      state, reason = self.pod_readiness_waiter.classify_pod(pod)
+
+      if state != 'ready':
+        not_ready[pod.metadata.name] = (state, reason)
+
+    if not_ready:
+      print()
+
+      for pod_name, (state, reason) in not_ready.items():
+        print(f'{pod_name}: {reason}')
+        logger.info(f'Rollout stalled on pod {pod_name}: {reason}')
+
+    return bool(not_ready) and all(state == 'failed' for state, _ in not_ready.values())
+
+  def wait_for_rollouts(self, namespace: str, label_selector: str, timeout: int = 600, stall_timeout: int = 60,
+                        kubeconfig_path: str | None = None, logger=None) -> bool | None:
+    """
+    Waits for every DaemonSet and Deployment matching a label selector to finish rolling out.
+
+    Args:
+        namespace (str): Namespace of the workloads.
+        label_selector (str): Label selector of the workloads and their pods.
+        timeout (int): Seconds to wait for all rollouts.
+        stall_timeout (int): Seconds without progress before the pods are inspected.
+        kubeconfig_path (str): Path to the kubeconfig file.
+        logger: Logger object
+
+    Returns:
+        bool | None: True if all rollouts completed, False if one failed or timed out, None if no matching
+                     workload exists.
+    """
+    logger = logger or self.logger
+
+    apps_v1 = self.kube_client_factory.apps_v1(kubeconfig_path=kubeconfig_path)
+    list_functions: dict = {'DaemonSet': apps_v1.list_namespaced_daemon_set,
+                            'Deployment': apps_v1.list_namespaced_deployment}
+
+    deadline: float = time.time() + timeout
+    workloads: dict[tuple[str, str], dict] = {}
+    resource_versions: dict[str, str] = {}
+
+    def list_workloads(workload_kind: str):
+      workload_list = list_functions[workload_kind](namespace, label_selector=label_selector)
+      resource_versions[workload_kind] = workload_list.metadata.resource_version
+
+      for item in workload_list.items:
+        workloads[(workload_kind, item.metadata.name)] = self.get_rollout_progress(workload_kind, item)
+
+    try:
+      for kind in self.kinds:
+        list_workloads(kind)
+    except ApiException as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+    if not workloads:
+      return None
+
+    self.print_progress(workloads=workloads)
+
+    last_progress: tuple = tuple(tuple(rollout.values()) for rollout in workloads.values())
+    last_progress_time: float = time.time()
+
+    for kind in self.kinds:
+      # set when the watch can't resume from the last resource version and the workloads have to be listed again
+      relist: bool = False
+
+      while time.time() < deadline:
+        if relist:
+          try:
+            list_workloads(kind)
+            relist = False
+          except ApiException as e:
+            logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+            logger.error(f'{e}')
+            time.sleep(1)
+            continue
+
+        kind_rollouts: list = [rollout for (workload_kind, _), rollout in workloads.items() if workload_kind == kind]
+
+        if all(rollout['complete'] for rollout in kind_rollouts):
+          break
+
+        if any(rollout['failed'] for rollout in kind_rollouts):
+          print()
+          logger.error(f'{kind} rollout in namespace {namespace} exceeded its progress deadline')
+          return False
+
+        remaining: int = max(1, int(min(deadline - time.time(), stall_timeout)))
+        workload_watch = watch.Watch()
+
+        try:
+          for event in workload_watch.stream(list_functions[kind], namespace, label_selector=label_selector,
+                                             resource_version=resource_versions[kind], timeout_seconds=remaining):
+            if event['type'] == 'ERROR':
+              relist = True
+              break
+
+            workload = event['object']
+            resource_versions[kind] = workload.metadata.resource_version
+
+            if event['type'] == 'DELETED':
+              workloads.pop((kind, workload.metadata.name), None)
+            else:
+              workloads[(kind, workload.metadata.name)] = self.get_rollout_progress(kind, workload)
+
+            self.print_progress(workloads=workloads)
+
+            if all(rollout['complete'] or rollout['failed'] for (workload_kind, _), rollout in workloads.items()
+                   if workload_kind == kind):
+              break
+        except ApiException as e:
+          # 410 Gone: the resource version expired, start again from a fresh list
+          if e.status != 410:
+            logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+            logger.error(f'{e}')
+            time.sleep(1)
+
+          relist = True
+        finally:
+          workload_watch.stop()
+
+        progress: tuple = tuple(tuple(rollout.values()) for rollout in workloads.values())
+
+        if progress != last_progress:
+          last_progress, last_progress_time = progress, time.time()
+        elif time.time() - last_progress_time >= stall_timeout:
+          # only now look at individual pods
+          if self.inspect_stalled_pods(namespace=namespace, label_selector=label_selector,
+                                       kubeconfig_path=kubeconfig_path, logger=logger):
+            logger.error(f'Rollout in namespace {namespace} cannot complete, all pending pods have failed')
+            return False
+
+          last_progress_time = time.time()
+
+    print()
+
+    complete: bool = all(rollout['complete'] for rollout in workloads.values())
+
+    if not complete:
+      logger.error(f'Rollout in namespace {namespace} did not complete within {timeout} seconds')
+
+    return complete
@@ -1,3 +1,4 @@
+import os
 import subprocess
 
 
@@ -14,6 +15,10 @@ class UpdateKubeConfig:
       elif cloud == 'azure':
         command = ["az", "aks", "get-credentials", "--resource-group", resource_group, "--name", cluster_name,
                    "--overwrite-existing"]
+
+        # aws and gcloud write to the first path of KUBECONFIG on their own
+        if os.environ.get('KUBECONFIG'):
+          command += ["--file", os.environ['KUBECONFIG'].split(os.pathsep)[0]]
       elif cloud == 'gcp':
         command = ['gcloud', 'container', 'clusters', 'get-credentials', cluster_name, '--region', region,
                    '--project', gcp_project_id]
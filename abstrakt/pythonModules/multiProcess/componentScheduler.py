@@ -0,0 +1,200 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import multiprocessing
+from multiprocessing.connection import wait
+
+
+def run_component(func, args: tuple, output_path: str):
+  # runs in the component's own process, whatever it and its child processes print goes to its output file
+  with open(output_path, 'w') as output_file:
+    os.dup2(output_file.fileno(), sys.stdout.fileno())
+    os.dup2(output_file.fileno(), sys.stderr.fileno())
+
+  try:
+    result = func(*args)
+  except SystemExit as e:
+    # installers and the commands they call exit() when they give up, only an explicit exit(0) is a success
+    result = e.code == 0
+  except Exception as e:
+    print(f'Error: {e}')
+    result = False
+  finally:
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+  sys.exit(0 if result else 1)
+
+
+class ComponentScheduler:
+  """
+  Installs components concurrently along their dependency graph.
+
+  Every component runs in a process of its own as soon as all components it depends on have succeeded, with at
+  most parallelism components running at once, so the total install time approaches that of the longest chain of
+  dependencies instead of the sum of all installs. Components whose dependency failed are skipped. The output of
+  each component is captured separately and printed as one block when the component finishes, while a status line
+  shows what is still running. Set ABSTRAKT_INSTALL_PARALLELISM to change the default parallelism of 4.
+  """
+
+  default_parallelism: int = 4
+  action: str = 'installing'
+
+  def __init__(self, logger, parallelism: int | None = None, output_dir: str | None = None):
+    self.logger = logger
+    self.output_dir: str | None = output_dir
+
+    parallelism = parallelism or int(os.environ.get('ABSTRAKT_INSTALL_PARALLELISM', self.default_parallelism))
+    self.parallelism: int = max(1, parallelism)
+
+    self.components: dict[str, dict] = {}
+
+  def add_component(self, name: str, func, *args, depends_on: list[str] | None = None):
+    """
+    Adds a component to the graph.
+
+    Args:
+        name (str): Component name, e.g. 'falcon-sensor'.
+        func: Function installing the component, called as func(*args). It succeeds only if it returns True.
+        depends_on (list[str]): Components that must succeed first. Components not in the graph are ignored.
+    """
+    self.components[name] = {'func': func, 'args': args, 'depends_on': depends_on or []}
+
+  def get_dependencies(self, name: str) -> list[str]:
+    return [dependency for dependency in self.components[name]['depends_on'] if dependency in self.components]
+
+  def get_install_order(self) -> list[str]:
+    """
+    Returns the components in dependency order.
+
+    Raises:
+        ValueError: If the dependencies form a cycle.
+    """
+    order: list[str] = []
+    visiting: set = set()
+
+    def visit(name: str):
+      if name in order:
+        return
+
+      if name in visiting:
+        raise ValueError(f'Dependency cycle at component {name}')
+
+      visiting.add(name)
+
+      for dependency in self.get_dependencies(name):
+        visit(dependency)
+
+      visiting.discard(name)
+      order.append(name)
+
+    for component in self.components:
+      visit(component)
+
+    return order
+
+  @staticmethod
+  def format_duration(seconds: float) -> str:
+    return f'{int(seconds) // 60}m{int(seconds) % 60:02d}s'
+
+  def print_status(self, running: dict, results: dict):
+    status: str = ' | '.join(f'{name} {self.format_duration(time.time() - start_time)}'
+                             for name, _, start_time, _ in running.values())
+
+    sys.stdout.write(f'\r\033[KInstalling: {status}')
+    sys.stdout.flush()
+
+  def print_component_output(self, name: str, result: dict, output_path: str | None = None):
+    sys.stdout.write('\r\033[K')
+
+    print(f"{'=' * 60}\n{name}: {result['status']} in {self.format_duration(result['duration'])}\n{'=' * 60}")
+
+    if output_path and os.path.exists(output_path):
+      with open(output_path, 'r', errors='replace') as output_file:
+        output: str = output_file.read().strip()
+
+      if output:
+        print(output)
+
+    print()
+
+  def print_summary(self, results: dict):
+    print(f"{'Component':<30}{'Status':<12}{'Duration':>10}")
+
+    for name, result in results.items():
+      print(f"{name:<30}{result['status']:<12}{self.format_duration(result['duration']):>10}")
+
+    print()
+
+  def run(self, logger=None) -> dict[str, dict]:
+    """
+    Installs all components and waits for them to finish.
+
+    Returns:
+        dict[str, dict]: Component name to {'status': 'succeeded' | 'failed' | 'skipped', 'duration': seconds}.
+    """
+    logger = logger or self.logger
+
+    pending: list[str] = self.get_install_order()
+    running: dict = {}
+    results: dict[str, dict] = {}
+
+    # without an output directory the captured output is only kept until it has been printed
+    output_dir: str = self.output_dir or tempfile.mkdtemp(prefix='abstrakt-install-')
+    os.makedirs(output_dir, exist_ok=True)
+
+    # anything still buffered would otherwise be printed again by every forked component
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    try:
+      while pending or running:
+        for name in list(pending):
+          dependency_states: list = [results.get(dependency, {}).get('status')
+                                     for dependency in self.get_dependencies(name)]
+
+          if any(state in ('failed', 'skipped') for state in dependency_states):
+            pending.remove(name)
+            results[name] = {'status': 'skipped', 'duration': 0}
+            logger.info(f'Skipping {name}, a component it depends on did not install')
+            self.print_component_output(name=name, result=results[name])
+          elif all(state == 'succeeded' for state in dependency_states) and len(running) < self.parallelism:
+            pending.remove(name)
+
+            output_path: str = os.path.join(output_dir, f'{name}.out')
+            component: dict = self.components[name]
+            process = multiprocessing.Process(target=run_component,
+                                              args=(component['func'], component['args'], output_path))
+            process.start()
+
+            logger.info(f'Started {self.action} {name}')
+            running[process.sentinel] = (name, process, time.time(), output_path)
+
+        if not running:
+          continue
+
+        self.print_status(running=running, results=results)
+
+        for sentinel in wait(list(running), timeout=1):
+          name, process, start_time, output_path = running.pop(sentinel)
+          process.join()
+
+          status: str = 'succeeded' if process.exitcode == 0 else 'failed'
+          results[name] = {'status': status, 'duration': time.time() - start_time}
+
+          logger.info(f"Finished {self.action} {name}: {status} in {self.format_duration(results[name]['duration'])}")
+          self.print_component_output(name=name, result=results[name], output_path=output_path)
+
+      self.print_summary(results=results)
+
+      return results
+    finally:
+      for name, process, _, _ in running.values():
+        logger.info(f'Stopping {name}')
+        process.terminate()
+        process.join()
+
+      if not self.output_dir:
+        shutil.rmtree(output_dir, ignore_errors=True)
@@ -0,0 +1,131 @@
+import os
+import re
+import sys
+import time
+import shutil
+
+from abstrakt.pythonModules.multiProcess.componentScheduler import ComponentScheduler
+
+
+class FleetScheduler(ComponentScheduler):
+  """
+  Creates clusters concurrently, each in a process of its own, with at most parallelism clusters at once.
+
+  Instead of printing each cluster's output when it finishes, the output stays in <output_dir>/<cluster>.out and
+  a dashboard lists every cluster with its state, elapsed time and the last line it printed. The dashboard is
+  redrawn in place on a terminal; otherwise only changes of the running clusters are printed. The last lines of
+  a failed cluster's output are printed when it fails.
+  """
+
+  default_parallelism: int = 4
+  action: str = 'creating'
+  failure_lines: int = 20
+
+  ansi_escape_pattern = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+  def __init__(self, logger, output_dir: str, parallelism: int | None = None, interactive: bool | None = None):
+    super().__init__(logger=logger, parallelism=parallelism or self.default_parallelism, output_dir=output_dir)
+
+    self.interactive: bool = sys.stdout.isatty() if interactive is None else interactive
+    self.cluster_types: dict[str, str] = {}
+    self.dashboard_lines: int = 0
+    self.last_running: tuple = ()
+
+  def add_cluster(self, name: str, cluster_type: str, func, *args):
+    """
+    Adds a cluster to the fleet.
+
+    Args:
+        name (str): Cluster name, unique within the fleet.
+        cluster_type (str): Cluster type, e.g. 'eks-managed-node'.
+        func: Function creating the cluster, called as func(*args). It succeeds only if it returns True.
+    """
+    self.cluster_types[name] = cluster_type
+    self.add_component(name, func, *args)
+
+  def get_output_lines(self, output_path: str | None, count: int = 1) -> list[str]:
+    if not output_path or not os.path.exists(output_path):
+      return []
+
+    with open(output_path, 'rb') as output_file:
+      output_file.seek(max(0, os.path.getsize(output_path) - 16384))
+      output: str = output_file.read().decode(errors='replace')
+
+    # progress indicators redraw their line with carriage returns, only the last state of a line counts
+    lines: list[str] = [self.ansi_escape_pattern.sub('', line.split('\r')[-1]).strip()
+                        for line in output.replace('\r\n', '\n').split('\n')]
+
+    return [line for line in lines if line][-count:]
+
+  def clear_dashboard(self):
+    if self.dashboard_lines:
+      sys.stdout.write(f'\033[{self.dashboard_lines}F\033[J')
+      sys.stdout.flush()
+
+    self.dashboard_lines = 0
+
+  def get_dashboard(self, running: dict, results: dict) -> list[str]:
+    running_clusters: dict = {name: (start_time, output_path) for name, _, start_time, output_path in running.values()}
+    failed: int = sum(1 for result in results.values() if result['status'] == 'failed')
+
+    lines: list[str] = [f'Fleet: {len(results)}/{len(self.components)} done, {len(running_clusters)} running, '
+                        f'{failed} failed']
+
+    for name in self.components:
+      if name in results:
+        state, duration, last_line = results[name]['status'], self.format_duration(results[name]['duration']), ''
+      elif name in running_clusters:
+        start_time, output_path = running_clusters[name]
+        state, duration = 'running', self.format_duration(time.time() - start_time)
+        last_line = next(iter(self.get_output_lines(output_path=output_path)), '')
+      else:
+        state, duration, last_line = 'pending', '', ''
+
+      lines.append(f'  {name[:29]:<30}{self.cluster_types.get(name, "")[:17]:<18}{state:<11}{duration:>8}  '
+                   f'{last_line}'.rstrip())
+
+    return lines
+
+  def print_status(self, running: dict, results: dict):
+    if not self.interactive:
+      running_names: tuple = tuple(sorted(name for name, _, _, _ in running.values()))
+
+      if running_names != self.last_running:
+        print(f"Creating: {', '.join(running_names)}", flush=True)
+        self.last_running = running_names
+      return
+
+    width: int = shutil.get_terminal_size().columns
+    lines: list[str] = [line[:width - 1] for line in self.get_dashboard(running=running, results=results)]
+
+    self.clear_dashboard()
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+    self.dashboard_lines = len(lines)
+
+  def print_component_output(self, name: str, result: dict, output_path: str | None = None):
+    self.clear_dashboard()
+
+    print(f"{name}: {result['status']} in {self.format_duration(result['duration'])} | Output: {output_path}")
+
+    if result['status'] == 'failed':
+      for line in self.get_output_lines(output_path=output_path, count=self.failure_lines):
+        print(f'  {line}')
+
+      print()
+
+    sys.stdout.flush()
+
+  def print_summary(self, results: dict):
+    self.clear_dashboard()
+
+    print(f"\n{'Cluster':<30}{'Type':<18}{'Status':<12}{'Duration':>10}")
+
+    for name, result in sorted(results.items(), key=lambda item: list(self.components).index(item[0])):
+      print(f"{name[:29]:<30}{self.cluster_types.get(name, '')[:17]:<18}{result['status']:<12}"
+            f"{self.format_duration(result['duration']):>10}")
+
+    failed: int = sum(1 for result in results.values() if result['status'] == 'failed')
+    print(f'\n{len(results) - failed} of {len(results)} cluster/s created. '
+          f'Output of every cluster: {self.output_dir}\n')
@@ -40,7 +40,9 @@ class AWSDaemonsetOperationsManager(ClusterOperationsManager):
                generate_misconfigs: bool,
                cloud_type: str,
                cluster_type: str,
-               logger):
+               logger,
+               parallelism: int | None = None,
+               tf_parallelism: int | str | None = None):
     self.config_file: str = config_file
     self.cluster_name: str = cluster_name
     self.vpc_name: str = vpc_name
@@ -68,6 +70,8 @@ class AWSDaemonsetOperationsManager(ClusterOperationsManager):
     self.cloud_type: str = cloud_type
     self.cluster_type: str = cluster_type
     self.logger = logger
+    self.parallelism: int | None = parallelism
+    self.tf_parallelism: int | str | None = tf_parallelism
 
   def verify_parameters(self):
     runtime = AWSRuntimeParameterVerification(config_file=self.config_file,
@@ -96,7 +100,7 @@ class AWSDaemonsetOperationsManager(ClusterOperationsManager):
   def deploy_cluster(self) -> str:
     random_string = self.get_random_string(logger=self.logger)
 
-    managed_node = EKSManagedNode(logger=self.logger)
+    managed_node = EKSManagedNode(logger=self.logger, tf_parallelism=self.tf_parallelism)
     eks_managed_node_cluster_name = managed_node.deploy_eks_managed_node_cluster(cluster_name=self.cluster_name,
                                                                                  vpc_name=self.vpc_name,
                                                                                  region=self.region,
@@ -122,7 +126,7 @@ class AWSDaemonsetOperationsManager(ClusterOperationsManager):
                                     sensor_tags=self.sensor_tags,
                                     sensor_mode=sensor_mode,
                                     logger=self.logger)
-    daemonset.deploy_falcon_sensor_daemonset(logger=self.logger)
+    return daemonset.deploy_falcon_sensor_daemonset(logger=self.logger)
 
   def start_kac_deployment(self, cluster_name):
     kac = AWSDaemonsetKAC(falcon_client_id=self.falcon_client_id,
@@ -134,7 +138,7 @@ class AWSDaemonsetOperationsManager(ClusterOperationsManager):
                           cluster_type=self.cluster_type,
                           sensor_tags=self.sensor_tags,
                           logger=self.logger)
-    kac.deploy_falcon_kac(logger=self.logger)
+    return kac.deploy_falcon_kac(logger=self.logger)
 
   def start_iar_deployment(self, cluster_name):
     iar = AWSDaemonsetIAR(falcon_client_id=self.falcon_client_id,
@@ -146,7 +150,7 @@ class AWSDaemonsetOperationsManager(ClusterOperationsManager):
                           cluster_name=cluster_name,
                           cluster_type=self.cluster_type)
 
-    iar.deploy_falcon_iar(logger=self.logger)
+    return iar.deploy_falcon_iar(logger=self.logger)
 
   def start_cluster_operations(self):
     self.logger.info("Starting cluster operations")
@@ -164,35 +168,27 @@ class AWSDaemonsetOperationsManager(ClusterOperationsManager):
       # Deploy the cluster using Terraform
       cluster_name = self.deploy_cluster()
 
-      # install falcon sensor in _daemonset mode
-      if self.install_falcon_sensor:
-        self.start_falcon_sensor_deployment()
+      # install the requested components concurrently along their dependencies
+      components: dict[str, tuple] = {}
 
-      # install kubernetes protection agent
+      if self.install_falcon_sensor:
+        components['falcon-sensor'] = (self.start_falcon_sensor_deployment,)
       if self.install_kpa:
-        self.start_kpa_deployment(falcon_client_id=self.falcon_client_id,
-                                  falcon_client_secret=self.falcon_client_secret,
-                                  logger=self.logger)
-
-      # install kubernetes admission controller
+        components['kpa'] = (self.start_kpa_deployment, self.falcon_client_id, self.falcon_client_secret, self.logger)
       if self.install_kac:
-        self.start_kac_deployment(cluster_name=cluster_name)
-
-      # install image assessment at runtime
+        components['kac'] = (self.start_kac_deployment, cluster_name)
       if self.install_iar:
-        self.start_iar_deployment(cluster_name=cluster_name)
-
-      # install detections container and generate artificial detections + misconfigurations
+        components['iar'] = (self.start_iar_deployment, cluster_name)
       if self.install_detections_container:
-        self.start_detections_container_deployment(cluster_type=self.cluster_type, logger=self.logger)
-
-      # install vulnerable apps
+        components['detections-container'] = (self.start_detections_container_deployment, self.cluster_type,
+                                              self.logger)
       if self.install_vulnerable_apps:
-        self.start_vulnerable_app_deployment(logger=self.logger)
-
-      # generate misconfigurations
+        components['vulnerable-apps'] = (self.start_vulnerable_app_deployment, self.logger)
       if self.generate_misconfigs:
-        self.generate_misconfigurations(cluster_type=self.cluster_type, logger=self.logger)
+        components['misconfigurations'] = (self.generate_misconfigurations, self.cluster_type, self.logger)
+
+      results: dict[str, dict] = self.install_components(components=components, cluster_type=self.cluster_type,
+                                                         parallelism=self.parallelism, logger=self.logger)
 
       end_time = time.time()
       time_difference = end_time - start_time
@@ -202,6 +198,8 @@ class AWSDaemonsetOperationsManager(ClusterOperationsManager):
 
       print(f'Total deployment time: {int(int(time_difference) / 60)} '
             f'minute/s and {int(time_difference) % 60} seconds\n')
+
+      return all(result['status'] == 'succeeded' for result in results.values())
     finally:
       self.logger.info("Finished cluster operations")
 
@@ -237,7 +235,9 @@ class AWSSidecarOperationsManager(ClusterOperationsManager):
                ecr_kac_iam_role: str,
                ecr_iar_iam_role: str,
                cloud_type: str,
-               logger):
+               logger,
+               parallelism: int | None = None,
+               tf_parallelism: int | str | None = None):
     self.config_file: str = config_file
     self.cluster_name: str = cluster_name
     self.region: str = region
@@ -269,6 +269,8 @@ class AWSSidecarOperationsManager(ClusterOperationsManager):
     self.ecr_iar_iam_role: str = ecr_iar_iam_role
     self.cloud_type: str = cloud_type
     self.logger = logger
+    self.parallelism: int | None = parallelism
+    self.tf_parallelism: int | str | None = tf_parallelism
 
   def verify_parameters(self):
     runtime = AWSRuntimeParameterVerification(config_file=self.config_file,
@@ -295,7 +297,7 @@ class AWSSidecarOperationsManager(ClusterOperationsManager):
   def deploy_cluster(self) -> str:
     random_string = self.get_random_string(logger=self.logger)
 
-    eks_fargate = EKSFargate(logger=self.logger)
+    eks_fargate = EKSFargate(logger=self.logger, tf_parallelism=self.tf_parallelism)
     eks_fargate_cluster_name = eks_fargate.deploy_eks_fargate_cluster(cluster_name=self.cluster_name,
                                                                       vpc_name=self.vpc_name,
                                                                       region=self.region,
@@ -325,7 +327,7 @@ class AWSSidecarOperationsManager(ClusterOperationsManager):
                          cluster_name=cluster_name
                          )
 
-    sidecar.deploy_sidecar_falcon_sensor(logger=self.logger)
+    return sidecar.deploy_sidecar_falcon_sensor(logger=self.logger)
 
   def start_kac_deployment(self):
     kac = AWSSidecarKAC(falcon_client_id=self.falcon_client_id,
@@ -339,7 +341,7 @@ class AWSSidecarOperationsManager(ClusterOperationsManager):
                         kac_image_tag=self.kac_image_tag,
                         kac_iam_role=self.ecr_kac_iam_role
                         )
-    kac.deploy_falcon_kac(logger=self.logger)
+    return kac.deploy_falcon_kac(logger=self.logger)
 
   def start_iar_deployment(self, cluster_name: str):
     iar = AWSSidecarIAR(falcon_client_id=self.falcon_client_id,
@@ -353,7 +355,7 @@ class AWSSidecarOperationsManager(ClusterOperationsManager):
                         ecr_iam_policy=self.ecr_iam_policy,
                         iar_iam_role=self.ecr_iar_iam_role)
 
-    iar.deploy_falcon_iar(logger=self.logger)
+    return iar.deploy_falcon_iar(logger=self.logger)
 
   def start_cluster_operations(self):
     start_time = time.time()
@@ -369,35 +371,27 @@ class AWSSidecarOperationsManager(ClusterOperationsManager):
     # Deploy the cluster using Terraform
     cluster_name: str = self.deploy_cluster()
 
-    # install falcon sensor in _daemonset mode
-    if self.install_falcon_sensor:
-      self.start_falcon_sensor_deployment(cluster_name=cluster_name)
+    # install the requested components concurrently along their dependencies
+    components: dict[str, tuple] = {}
 
-    # install kubernetes protection agent
+    if self.install_falcon_sensor:
+      components['falcon-sensor'] = (self.start_falcon_sensor_deployment, cluster_name)
     if self.install_kpa:
-      self.start_kpa_deployment(falcon_client_id=self.falcon_client_id,
-                                falcon_client_secret=self.falcon_client_secret,
-                                logger=self.logger)
-
-    # install kubernetes admission controller
+      components['kpa'] = (self.start_kpa_deployment, self.falcon_client_id, self.falcon_client_secret, self.logger)
     if self.install_kac:
-      self.start_kac_deployment()
-
-    # install image assessment at runtime
+      components['kac'] = (self.start_kac_deployment,)
     if self.install_iar:
-      self.start_iar_deployment(cluster_name=cluster_name)
-
-    # install detections container and generate artificial detections + misconfigurations
+      components['iar'] = (self.start_iar_deployment, cluster_name)
     if self.install_detections_container:
-      self.start_detections_container_deployment(cluster_type=self.cluster_type, logger=self.logger)
-
-    # install vulnerable apps
+      components['detections-container'] = (self.start_detections_container_deployment, self.cluster_type,
+                                            self.logger)
     if self.install_vulnerable_apps:
-      self.start_vulnerable_app_deployment(logger=self.logger)
-
-    # generate misconfigurations
+      components['vulnerable-apps'] = (self.start_vulnerable_app_deployment, self.logger)
     if self.generate_misconfigs:
-      self.generate_misconfigurations(cluster_type=self.cluster_type, logger=self.logger)
+      components['misconfigurations'] = (self.generate_misconfigurations, self.cluster_type, self.logger)
+
+    results: dict[str, dict] = self.install_components(components=components, cluster_type=self.cluster_type,
+                                                       parallelism=self.parallelism, logger=self.logger)
 
     end_time = time.time()
     time_difference = end_time - start_time
@@ -406,3 +400,5 @@ class AWSSidecarOperationsManager(ClusterOperationsManager):
     print("End Time:", time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(end_time)))
 
     print(f'Total deployment time: {int(int(time_difference) / 60)} minute/s and {int(time_difference) % 60} seconds\n')
+
+    return all(result['status'] == 'succeeded' for result in results.values())
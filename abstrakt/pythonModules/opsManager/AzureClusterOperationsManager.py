@@ -41,7 +41,9 @@ class AzureClusterOperationsManager(ClusterOperationsManager):
                generate_misconfigs: bool,
                logger,
                kernel_mode: bool,
-               ebpf_mode: bool):
+               ebpf_mode: bool,
+               parallelism: int | None = None,
+               tf_parallelism: int | str | None = None):
 
     self.config_file: str = config_file
     self.cluster_name: str = cluster_name
@@ -71,6 +73,8 @@ class AzureClusterOperationsManager(ClusterOperationsManager):
     self.install_vulnerable_apps: bool = install_vulnerable_apps
     self.generate_misconfigs: bool = generate_misconfigs
     self.logger = logger
+    self.parallelism: int | None = parallelism
+    self.tf_parallelism: int | str | None = tf_parallelism
     self.kernel_mode: bool = kernel_mode
     self.ebpf_mode: bool = ebpf_mode
 
@@ -104,7 +108,7 @@ class AzureClusterOperationsManager(ClusterOperationsManager):
 
   def deploy_azure_cluster(self) -> str:
     if self.cluster_type == 'aks':
-      aks_cluster = AKS(self.logger)
+      aks_cluster = AKS(self.logger, tf_parallelism=self.tf_parallelism)
       aks_cluster_name = aks_cluster.deploy_aks_cluster(cluster_name=self.cluster_name,
                                                         rg_name=self.resource_group,
                                                         rg_location=self.location,
@@ -141,10 +145,10 @@ class AzureClusterOperationsManager(ClusterOperationsManager):
                                  sp_name=self.sp_name,
                                  sp_pass=self.sp_pass)
 
-      daemonset.deploy_azure_daemonset_falcon_sensor(logger=self.logger)
+      return daemonset.deploy_azure_daemonset_falcon_sensor(logger=self.logger)
     else:
       print('The cluster type you mentioned is not yet supported. Existing falcon sensor deployment.\n')
-      return
+      return False
 
   def start_kac_deployment(self):
     if self.cluster_type == 'aks':
@@ -161,7 +165,9 @@ class AzureClusterOperationsManager(ClusterOperationsManager):
                      sp_name=self.sp_name,
                      sp_pass=self.sp_pass)
 
-      kac.deploy_falcon_kac(logger=self.logger)
+      return kac.deploy_falcon_kac(logger=self.logger)
+
+    return False
 
   def start_iar_deployment(self):
     if self.cluster_type == 'aks':
@@ -177,7 +183,9 @@ class AzureClusterOperationsManager(ClusterOperationsManager):
                      sp_name=self.sp_name,
                      sp_pass=self.sp_pass)
 
-      iar.deploy_falcon_iar(logger=self.logger)
+      return iar.deploy_falcon_iar(logger=self.logger)
+
+    return False
 
   def start_azure_cluster_operations(self):
     start_time = time.time()
@@ -193,34 +201,27 @@ class AzureClusterOperationsManager(ClusterOperationsManager):
     # Deploy the cluster using Terraform
     self.deploy_azure_cluster()
 
-    # install falcon sensor in _daemonset mode
-    if self.install_falcon_sensor:
-      self.start_falcon_sensor_deployment()
+    # install the requested components concurrently along their dependencies
+    components: dict[str, tuple] = {}
 
-    # install kubernetes protection agent
+    if self.install_falcon_sensor:
+      components['falcon-sensor'] = (self.start_falcon_sensor_deployment,)
     if self.install_kpa:
-      self.start_kpa_deployment(falcon_client_id=self.falcon_client_id,
-                                falcon_client_secret=self.falcon_client_secret,
-                                logger=self.logger)
-
-    # install kubernetes admission controller
+      components['kpa'] = (self.start_kpa_deployment, self.falcon_client_id, self.falcon_client_secret, self.logger)
     if self.install_kac:
-      self.start_kac_deployment()
-
-    # install image assessment at runtime
+      components['kac'] = (self.start_kac_deployment,)
     if self.install_iar:
-      self.start_iar_deployment()
-
-    # install detections container and generate artificial detections + misconfigurations
+      components['iar'] = (self.start_iar_deployment,)
     if self.install_detections_container:
-      self.start_detections_container_deployment(cluster_type=self.cluster_type, logger=self.logger)
-
+      components['detections-container'] = (self.start_detections_container_deployment, self.cluster_type,
+                                            self.logger)
+    if self.install_vulnerable_apps:
+      components['vulnerable-apps'] = (self.start_vulnerable_app_deployment, self.logger)
     if self.generate_misconfigs:
-      self.generate_misconfigurations(cluster_type=self.cluster_type, logger=self.logger)
+      components['misconfigurations'] = (self.generate_misconfigurations, self.cluster_type, self.logger)
 
-    # install vulnerable apps
-    if self.install_vulnerable_apps:
-      self.start_vulnerable_app_deployment(logger=self.logger)
+    results: dict[str, dict] = self.install_components(components=components, cluster_type=self.cluster_type,
+                                                       parallelism=self.parallelism, logger=self.logger)
 
     end_time = time.time()
     time_difference = end_time - start_time
@@ -229,3 +230,5 @@ class AzureClusterOperationsManager(ClusterOperationsManager):
     print("End Time:", time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(end_time)))
 
     print(f'Total deployment time: {int(int(time_difference) / 60)} minute/s and {int(time_difference) % 60} seconds\n')
+
+    return all(result['status'] == 'succeeded' for result in results.values())
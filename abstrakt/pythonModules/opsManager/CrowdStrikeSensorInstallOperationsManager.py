@@ -2,13 +2,17 @@ import time
 import json
 import inspect
 import subprocess
-from kubernetes import client, config
 
 from abstrakt.pythonModules.kubernetesOps.helmOps import HelmOps
+from abstrakt.pythonModules.kubernetesOps.helmChartCache import HelmChartCache
+from abstrakt.pythonModules.kubernetesOps.helmRepoManager import HelmRepoManager
 from abstrakt.pythonModules.kubernetesOps.containerOps import ContainerOps
+from abstrakt.pythonModules.kubernetesOps.kubeClientFactory import KubeClientFactory
 
 from abstrakt.pythonModules.opsManager.generalOpsManager import ClusterOperationsManager
 
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconComponentResolver import FalconComponentResolver
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconImageMirror import FalconImageMirror
 from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.kac.AWSKAC import AWSDaemonsetKAC, AWSSidecarKAC
 from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.iar.AWSIAR import AWSDaemonsetIAR, AWSSidecarIAR
 
@@ -25,6 +29,9 @@ from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.falconsensor.da
   import GCPDaemonset
 from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.falconsensor.sidecar.AWSSidecar \
   import AWSSidecar
+from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.falconsensor.AWS import AWS
+from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.falconsensor.Azure import Azure
+from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.falconsensor.GCP import GCP
 from abstrakt.pythonModules.commandLine.layer_one.layer_two.runtimeParameterVerification \
   import SensorInstallRuntimeParameterVerification, SensorUninstallRuntimeParameterVerification
 
@@ -68,6 +75,12 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                vulnerable_apps=None,
                generate_misconfigs=None,
                detections=None,
+               mirror_platforms=None,
+               sensor_chart_version=None,
+               kac_chart_version=None,
+               iar_chart_version=None,
+               kpa_chart_version=None,
+               parallelism=None,
                logger=None):
     self.falcon_sensor = falcon_sensor
     self.kernel_mode = kernel_mode
@@ -107,7 +120,14 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
     self.vulnerable_apps = vulnerable_apps
     self.generate_misconfigs = generate_misconfigs
     self.detections = detections
+    self.mirror_platforms = mirror_platforms
+    self.sensor_chart_version = sensor_chart_version
+    self.kac_chart_version = kac_chart_version
+    self.iar_chart_version = iar_chart_version
+    self.kpa_chart_version = kpa_chart_version
+    self.parallelism = parallelism
     self.logger = logger
+    self.kube_client_factory = KubeClientFactory(logger=logger)
 
   def run_command(self, command, output=False):
     try:
@@ -218,8 +238,8 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
     try:
       process = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
 
-      # Load the kubeconfig file
-      config.load_kube_config()
+      # Load the kubeconfig file once, later calls reuse the cached client
+      self.kube_client_factory.get_api_client()
 
       if process.stdout:
         self.logger.info(process.stdout)
@@ -242,12 +262,9 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
       result = subprocess.run(eks_update_command, shell=True, check=True, text=True,
                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
-      # Load the kubeconfig file
-      config.load_kube_config()
-
       if result.returncode == 0:
-        # Create API clients for different API groups
-        v1 = client.CoreV1Api()
+        # Get a cached client for the updated kubeconfig
+        v1 = self.kube_client_factory.core_v1()
 
         nodes = v1.list_node()
 
@@ -391,7 +408,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                       sensor_tags=self.sensor_tags,
                                       sensor_mode=sensor_mode)
 
-      daemonset.deploy_falcon_sensor_daemonset(logger=self.logger)
+      return daemonset.deploy_falcon_sensor_daemonset(logger=self.logger)
     elif cluster_type == 'eks-fargate':
       sidecar = AWSSidecar(falcon_client_id=self.falcon_client_id,
                            falcon_client_secret=self.falcon_client_secret,
@@ -411,7 +428,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                            ecr_iar_iam_role=self.aws_iar_iam_role,
                            cluster_name=self.aws_cluster)
 
-      sidecar.deploy_sidecar_falcon_sensor(logger=self.logger)
+      return sidecar.deploy_sidecar_falcon_sensor(logger=self.logger)
     elif cluster_type == 'aks' or cluster_type == 'azure-aks':
       daemonset = AzureDaemonset(falcon_client_id=self.falcon_client_id,
                                  falcon_client_secret=self.falcon_client_secret,
@@ -429,7 +446,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                  sp_name=self.az_sp_name,
                                  sp_pass=self.az_sp_pass)
 
-      daemonset.deploy_azure_daemonset_falcon_sensor(logger=self.logger)
+      return daemonset.deploy_azure_daemonset_falcon_sensor(logger=self.logger)
     elif cluster_type == 'gke-standard' or cluster_type == 'gke-autopilot':
       daemonset = GCPDaemonset(falcon_client_id=self.falcon_client_id,
                                falcon_client_secret=self.falcon_client_secret,
@@ -445,7 +462,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                proxy_port=self.proxy_port,
                                cluster_type=cluster_type)
 
-      daemonset.deploy_falcon_sensor_daemonset(logger=self.logger)
+      return daemonset.deploy_falcon_sensor_daemonset(logger=self.logger)
     elif cluster_type == 'eks-managed-node-with-eks-fargate':
       # TODO: Implement the method
       pass
@@ -453,6 +470,8 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
       # TODO: Implement the method
       pass
 
+    return False
+
   def start_kac_deployment(self, cluster_type):
     if cluster_type == 'eks-managed-node':
       aws_daemonset_kac = AWSDaemonsetKAC(falcon_client_id=self.falcon_client_id,
@@ -464,7 +483,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                           cluster_type=cluster_type,
                                           kac_image_tag=self.kac_image_tag,
                                           sensor_tags=self.sensor_tags)
-      aws_daemonset_kac.deploy_falcon_kac(logger=self.logger)
+      return aws_daemonset_kac.deploy_falcon_kac(logger=self.logger)
     elif cluster_type == 'eks-fargate':
       aws_sidecar_kac = AWSSidecarKAC(falcon_client_id=self.falcon_client_id,
                                       falcon_client_secret=self.falcon_client_secret,
@@ -476,7 +495,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                       cluster_type=cluster_type,
                                       kac_image_tag=self.kac_image_tag,
                                       kac_iam_role=self.aws_kac_iam_role)
-      aws_sidecar_kac.deploy_falcon_kac(logger=self.logger)
+      return aws_sidecar_kac.deploy_falcon_kac(logger=self.logger)
     elif cluster_type == 'aks' or cluster_type == 'azure-aks':
       aks_daemonset_kac = AzureKAC(falcon_client_id=self.falcon_client_id,
                                    falcon_client_secret=self.falcon_client_secret,
@@ -490,7 +509,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                    sensor_tags=self.sensor_tags,
                                    sp_name=self.az_sp_name,
                                    sp_pass=self.az_sp_pass)
-      aks_daemonset_kac.deploy_falcon_kac(logger=self.logger)
+      return aks_daemonset_kac.deploy_falcon_kac(logger=self.logger)
     elif cluster_type == 'gke-standard' or cluster_type == 'gke-autopilot':
       gke_standard_kac = GCPKAC(falcon_client_id=self.falcon_client_id,
                                 falcon_client_secret=self.falcon_client_secret,
@@ -503,7 +522,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                 kac_image_tag=self.kac_image_tag,
                                 sensor_tags=self.sensor_tags)
 
-      gke_standard_kac.deploy_falcon_kac(logger=self.logger)
+      return gke_standard_kac.deploy_falcon_kac(logger=self.logger)
     elif cluster_type == 'eks-managed-node-with-eks-fargate':
       # TODO: Implement the method
       pass
@@ -511,6 +530,8 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
       # TODO: Implement the method
       pass
 
+    return False
+
   def start_iar_deployment(self, cluster_type):
     # install image assessment at runtime
     if cluster_type == 'eks-managed-node':
@@ -523,7 +544,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                           cluster_name=self.aws_cluster,
                                           cluster_type=cluster_type)
 
-      aws_daemonset_iar.deploy_falcon_iar(logger=self.logger)
+      return aws_daemonset_iar.deploy_falcon_iar(logger=self.logger)
     elif cluster_type == 'eks-fargate':
       aws_sidecar_iar = AWSSidecarIAR(falcon_client_id=self.falcon_client_id,
                                       falcon_client_secret=self.falcon_client_secret,
@@ -536,7 +557,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                                       ecr_iam_policy=self.aws_ecr_iam_policy,
                                       iar_iam_role=self.aws_iar_iam_role)
 
-      aws_sidecar_iar.deploy_falcon_iar(logger=self.logger)
+      return aws_sidecar_iar.deploy_falcon_iar(logger=self.logger)
     elif cluster_type == 'aks' or cluster_type == 'azure-aks':
       az_aks_iar = AzureIAR(falcon_client_id=self.falcon_client_id,
                             falcon_client_secret=self.falcon_client_secret,
@@ -550,7 +571,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                             sp_name=self.az_sp_name,
                             sp_pass=self.az_sp_pass)
 
-      az_aks_iar.deploy_falcon_iar(logger=self.logger)
+      return az_aks_iar.deploy_falcon_iar(logger=self.logger)
     elif cluster_type == 'gke-standard' or cluster_type == 'gke-autopilot':
       iar = GCPIAR(falcon_client_id=self.falcon_client_id,
                    falcon_client_secret=self.falcon_client_secret,
@@ -562,7 +583,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
                    location=self.gcp_location,
                    iar_image_tag=self.iar_image_tag)
 
-      iar.deploy_falcon_iar(logger=self.logger)
+      return iar.deploy_falcon_iar(logger=self.logger)
     elif cluster_type == 'eks-managed-node-with-eks-fargate':
       # TODO: Implement the method
       pass
@@ -570,6 +591,130 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
       # TODO: Implement the method
       pass
 
+    return False
+
+  def resolve_crowdstrike_components(self, cluster_type):
+    # resolve image tags and pull tokens of every requested component concurrently before any helm install
+    components: dict[str, tuple[str, str]] = {}
+
+    if self.falcon_sensor and self.sensor_image_tag:
+      components['sensor'] = ('sidecar' if cluster_type == 'eks-fargate' else 'daemonset', self.sensor_image_tag)
+    if self.kac and self.kac_image_tag:
+      components['kac'] = ('falcon-kac', self.kac_image_tag)
+    if self.iar and self.iar_image_tag:
+      components['iar'] = ('falcon-imageanalyzer', self.iar_image_tag)
+
+    if not components:
+      return {}
+
+    resolver = FalconComponentResolver(falcon_client_id=self.falcon_client_id,
+                                       falcon_client_secret=self.falcon_client_secret,
+                                       logger=self.logger)
+
+    resolved_components: dict[str, dict] = resolver.resolve_components(components=components)
+
+    for component, resolved in resolved_components.items():
+      self.logger.info(f"Resolved {component} image {resolved['registry']}:{resolved['image_tag']} in "
+                       f"{resolved['duration']:.2f} seconds")
+
+      if resolved['image_tag'] is None:
+        continue
+
+      # hand the concrete tags to the installers so they skip the latest-N lookup
+      if component == 'sensor':
+        self.sensor_image_tag = resolved['image_tag']
+      elif component == 'kac':
+        self.kac_image_tag = resolved['image_tag']
+      elif component == 'iar':
+        self.iar_image_tag = resolved['image_tag']
+
+    return resolved_components
+
+  def ensure_helm_repositories(self):
+    # add and refresh every needed helm repository once, the forked installers then skip the check
+    repo_names: list[str] = []
+
+    if self.falcon_sensor or self.kac or self.iar:
+      repo_names.append('crowdstrike')
+    if self.kpa:
+      repo_names.append('kpagent-helm')
+
+    if repo_names:
+      HelmRepoManager(logger=self.logger).ensure_repos(repo_names=repo_names, logger=self.logger)
+
+  def cache_helm_charts(self):
+    # pull every needed chart into the local chart cache once, the forked installers then install from the archives
+    chart_versions: dict[str, str | None] = {}
+
+    if self.falcon_sensor:
+      chart_versions['crowdstrike/falcon-sensor'] = self.sensor_chart_version
+    if self.kac:
+      chart_versions['crowdstrike/falcon-kac'] = self.kac_chart_version
+    if self.iar:
+      chart_versions['crowdstrike/falcon-image-analyzer'] = self.iar_chart_version
+    if self.kpa:
+      chart_versions['kpagent-helm/cs-k8s-protection-agent'] = self.kpa_chart_version
+
+    HelmChartCache.pin_versions(chart_versions)
+    chart_cache = HelmChartCache(logger=self.logger)
+
+    for chart, version in chart_versions.items():
+      archive_path = chart_cache.cache_chart(chart=chart, version=version, logger=self.logger)
+
+      if archive_path is None and version:
+        print(f'Error: Version {version} of helm chart {chart} could not be pulled. Exiting the program.')
+        exit()
+
+  def get_cluster_platforms(self):
+    # architectures of the cluster's nodes, so only the matching image platforms need to be mirrored
+    try:
+      nodes = self.kube_client_factory.core_v1().list_node()
+      platforms = sorted({node.metadata.labels.get('kubernetes.io/arch') for node in nodes.items
+                          if node.metadata.labels and node.metadata.labels.get('kubernetes.io/arch')})
+
+      return platforms or None
+    except Exception as e:
+      self.logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      self.logger.error(f'{e}')
+      return None
+
+  def mirror_crowdstrike_images(self, cluster_type, resolved_components):
+    # copy every component image into the private registry at once instead of one per installer
+    images: dict[str, str] = {resolved['sensor_type']: resolved['image_tag']
+                              for resolved in resolved_components.values() if resolved['image_tag']}
+
+    if not self.registry or not images:
+      return {}
+
+    if self.mirror_platforms:
+      platforms = FalconImageMirror.normalize_platforms(self.mirror_platforms)
+    elif cluster_type == 'eks-fargate':
+      # fargate nodes are virtual and all run on amd64
+      platforms = ['amd64']
+    else:
+      platforms = FalconImageMirror.normalize_platforms(self.get_cluster_platforms())
+
+    if platforms:
+      self.logger.info(f"Mirroring image platform/s {', '.join(platforms)}")
+
+    if cluster_type.startswith('eks'):
+      cloud = AWS(self.falcon_client_id, self.falcon_client_secret, self.logger, self.registry, self.repository)
+
+      return cloud.mirror_crowdstrike_images(images=images, platforms=platforms, logger=self.logger)
+    elif cluster_type == 'aks' or cluster_type == 'azure-aks':
+      cloud = Azure(self.falcon_client_id, self.falcon_client_secret, self.logger, self.registry, self.repository,
+                    self.az_resource_group, self.az_location, self.az_acr_resource_group)
+
+      return cloud.mirror_crowdstrike_images(images=images, sp_name=self.az_sp_name, sp_pass=self.az_sp_pass,
+                                             platforms=platforms, logger=self.logger)
+    elif cluster_type == 'gke-standard' or cluster_type == 'gke-autopilot':
+      cloud = GCP(self.falcon_client_id, self.falcon_client_secret, self.logger, self.registry, self.repository,
+                  self.gcp_project_id, self.gcp_service_account, self.gcp_location)
+
+      return cloud.mirror_crowdstrike_images(images=images, platforms=platforms, logger=self.logger)
+
+    return {}
+
   def start_crowdstrike_sensor_operations(self):
     # ensure required parameters are passed with falcon sensor
     self.verify_install_parameters()
@@ -602,32 +747,31 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
       print('Error: Cluster type could not be determined. Exiting the program.')
       exit()
 
-    if self.falcon_sensor:
-      self.start_falcon_sensor_deployment(cluster_type=cluster_type)
+    resolved_components = self.resolve_crowdstrike_components(cluster_type=cluster_type)
+    self.mirror_crowdstrike_images(cluster_type=cluster_type, resolved_components=resolved_components)
+    self.ensure_helm_repositories()
+    self.cache_helm_charts()
 
-    # install kubernetes protection agent
-    if self.kpa:
-      self.start_kpa_deployment(falcon_client_id=self.falcon_client_id,
-                                falcon_client_secret=self.falcon_client_secret, logger=self.logger)
+    # install the requested components concurrently along their dependencies
+    components: dict[str, tuple] = {}
 
-    # install kubernetes admission controller
+    if self.falcon_sensor:
+      components['falcon-sensor'] = (self.start_falcon_sensor_deployment, cluster_type)
+    if self.kpa:
+      components['kpa'] = (self.start_kpa_deployment, self.falcon_client_id, self.falcon_client_secret, self.logger)
     if self.kac:
-      self.start_kac_deployment(cluster_type=cluster_type)
-
-    # install image assessment at runtime
+      components['kac'] = (self.start_kac_deployment, cluster_type)
     if self.iar:
-      self.start_iar_deployment(cluster_type=cluster_type)
-
-    # install detections container and generate artificial detections + misconfigurations
+      components['iar'] = (self.start_iar_deployment, cluster_type)
     if self.detections_container:
-      self.start_detections_container_deployment(cluster_type=cluster_type, logger=self.logger)
-
-    # install vulnerable apps
+      components['detections-container'] = (self.start_detections_container_deployment, cluster_type, self.logger)
     if self.vulnerable_apps:
-      self.start_vulnerable_app_deployment(logger=self.logger)
-
+      components['vulnerable-apps'] = (self.start_vulnerable_app_deployment, self.logger)
     if self.generate_misconfigs:
-      self.generate_misconfigurations(cluster_type=cluster_type, logger=self.logger)
+      components['misconfigurations'] = (self.generate_misconfigurations, cluster_type, self.logger)
+
+    self.install_components(components=components, cluster_type=cluster_type, parallelism=self.parallelism,
+                            logger=self.logger)
 
     end_time = time.time()
     time_difference = end_time - start_time
@@ -708,7 +852,7 @@ class CrowdStrikeSensorInstallOperationsManager(ClusterOperationsManager):
         print('IAR helm chart not found. Skipping uninstallation...')
 
     if self.detections:
-      k8s = ContainerOps(logger=self.logger)
+      k8s = ContainerOps(logger=self.logger, kube_client_factory=self.kube_client_factory)
 
       if k8s.check_namespace_exists(namespace='crowdstrike-detections',
                                     kubeconfig_path='~/.kube/config',
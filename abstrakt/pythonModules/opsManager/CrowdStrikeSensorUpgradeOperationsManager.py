@@ -3,7 +3,8 @@ import json
 import inspect
 import subprocess
 from typing import Optional
-from kubernetes import client, config
+
+from abstrakt.pythonModules.kubernetesOps.kubeClientFactory import KubeClientFactory
 
 from abstrakt.pythonModules.vendors.cloudServiceProviders.gcp.gcpOps import GCPOps
 from abstrakt.pythonModules.vendors.cloudServiceProviders.azure.azOps.azOps import AZOps
@@ -69,6 +70,7 @@ class CrowdStrikeSensorInstallOperationsManager:
     self.falcon_client_id = falcon_client_id
     self.falcon_client_secret = falcon_client_secret
     self.logger = logger
+    self.kube_client_factory = KubeClientFactory(logger=logger)
 
   def run_command(self, command: str) -> Optional[str]:
     """
@@ -124,8 +126,8 @@ class CrowdStrikeSensorInstallOperationsManager:
     try:
       process = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
 
-      # Load the kubeconfig file
-      config.load_kube_config()
+      # Load the kubeconfig file once, later calls reuse the cached client
+      self.kube_client_factory.get_api_client()
 
       if process.stdout:
         self.logger.info(process.stdout)
@@ -148,12 +150,9 @@ class CrowdStrikeSensorInstallOperationsManager:
       result = subprocess.run(eks_update_command, shell=True, check=True, text=True,
                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
-      # Load the kubeconfig file
-      config.load_kube_config()
-
       if result.returncode == 0:
-        # Create API clients for different API groups
-        v1 = client.CoreV1Api()
+        # Get a cached client for the updated kubeconfig
+        v1 = self.kube_client_factory.core_v1()
 
         nodes = v1.list_node()
 
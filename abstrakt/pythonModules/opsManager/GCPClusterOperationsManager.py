@@ -38,7 +38,9 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
                install_detections_container: bool,
                install_vulnerable_apps: bool,
                generate_misconfigs: bool,
-               logger):
+               logger,
+               parallelism: int | None = None,
+               tf_parallelism: int | str | None = None):
 
     self.config_file: str = config_file
     self.cluster_name: str = cluster_name
@@ -67,6 +69,8 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
     self.install_vulnerable_apps: bool = install_vulnerable_apps
     self.generate_misconfigs: bool = generate_misconfigs
     self.logger = logger
+    self.parallelism: int | None = parallelism
+    self.tf_parallelism: int | str | None = tf_parallelism
 
   def verify_gke_standard_parameters(self):
     runtime = GCPRuntimeParameterVerification(config_file=self.config_file,
@@ -150,7 +154,7 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
 
   def deploy_gke_cluster(self) -> str:
     if self.cluster_type == 'gke-standard':
-      gke_standard_cluster = GKE(self.logger)
+      gke_standard_cluster = GKE(self.logger, tf_parallelism=self.tf_parallelism)
       return gke_standard_cluster.deploy_gke_standard_cluster(cluster_name=self.cluster_name,
                                                               vpc_network=self.vpc_network,
                                                               region=self.location,
@@ -159,7 +163,7 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
                                                               project_id=self.project_id)
 
     elif self.cluster_type == 'gke-autopilot':
-      gke_autopilot_cluster = GKE(self.logger)
+      gke_autopilot_cluster = GKE(self.logger, tf_parallelism=self.tf_parallelism)
       return gke_autopilot_cluster.deploy_gke_autopilot_cluster(cluster_name=self.cluster_name,
                                                                 vpc_network=self.vpc_network,
                                                                 region=self.location,
@@ -181,7 +185,7 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
                              service_account=self.service_account,
                              location=self.location)
 
-    daemonset.deploy_falcon_sensor_daemonset(logger=self.logger)
+    return daemonset.deploy_falcon_sensor_daemonset(logger=self.logger)
 
   def start_kac_deployment(self):
     kac = GCPKAC(falcon_client_id=self.falcon_client_id,
@@ -195,7 +199,7 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
                  sensor_tags=self.sensor_tags,
                  location=self.location)
 
-    kac.deploy_falcon_kac(logger=self.logger)
+    return kac.deploy_falcon_kac(logger=self.logger)
 
   def start_iar_deployment(self):
     iar = GCPIAR(falcon_client_id=self.falcon_client_id,
@@ -208,7 +212,7 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
                  iar_image_tag=self.iar_image_tag,
                  location=self.location)
 
-    iar.deploy_falcon_iar(logger=self.logger)
+    return iar.deploy_falcon_iar(logger=self.logger)
 
   def start_gcp_cluster_operations(self):
     start_time = time.time()
@@ -234,34 +238,27 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
     # Deploy the cluster using Terraform
     self.deploy_gke_cluster()
 
-    # install falcon sensor in _daemonset mode
-    if self.install_falcon_sensor:
-      self.start_falcon_sensor_deployment()
+    # install the requested components concurrently along their dependencies
+    components: dict[str, tuple] = {}
 
-    # install kubernetes protection agent
+    if self.install_falcon_sensor:
+      components['falcon-sensor'] = (self.start_falcon_sensor_deployment,)
     if self.install_kpa:
-      self.start_kpa_deployment(falcon_client_id=self.falcon_client_id,
-                                falcon_client_secret=self.falcon_client_secret,
-                                logger=self.logger)
-
-    # install kubernetes admission controller
+      components['kpa'] = (self.start_kpa_deployment, self.falcon_client_id, self.falcon_client_secret, self.logger)
     if self.install_kac:
-      self.start_kac_deployment()
-
-    # install image assessment at runtime
+      components['kac'] = (self.start_kac_deployment,)
     if self.install_iar:
-      self.start_iar_deployment()
-
-    # install detections container and generate artificial detections + misconfigurations
+      components['iar'] = (self.start_iar_deployment,)
     if self.install_detections_container:
-      self.start_detections_container_deployment(cluster_type=self.cluster_type, logger=self.logger)
-
+      components['detections-container'] = (self.start_detections_container_deployment, self.cluster_type,
+                                            self.logger)
+    if self.install_vulnerable_apps:
+      components['vulnerable-apps'] = (self.start_vulnerable_app_deployment, self.logger)
     if self.generate_misconfigs:
-      self.generate_misconfigurations(cluster_type=self.cluster_type, logger=self.logger)
+      components['misconfigurations'] = (self.generate_misconfigurations, self.cluster_type, self.logger)
 
-    # install vulnerable apps
-    if self.install_vulnerable_apps:
-      self.start_vulnerable_app_deployment(logger=self.logger)
+    results: dict[str, dict] = self.install_components(components=components, cluster_type=self.cluster_type,
+                                                       parallelism=self.parallelism, logger=self.logger)
 
     end_time = time.time()
     time_difference = end_time - start_time
@@ -270,3 +267,5 @@ class GCPClusterOperationsManager(ClusterOperationsManager):
     print("End Time:", time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(end_time)))
 
     print(f'Total deployment time: {int(int(time_difference) / 60)} minute/s and {int(time_difference) % 60} seconds\n')
+
+    return all(result['status'] == 'succeeded' for result in results.values())
@@ -0,0 +1,262 @@
+import os
+import time
+import json
+import typing
+import inspect
+
+import yaml
+
+from abstrakt.pythonModules.opsManager.generalOpsManager import ClusterOperationsManager
+from abstrakt.pythonModules.multiProcess.fleetScheduler import FleetScheduler
+from abstrakt.pythonModules.commandLine.layer_one.layer_two.createAWS import eks_managed_node, eks_fargate
+from abstrakt.pythonModules.commandLine.layer_one.layer_two.createAzure import aks
+from abstrakt.pythonModules.commandLine.layer_one.layer_two.createGCP import gke_standard, gke_autopilot
+
+
+class FleetOperationsManager:
+  """
+  Creates every cluster of a fleet manifest concurrently.
+
+  A manifest is a YAML file:
+
+    parallelism: 4            # clusters created at once
+    tf_parallelism: auto      # terraform parallelism of every cluster
+    defaults:                 # options of every cluster, e.g. falcon_client_id and falcon_client_secret
+      install_kpa: true
+    clusters:
+      - type: eks-managed-node
+        config_file: ./abstrakt/conf/aws/eks/eks-managed-node.conf
+        overrides:
+          cluster_name: pov-eks-1
+          region: eu-west-2
+        sensors:
+          install_falcon_sensor: true
+          kernel_mode: true
+
+  Options are those of the matching 'abstrakt create' command, written either like the command line flag
+  (sensor-image-tag) or with underscores. Every cluster needs a cluster_name of its own, it names the cluster's
+  Terraform workspace, so clusters of the same module never share tfvars, state or data directory. Each cluster
+  also gets its own kubeconfig, so helm and kubectl of one cluster never talk to another. The output of every
+  cluster and fleet-summary.json with the status and duration of each cluster are kept in the output directory.
+  """
+
+  cluster_commands: dict[str, tuple[str, typing.Callable]] = {
+    'eks-managed-node': ('aws', eks_managed_node),
+    'eks-fargate': ('aws', eks_fargate),
+    'aks': ('azure', aks),
+    'gke-standard': ('gcp', gke_standard),
+    'gke-autopilot': ('gcp', gke_autopilot)
+  }
+
+  entry_keys: set[str] = {'type', 'config_file', 'overrides', 'sensors'}
+
+  def __init__(self, manifest: str, logger, parallelism: int | None = None, tf_parallelism: str | None = None,
+               output_dir: str | None = None):
+    self.manifest: str = manifest
+    self.logger = logger
+    self.parallelism: int | None = parallelism
+    self.tf_parallelism: str | None = tf_parallelism
+
+    manifest_name: str = os.path.splitext(os.path.basename(manifest))[0]
+    self.output_dir: str = output_dir or os.path.join('/var/log/crowdstrike/fleet',
+                                                      f"{manifest_name}-{time.strftime('%Y%m%d-%H%M%S')}")
+
+  def read_manifest(self) -> dict:
+    try:
+      with open(self.manifest, 'r') as manifest_file:
+        manifest = yaml.safe_load(manifest_file)
+    except (OSError, yaml.YAMLError) as e:
+      self.logger.error(f'{e}')
+      print(f'Unable to read fleet manifest {self.manifest}: {e}\n')
+      exit()
+
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('clusters'), list) or not manifest['clusters']:
+      print(f'Fleet manifest {self.manifest} has no list of clusters. Exiting the program.\n')
+      exit()
+
+    return manifest
+
+  @staticmethod
+  def get_command_options(command) -> dict[str, str]:
+    """
+    Returns the option names a create command accepts, mapped to its parameter names.
+    """
+    options: dict[str, str] = {}
+
+    for name, parameter in inspect.signature(command).parameters.items():
+      options[name] = name
+
+      for metadata in typing.get_args(parameter.annotation)[1:]:
+        for declaration in getattr(metadata, 'param_decls', None) or ():
+          options[declaration.lstrip('-').replace('-', '_')] = name
+
+    return options
+
+  def get_cluster(self, entry: dict, defaults: dict) -> dict:
+    """
+    Resolves one manifest entry to the create command and the arguments it is called with.
+
+    Raises:
+        ValueError: If the entry is incomplete or has options its command does not accept.
+    """
+    if not isinstance(entry, dict):
+      raise ValueError(f'entry {entry!r} is not a mapping')
+
+    if entry.get('type') not in self.cluster_commands:
+      raise ValueError(f"unknown cluster type {entry.get('type')!r}, expected one of "
+                       f"{', '.join(self.cluster_commands)}")
+
+    unknown_keys: set = set(entry) - self.entry_keys
+    if unknown_keys:
+      raise ValueError(f"unknown key/s {', '.join(sorted(unknown_keys))}, cluster options go under overrides or "
+                       f"sensors")
+
+    cloud, command = self.cluster_commands[entry['type']]
+    command_options: dict[str, str] = self.get_command_options(command=command)
+
+    arguments: dict = {}
+
+    for options in (defaults, entry.get('overrides') or {}, entry.get('sensors') or {}):
+      for option, value in options.items():
+        parameter: str | None = command_options.get(str(option).lstrip('-').replace('-', '_'))
+
+        if parameter is None:
+          raise ValueError(f"option {option!r} is not an option of 'abstrakt create' {entry['type']}")
+
+        arguments[parameter] = value
+
+    if entry.get('config_file'):
+      arguments['config_file'] = entry['config_file']
+
+    if not arguments.get('cluster_name'):
+      raise ValueError('cluster_name is missing from overrides')
+
+    if arguments.get('config_file') and not os.path.exists(arguments['config_file']):
+      raise ValueError(f"config file {arguments['config_file']} does not exist")
+
+    return {'name': str(arguments['cluster_name']), 'type': entry['type'], 'cloud': cloud, 'command': command,
+            'arguments': arguments}
+
+  def get_clusters(self, manifest: dict) -> list[dict]:
+    defaults: dict = manifest.get('defaults') or {}
+    tf_parallelism = self.tf_parallelism or manifest.get('tf_parallelism')
+
+    clusters: list[dict] = []
+    errors: list[str] = []
+
+    for index, entry in enumerate(manifest['clusters'], start=1):
+      try:
+        cluster: dict = self.get_cluster(entry=entry, defaults=defaults)
+      except ValueError as e:
+        errors.append(f'Cluster {index}: {e}')
+        continue
+
+      if any(cluster['name'] == other['name'] for other in clusters):
+        errors.append(f"Cluster {index}: cluster_name {cluster['name']} is used more than once")
+        continue
+
+      if tf_parallelism:
+        cluster['arguments'].setdefault('tf_parallelism', str(tf_parallelism))
+
+      clusters.append(cluster)
+
+    if errors:
+      for error in errors:
+        self.logger.error(error)
+        print(error)
+
+      print(f'\nFleet manifest {self.manifest} is invalid. Exiting the program.\n')
+      exit()
+
+    return clusters
+
+  def get_kubeconfig_path(self, cluster: dict) -> str:
+    return os.path.join(self.output_dir, f"{cluster['name']}.kubeconfig")
+
+  def create_cluster(self, cluster: dict) -> bool:
+    # runs in the cluster's own process, the environment changes only apply to this cluster
+    os.environ['KUBECONFIG'] = self.get_kubeconfig_path(cluster=cluster)
+
+    if cluster['cloud'] == 'gcp' and cluster['arguments'].get('project_id'):
+      # 'gcloud config set project' of one cluster must not switch the project of the others
+      os.environ['CLOUDSDK_CORE_PROJECT'] = str(cluster['arguments']['project_id'])
+
+    try:
+      # True only if every requested component was installed
+      created = cluster['command'](**cluster['arguments'])
+    except SystemExit as e:
+      # the create commands exit on every failure
+      print(f"Creating {cluster['name']} stopped with exit code {e.code}")
+      return False
+
+    if created is not True:
+      print(f"Cluster {cluster['name']} was created, but not all of its components were installed")
+      return False
+
+    return True
+
+  def write_summary(self, clusters: list[dict], results: dict[str, dict], start_time: float):
+    summary: dict = {
+      'manifest': os.path.abspath(self.manifest),
+      'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(start_time)),
+      'duration': time.time() - start_time,
+      'failed': [name for name, result in results.items() if result['status'] != 'succeeded'],
+      'clusters': [{'name': cluster['name'],
+                    'type': cluster['type'],
+                    'status': results.get(cluster['name'], {}).get('status', 'not started'),
+                    'duration': results.get(cluster['name'], {}).get('duration', 0),
+                    'output': os.path.join(self.output_dir, f"{cluster['name']}.out"),
+                    'kubeconfig': self.get_kubeconfig_path(cluster=cluster)} for cluster in clusters]
+    }
+
+    try:
+      with open(os.path.join(self.output_dir, 'fleet-summary.json'), 'w') as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    except OSError as e:
+      self.logger.error(f'{e}')
+
+  def start_fleet_operations(self) -> bool:
+    """
+    Creates all clusters of the manifest and waits for them to finish.
+
+    Returns:
+        bool: True if every cluster was created.
+    """
+    start_time = time.time()
+    print("\nStart Time:", time.strftime("%Y-%m-%d %H:%M:%S\n", time.localtime(start_time)))
+
+    manifest: dict = self.read_manifest()
+    clusters: list[dict] = self.get_clusters(manifest=manifest)
+
+    # logins may prompt, which only works before the clusters run in the background
+    for cloud in sorted({cluster['cloud'] for cluster in clusters}):
+      if not ClusterOperationsManager.check_csp_login(csp=cloud, logger=self.logger):
+        print(f'Session is not logged into {cloud}. Try running Abstrakt after attempting manual login.\n')
+        exit()
+
+    os.makedirs(self.output_dir, exist_ok=True)
+
+    scheduler = FleetScheduler(logger=self.logger, output_dir=self.output_dir,
+                               parallelism=int(self.parallelism or manifest.get('parallelism') or
+                                               FleetScheduler.default_parallelism))
+
+    for cluster in clusters:
+      scheduler.add_cluster(cluster['name'], cluster['type'], self.create_cluster, cluster)
+
+    print(f'Creating {len(clusters)} cluster/s, {scheduler.parallelism} at a time\n')
+
+    results: dict[str, dict] = {}
+
+    try:
+      results = scheduler.run(logger=self.logger)
+    finally:
+      self.write_summary(clusters=clusters, results=results, start_time=start_time)
+
+    end_time = time.time()
+    time_difference = end_time - start_time
+
+    print("End Time:", time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(end_time)))
+    print(f'Total fleet deployment time: {int(int(time_difference) / 60)} '
+          f'minute/s and {int(time_difference) % 60} seconds\n')
+
+    return all(result['status'] == 'succeeded' for result in results.values())
@@ -1,10 +1,11 @@
-import os
 import random
 import string
 
 from abstrakt.pythonModules.multiProcess.multiProcessing import MultiProcessing
+from abstrakt.pythonModules.multiProcess.componentScheduler import ComponentScheduler
 from abstrakt.pythonModules.vendors.cloudServiceProviders.gcp.gcpOps import GCPOps
 from abstrakt.pythonModules.kubernetesOps.kubectlApplyYAMLs import KubectlApplyYAMLs
+from abstrakt.pythonModules.kubernetesOps.helmReleaseIndex import HelmReleaseIndex
 from abstrakt.pythonModules.vendors.cloudServiceProviders.azure.azOps.azOps import AZOps
 from abstrakt.pythonModules.vendors.cloudServiceProviders.aws.awsCli.awsOps import AWSOps
 from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.kpa.KPA import FalconKPA
@@ -19,6 +20,13 @@ from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.detectionsConta
 
 
 class ClusterOperationsManager:
+  # components that need other components running before they are installed
+  component_dependencies: dict[str, list[str]] = {
+    'detections-container': ['falcon-sensor'],
+    'vulnerable-apps': ['falcon-sensor', 'iar'],
+    'misconfigurations': ['kpa']
+  }
+
   @staticmethod
   def check_csp_login(csp, logger):
     cli = AWSOps()
@@ -49,49 +57,74 @@ class ClusterOperationsManager:
 
   @staticmethod
   def get_random_string(logger, length=5):
-    string_file = './abstrakt/conf/aws/eks/string.txt'
-
+    # a new suffix for every cluster, one created before keeps the suffix recorded in its terraform workspace
     try:
-      if os.path.exists(string_file):
-        with open(string_file, 'r') as file:
-          append_string = file.readline()
-          return append_string
-      else:
-        # Use ascii letters and digits for the string pool
-        characters = string.ascii_letters + string.digits
-        # Generate a random string
-        random_string = ''.join(random.choices(characters, k=length))
-
-        with open(string_file, 'w') as file:
-          file.write(f'-{random_string}')
+      # Use ascii letters and digits for the string pool
+      characters = string.ascii_letters + string.digits
+      # Generate a random string
+      random_string = ''.join(random.choices(characters, k=length))
 
-        return f'-{random_string}'
+      return f'-{random_string}'
     except Exception as e:
       logger.error(e)
       return '-qwert'
 
+  def install_components(self, components: dict[str, tuple], cluster_type: str, parallelism: int | None = None,
+                         logger=None) -> dict[str, dict]:
+    """
+    Installs components concurrently along their dependencies.
+
+    Args:
+        components (dict[str, tuple]): Component name to (function, *arguments), e.g.
+                                       {'kac': (self.start_kac_deployment, cluster_name)}.
+        cluster_type (str): Cluster type, e.g. 'eks-fargate'.
+        parallelism (int): Components to install at once.
+        logger: Logger object
+
+    Returns:
+        dict[str, dict]: Component name to its status and duration.
+    """
+    scheduler = ComponentScheduler(logger=logger, parallelism=parallelism)
+
+    for name, (func, *args) in components.items():
+      depends_on: list[str] = list(self.component_dependencies.get(name, []))
+
+      if cluster_type == 'eks-fargate' and name != 'falcon-sensor':
+        # the sidecar injector has to be running first, so that every later pod gets the sensor injected
+        depends_on.append('falcon-sensor')
+
+      scheduler.add_component(name, func, *args, depends_on=depends_on)
+
+    results: dict[str, dict] = scheduler.run(logger=logger)
+
+    # components install in child processes, their helm releases are not in this process' release snapshot
+    HelmReleaseIndex.invalidate()
+
+    return results
+
   @staticmethod
   def start_kpa_deployment(falcon_client_id: str, falcon_client_secret: str, logger):
     # install kubernetes protection agent
     kpa = FalconKPA(falcon_client_id=falcon_client_id,
                     falcon_client_secret=falcon_client_secret,
                     logger=logger)
-    kpa.deploy_falcon_kpa()
+    return kpa.deploy_falcon_kpa()
 
   @staticmethod
   def start_vulnerable_app_deployment(logger):
     # install vulnerable apps
     apps = VulnerableApps(logger=logger)
-    apps.deploy_vulnerable_apps()
+    return apps.deploy_vulnerable_apps()
 
   @staticmethod
   def start_detections_container_deployment(cluster_type, logger):
     # install detections container and generate artificial detections + misconfigurations
     detection_container = DetectionsContainer(logger=logger)
     if cluster_type == 'eks-fargate':
-      detection_container.deploy_detections_containers(cluster_type=cluster_type, mode='sidecar', logger=logger)
+      return detection_container.deploy_detections_containers(cluster_type=cluster_type, mode='sidecar', logger=logger)
     else:
-      detection_container.deploy_detections_containers(cluster_type=cluster_type, mode='daemonset', logger=logger)
+      return detection_container.deploy_detections_containers(cluster_type=cluster_type, mode='daemonset',
+                                                              logger=logger)
 
   @staticmethod
   def generate_misconfigurations(cluster_type, logger):
@@ -108,13 +141,19 @@ class ClusterOperationsManager:
                                          logger=logger)
 
       with MultiProcessing() as mp:
-        mp.execute_with_progress_indicator(yaml_applier.apply_yaml_files, logger, 0.5, 300)
+        status = mp.execute_with_progress_indicator(yaml_applier.apply_yaml_files, logger, 0.5, 300)
       # with MultiThreading() as mt:
       #   mt.run_with_progress_indicator(yaml_applier.apply_yaml_files, 1, 300)
 
+      if status is not True:
+        print('Not all misconfigurations may have been generated. Check log file for details.\n')
+        return False
+
       print('Kubernetes misconfigurations generated successfully. They should appear in console in a few minutes.\n')
+      return True
     except Exception as e:
       print(f'Error: {e}', 'Not all misconfigurations may have been generated. Check log file for details.')
+      return False
 
 
 # class __ClusterOperationsManager:
@@ -6,10 +6,13 @@ class ToTFVars:
     self.logger = logger
 
   def convert_eks_managed_node_to_tfvars(self, cluster_name: str, vpc_name: str, region: str,
-                                         asset_tags: str, parameters, common_tags: dict):
+                                         asset_tags: str, parameters, common_tags: dict,
+                                         tfvars_path: str | None = None):
     self.logger.info('Converting EKS Managed Node configuration file to terraform tfvars file')
 
-    with open("./abstrakt/terraformModules/aws/eks/eks-managed-node/variables.tfvars", "w") as tfvars_file:
+    tfvars_path: str = tfvars_path or "./abstrakt/terraformModules/aws/eks/eks-managed-node/variables.tfvars"
+
+    with open(tfvars_path, "w") as tfvars_file:
       for key, value in parameters.items():
         if key == 'random_string' and value == 'no':
           tfvars_file.write(f'{key} = ""\n')
@@ -47,10 +50,13 @@ class ToTFVars:
     self.logger.info('Finished converting EKS Managed Node configuration file to terraform tfvars file')
 
   def convert_eks_fargate_to_tfvars(self, cluster_name: str, vpc_name: str, region: str,
-                                    asset_tags: str, terraform_variables: dict, common_tags: dict):
+                                    asset_tags: str, terraform_variables: dict, common_tags: dict,
+                                    tfvars_path: str | None = None):
     self.logger.info('Converting EKS Fargate configuration file to terraform tfvars file')
 
-    with open("./abstrakt/terraformModules/aws/eks/eks-fargate/variables.tfvars", "w") as tfvars_file:
+    tfvars_path: str = tfvars_path or "./abstrakt/terraformModules/aws/eks/eks-fargate/variables.tfvars"
+
+    with open(tfvars_path, "w") as tfvars_file:
       for key, value in terraform_variables.items():
         if key == 'random_string' and value == 'no':
           tfvars_file.write(f'{key} = ""\n')
@@ -85,10 +91,13 @@ class ToTFVars:
     self.logger.info('Finished converting EKS Fargate configuration file to terraform tfvars file')
 
   def convert_gke_standard_to_tfvars(self, cluster_name: str, vpc_network: str, region: str,
-                                     asset_tags: str, terraform_variables, project_id):
+                                     asset_tags: str, terraform_variables, project_id,
+                                     tfvars_path: str | None = None):
     self.logger.info('Converting GKE Standard configuration file to terraform tfvars file')
 
-    with open("./abstrakt/terraformModules/gcp/gke/standard/variables.tfvars", "w") as tfvars_file:
+    tfvars_path: str = tfvars_path or "./abstrakt/terraformModules/gcp/gke/standard/variables.tfvars"
+
+    with open(tfvars_path, "w") as tfvars_file:
       for key, value in terraform_variables.items():
         if value.lower() in ["true", "false"]:
           tfvars_file.write(f'{key} = {value.lower()}\n')
@@ -130,10 +139,12 @@ class ToTFVars:
     self.logger.info('Finished converting GKE Standard configuration file to terraform tfvars file')
 
   def convert_gke_autopilot_to_tfvars(self, cluster_name: str, vpc_network: str, region: str,
-                                      terraform_variables, project_id):
+                                      terraform_variables, project_id, tfvars_path: str | None = None):
     self.logger.info('Converting GKE Autopilot configuration file to terraform tfvars file')
 
-    with open("./abstrakt/terraformModules/gcp/gke/autopilot/variables.tfvars", "w") as tfvars_file:
+    tfvars_path: str = tfvars_path or "./abstrakt/terraformModules/gcp/gke/autopilot/variables.tfvars"
+
+    with open(tfvars_path, "w") as tfvars_file:
       for key, value in terraform_variables.items():
         if value.lower() in ["true", "false"]:
           tfvars_file.write(f'{key} = {value.lower()}\n')
@@ -164,10 +175,12 @@ class ToTFVars:
     self.logger.info('Finished converting GKE Autopilot configuration file to terraform tfvars file')
 
   def convert_aks_to_tfvars(self, cluster_name: str, rg_name: str, rg_location: str, asset_tags: str,
-                            terraform_variables, common_tags):
+                            terraform_variables, common_tags, tfvars_path: str | None = None):
     self.logger.info('Converting AKS configuration file to terraform tfvars file')
 
-    with open("./abstrakt/terraformModules/azure/aks/variables.tfvars", "w") as tfvars_file:
+    tfvars_path: str = tfvars_path or "./abstrakt/terraformModules/azure/aks/variables.tfvars"
+
+    with open(tfvars_path, "w") as tfvars_file:
       for key, value in terraform_variables.items():
         if value.lower() in ["true", "false"]:
           tfvars_file.write(f'{key} = {value.lower()}\n')
@@ -199,10 +212,12 @@ class ToTFVars:
 
     self.logger.info('Finished converting AKS configuration file to terraform tfvars file')
 
-  def convert_aci_to_tfvars(self, terraform_variables):
+  def convert_aci_to_tfvars(self, terraform_variables, tfvars_path: str | None = None):
     self.logger.info('Converting ACI configuration file to terraform tfvars file')
 
-    with open("./abstrakt/terraformModules/azure/aci/variables.tfvars", "w") as tfvars_file:
+    tfvars_path: str = tfvars_path or "./abstrakt/terraformModules/azure/aci/variables.tfvars"
+
+    with open(tfvars_path, "w") as tfvars_file:
       for key, value in terraform_variables.items():
         if value.lower() in ["true", "false"]:
           tfvars_file.write(f'{key} = {value.lower()}\n')
@@ -1,3 +1,6 @@
+import os
+import json
+import time
 import subprocess
 import threading
 import re
@@ -5,11 +8,40 @@ import re
 # from abstrakt.pythonModules.multiThread.multithreading import MultiThreading
 from abstrakt.pythonModules.multiProcess.multiProcessing import MultiProcessing
 from abstrakt.pythonModules.pythonOps.customPrint.customPrint import printf
+from abstrakt.pythonModules.terraformOps.terraformStream import TerraformStream
+from abstrakt.pythonModules.terraformOps.terraformFingerprint import TerraformFingerprint
+from abstrakt.pythonModules.terraformOps.terraformPluginCache import TerraformPluginCache
+from abstrakt.pythonModules.terraformOps.terraformParallelism import TerraformParallelism
 
 
 class ExecuteTerraform:
-  def __init__(self, logger):
+  """
+  Runs terraform get, init, plan, apply and destroy for a module, optionally inside a TerraformWorkspace.
+
+  A plan with changes is saved and apply runs exactly that plan, so the cluster is not refreshed and planned a
+  second time. When the state was written less than ABSTRAKT_TF_REFRESH_TTL seconds ago (default 300, 0 to always
+  refresh) the plan also skips the refresh of every resource. Plan, apply and destroy stream terraform's -json
+  output, show the resources being changed live and save how long each resource took in timings-<command>.json.
+  When tfvars, module sources, lock file and state are unchanged since the last apply, get, init and plan are
+  skipped altogether; set ABSTRAKT_TF_VERIFY_DRIFT=1 to confirm that with a refresh-only plan first.
+  Apply and destroy run with the given parallelism (ABSTRAKT_TF_PARALLELISM if none is given), a number or 'auto'
+  to size it from the plan and back off when the cloud APIs throttle.
+  """
+
+  default_refresh_ttl: int = 300
+  max_throttling_retries: int = 2
+
+  def __init__(self, logger, parallelism: int | str | None = None):
     self.logger = logger
+    self.plugin_cache = TerraformPluginCache(logger=logger)
+    self.refresh_ttl: int = int(os.environ.get('ABSTRAKT_TF_REFRESH_TTL', self.default_refresh_ttl))
+    self.saved_plan: str | None = None
+    self.fingerprint = TerraformFingerprint(logger=logger)
+    self.verify_drift: bool = os.environ.get('ABSTRAKT_TF_VERIFY_DRIFT', '0').lower() in ('1', 'true', 'yes')
+    self.unchanged: dict[str, bool] = {}
+    self.parallelism = TerraformParallelism(logger=logger,
+                                            parallelism=parallelism or os.environ.get('ABSTRAKT_TF_PARALLELISM'))
+    self.planned_resources: int = 0
 
   @staticmethod
   def read_stream(stream, logger):
@@ -22,13 +54,14 @@ class ExecuteTerraform:
       cleaned_line = re.sub(ansi_escape_pattern, '', line)
       logger.info(cleaned_line)
 
-  def terraform_process_execution(self, command, path, logger=None):
+  def terraform_process_execution(self, command, path, env=None, logger=None):
     logger = logger or self.logger
 
     try:
       process = subprocess.Popen(
         command,
         cwd=path,
+        env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True
@@ -56,100 +89,322 @@ class ExecuteTerraform:
       logger.info(e)
       return False
 
-  def check_for_changes(self, command, path, logger):
+  @staticmethod
+  def get_workspace_options(workspace=None) -> list[str]:
+    # without a workspace, tfvars and state are the ones in the module directory itself
+    if workspace is None:
+      return ['-var-file=variables.tfvars']
+
+    return [f'-var-file={workspace.tfvars_path}', f'-state={workspace.state_path}']
+
+  def get_environment(self, workspace=None) -> dict:
+    return {**(workspace.get_environment() if workspace else os.environ), **self.plugin_cache.get_environment()}
+
+  def execute_multi_thread(self, command, path, logger, workspace=None):
+    terraform_command = " ".join(command)
+    env = self.get_environment(workspace=workspace)
+
+    # with MultiThreading() as mt:
+    with MultiProcessing() as mp:
+      printf(f'Executing {terraform_command}', logger=logger)
+
+      # if mt.run_with_progress_indicator(self.terraform_process_execution, 1, command, path):
+      if mp.execute_with_progress_indicator(self.terraform_process_execution, logger, 0.5, 1800, command, path,
+                                            env):
+        printf(f'{terraform_command} successfully executed\n', logger=logger)
+        return True
+      else:
+        printf(f'{terraform_command} execution failed\n', logger=logger)
+        return False
+
+  def execute_terraform_stream(self, command, path, workspace=None, logger=None) -> TerraformStream:
+    """
+    Runs a terraform command with -json output and follows its events while it runs.
+
+    Returns:
+        TerraformStream: Change summary, per-resource durations, diagnostics and return code of the command.
+    """
     logger = logger or self.logger
 
+    terraform_command: str = ' '.join(command)
+    stream = TerraformStream(logger=logger)
+
+    printf(f'Executing {terraform_command}', logger=logger)
+
     try:
-      # Run 'terraform plan' and capture the output
-      process = subprocess.run(
-        command,
-        cwd=path,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-      )
+      process = subprocess.Popen(command, cwd=path, env=self.get_environment(workspace=workspace),
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+      stderr_thread = threading.Thread(target=self.read_stream, args=(process.stderr, logger))
+      stderr_thread.start()
+
+      for line in process.stdout:
+        stream.feed(line)
+
+      stream.returncode = process.wait()
+      stderr_thread.join()
+    except (subprocess.SubprocessError, Exception) as e:
+      logger.error(f'{e}')
+      stream.returncode = 1
+
+    stream.clear_status()
+
+    if stream.succeeded:
+      printf(f'{terraform_command} successfully executed\n', logger=logger)
+    else:
+      printf(f'{terraform_command} execution failed\n', logger=logger)
+
+    return stream
+
+  def save_timings(self, stream: TerraformStream, operation: str, path, workspace=None):
+    timings_path: str = os.path.join(workspace.path if workspace else path, f'timings-{operation}.json')
+
+    try:
+      with open(timings_path, 'w') as timings_file:
+        json.dump({'finished': time.strftime('%Y-%m-%dT%H:%M:%S'), **stream.get_timings()}, timings_file, indent=2)
+    except OSError as e:
+      self.logger.error(f'{e}')
+
+    for address, resource in stream.get_slowest_resources(count=len(stream.resources)):
+      self.logger.info(f"{operation} {address}: {resource['status']} in {resource['duration']:.0f}s")
+
+    stream.print_timings()
+
+  @staticmethod
+  def get_data_dir(path, workspace=None) -> str:
+    return workspace.data_dir if workspace else os.path.join(path, '.terraform')
+
+  def is_initialised(self, path, workspace=None) -> bool:
+    data_dir: str = self.get_data_dir(path=path, workspace=workspace)
+
+    return self.plugin_cache.is_initialised(module_path=path, data_dir=data_dir)
+
+  @staticmethod
+  def get_record_dir(path, workspace=None) -> str:
+    return workspace.path if workspace else path
+
+  def get_fingerprint_paths(self, path, workspace=None) -> dict[str, str]:
+    return {'module_path': path,
+            'tfvars_path': workspace.tfvars_path if workspace else os.path.join(path, 'variables.tfvars'),
+            'state_path': self.get_state_path(path=path, workspace=workspace),
+            'data_dir': self.get_data_dir(path=path, workspace=workspace)}
+
+  def record_fingerprint(self, path, workspace=None):
+    record_dir: str = self.get_record_dir(path=path, workspace=workspace)
+
+    self.fingerprint.record(record_dir=record_dir, **self.get_fingerprint_paths(path=path, workspace=workspace))
+    self.unchanged.pop(record_dir, None)
+
+  def has_drifted(self, path, workspace=None) -> bool:
+    command = (['terraform', 'plan', '-refresh-only', '-json'] + self.get_workspace_options(workspace=workspace) +
+               ['-input=false'])
+
+    stream: TerraformStream = self.execute_terraform_stream(command=command, path=path, workspace=workspace)
 
-      # Log stdout and stderr
-      if process.stdout:
-        logger.info(process.stdout)
-      if process.stderr:
-        logger.info(process.stderr)
+    if stream.drifted_resources:
+      printf(f'{len(stream.drifted_resources)} resource/s changed outside terraform', logger=self.logger)
 
-      # Check if 'terraform plan' failed
-      if process.returncode != 0:
-        printf("\nCommand 'terraform plan' failed\n", logger=logger)
-        return 0
+    return not stream.succeeded or bool(stream.drifted_resources)
 
-      # Search for 'No changes.' in the output
-      if "No changes." in process.stdout:
-        print('\nNo changes detected. Skipping apply', end='')
-        return 2
+  def is_unchanged(self, path, workspace=None) -> bool:
+    """
+    Tells whether the last apply of this module and workspace is still current, checked once per run.
+    """
+    record_dir: str = self.get_record_dir(path=path, workspace=workspace)
 
-      # Find the line containing "Plan:"
-      plan_line = [line for line in process.stdout.split('\n') if "Plan:" in line]
+    if record_dir not in self.unchanged:
+      unchanged: bool = self.fingerprint.is_current(record_dir=record_dir,
+                                                    **self.get_fingerprint_paths(path=path, workspace=workspace))
 
-      if plan_line:
-        # Extract numbers from the plan_line
-        to_add, to_change, to_destroy = [int(num) for num in plan_line[0].split() if num.isdigit()]
-        logger.info(f'Terraform Plan - To Add: {to_add}, To Change: {to_change}, To Destroy: {to_destroy}')
+      if unchanged and self.verify_drift:
+        unchanged = not self.has_drifted(path=path, workspace=workspace)
 
-        if to_add > 0 or to_change > 0 or to_destroy > 0:
-          logger.info("Changes detected. Applying changes.")
-          return 1
+      if unchanged:
+        printf('Terraform configuration and state are unchanged since the last apply, skipping get, init and plan\n',
+               logger=self.logger)
 
-      logger.info('\nNo changes detected. Skipping apply')
+      self.unchanged[record_dir] = unchanged
+
+    return self.unchanged[record_dir]
+
+  def execute_terraform_get(self, path, workspace=None):
+    if self.is_unchanged(path=path, workspace=workspace):
+      return True
+
+    if self.is_initialised(path=path, workspace=workspace):
+      printf('Terraform modules and providers are unchanged since the last init, skipping get and init\n',
+             logger=self.logger)
+      return True
+
+    command = ['terraform', 'get']
+
+    return True if self.execute_multi_thread(command=command, path=path, logger=self.logger,
+                                             workspace=workspace) else False
+
+  def execute_terraform_init(self, path, workspace=None):
+    if self.is_unchanged(path=path, workspace=workspace):
+      return True
+
+    if self.is_initialised(path=path, workspace=workspace):
+      self.logger.info(f'Skipping terraform init of {path}, nothing changed since the last init')
+      return True
+
+    with self.plugin_cache.lock():
+      command = ['terraform', 'init', '-input=false'] + self.plugin_cache.get_init_options(module_path=path)
+
+      if not self.execute_multi_thread(command=command, path=path, logger=self.logger, workspace=workspace):
+        return False
+
+      self.plugin_cache.record_init(module_path=path, data_dir=self.get_data_dir(path=path, workspace=workspace))
+
+    return True
+
+  @staticmethod
+  def get_plan_path(path, workspace=None) -> str:
+    return os.path.join(workspace.path if workspace else path, 'tfplan')
+
+  @staticmethod
+  def get_state_path(path, workspace=None) -> str:
+    return workspace.state_path if workspace else os.path.join(path, 'terraform.tfstate')
+
+  def is_recently_refreshed(self, path, workspace=None) -> bool:
+    # the state file is rewritten, and so its resources refreshed, by every apply
+    state_path: str = self.get_state_path(path=path, workspace=workspace)
+
+    return (self.refresh_ttl > 0 and os.path.exists(state_path) and
+            time.time() - os.path.getmtime(state_path) < self.refresh_ttl)
+
+  def remove_saved_plan(self):
+    if self.saved_plan and os.path.exists(self.saved_plan):
+      os.remove(self.saved_plan)
+
+    self.saved_plan = None
+
+  def execute_terraform_plan(self, path, workspace=None):
+    if self.is_unchanged(path=path, workspace=workspace):
       return 2
-    except Exception as e:
-      logger.error(f"An error occurred: {e}")
+
+    plan_path: str = self.get_plan_path(path=path, workspace=workspace)
+
+    command = ['terraform', 'plan'] + self.get_workspace_options(workspace=workspace) + [f'-out={plan_path}']
+
+    if self.is_recently_refreshed(path=path, workspace=workspace):
+      self.logger.info(f'State was written less than {self.refresh_ttl} seconds ago, planning without refresh')
+      command.append('-refresh=false')
+
+    self.remove_saved_plan()
+
+    stream: TerraformStream = self.execute_terraform_stream(command=command + ['-json'], path=path,
+                                                            workspace=workspace)
+
+    # only a plan with changes is kept for apply
+    self.saved_plan = plan_path
+
+    if not stream.succeeded:
+      self.remove_saved_plan()
       return 0
 
-  def execute_multi_thread(self, command, path, logger):
-    terraform_command = " ".join(command)
+    changes: dict = stream.change_summary or {}
+    self.planned_resources = sum(changes.get(kind, 0) for kind in ('add', 'change', 'remove', 'import'))
+    self.logger.info(f"Terraform Plan - To Add: {changes.get('add', 0)}, To Change: {changes.get('change', 0)}, "
+                     f"To Destroy: {changes.get('remove', 0)}")
 
-    # with MultiThreading() as mt:
-    with MultiProcessing() as mp:
-      printf(f'Executing {terraform_command}', logger=logger)
+    if not stream.has_changes:
+      print('No changes detected. Skipping apply\n')
+      self.remove_saved_plan()
+      self.record_fingerprint(path=path, workspace=workspace)
+      return 2
 
-      if command[1] == 'plan':
-        # status = mt.run_with_progress_indicator(self.check_for_changes, 1, command, path)
-        status = mp.execute_with_progress_indicator(self.check_for_changes, logger, 0.5, 1800, command, path)
+    return 1
 
-        if status == 0:
-          printf(f'{terraform_command} execution failed\n', logger=logger)
-        else:
-          printf(f'{terraform_command} successfully executed\n', logger=logger)
+  def get_state_resource_count(self, path, workspace=None) -> int:
+    try:
+      with open(self.get_state_path(path=path, workspace=workspace), 'r') as state_file:
+        return sum(len(resource.get('instances', [])) for resource in json.load(state_file).get('resources', []))
+    except (OSError, ValueError):
+      return 0
 
-        return status
-      else:
-        # if mt.run_with_progress_indicator(self.terraform_process_execution, 1, command, path):
-        if mp.execute_with_progress_indicator(self.terraform_process_execution, logger, 0.5, 1800, command, path):
-          printf(f'{terraform_command} successfully executed\n', logger=logger)
-          return True
-        else:
-          printf(f'{terraform_command} execution failed\n', logger=logger)
-          return False
-
-  def execute_terraform_get(self, path):
-    command = ['terraform', 'get']
+  def execute_with_parallelism(self, get_command, operation: str, planned_resources: int, path,
+                               workspace=None) -> TerraformStream:
+    """
+    Runs apply or destroy with the chosen -parallelism and, in auto mode, retries it with half the parallelism
+    while it fails on cloud API throttling.
+
+    Args:
+        get_command: Called with the attempt number and the parallelism (None for terraform's default), returns
+          the command to run.
+        operation: 'apply' or 'destroy'.
+        planned_resources: Number of resources the operation changes.
+        path: Terraform module directory.
+        workspace: TerraformWorkspace of the cluster, if any.
+
+    Returns:
+        TerraformStream: Stream of the last attempt.
+    """
+    parallelism: int | None = self.parallelism.get_parallelism(module_path=path, planned_resources=planned_resources)
+    attempt: int = 0
+
+    while True:
+      stream: TerraformStream = self.execute_terraform_stream(command=get_command(attempt, parallelism), path=path,
+                                                              workspace=workspace)
+
+      if not self.parallelism.is_auto:
+        return stream
+
+      throttled: bool = self.parallelism.is_throttled(diagnostics=stream.diagnostics)
+      self.parallelism.update_history(module_path=path, parallelism=parallelism, throttled=throttled)
+
+      backoff: int | None = self.parallelism.get_backoff(parallelism=parallelism)
 
-    return True if self.execute_multi_thread(command=command, path=path, logger=self.logger) else False
+      if stream.succeeded or not throttled or backoff is None or attempt >= self.max_throttling_retries:
+        return stream
 
-  def execute_terraform_init(self, path):
-    command = ['terraform', 'init', '-input=false']
+      attempt += 1
+      printf(f'Terraform {operation} was throttled by the cloud provider API, retrying with parallelism {backoff}',
+             logger=self.logger)
+      parallelism = backoff
 
-    return True if self.execute_multi_thread(command=command, path=path, logger=self.logger) else False
+  def execute_terraform_apply(self, path, workspace=None):
+    saved_plan: str | None = self.saved_plan if self.saved_plan and os.path.exists(self.saved_plan) else None
+
+    def get_command(attempt: int, parallelism: int | None) -> list[str]:
+      options: list[str] = [f'-parallelism={parallelism}'] if parallelism else []
+
+      # the saved plan is stale once an attempt changed the state, retries plan again
+      if saved_plan and attempt == 0:
+        # variables are part of the saved plan and must not be given again
+        state_options: list[str] = [f'-state={workspace.state_path}'] if workspace else []
+
+        return ['terraform', 'apply', '-auto-approve', '-json'] + state_options + options + [saved_plan]
+
+      return (['terraform', 'apply'] + self.get_workspace_options(workspace=workspace) +
+              ['-auto-approve', '-json'] + options)
+
+    try:
+      stream: TerraformStream = self.execute_with_parallelism(get_command=get_command, operation='apply',
+                                                              planned_resources=self.planned_resources, path=path,
+                                                              workspace=workspace)
+      self.save_timings(stream=stream, operation='apply', path=path, workspace=workspace)
 
-  def execute_terraform_plan(self, path):
-    command = ['terraform', 'plan', '-var-file=variables.tfvars']
+      if stream.succeeded:
+        self.record_fingerprint(path=path, workspace=workspace)
 
-    return self.execute_multi_thread(command=command, path=path, logger=self.logger)
+      return stream.succeeded
+    finally:
+      # a saved plan is stale once applied, or once apply failed half way
+      self.remove_saved_plan()
 
-  def execute_terraform_apply(self, path):
-    command = ['terraform', 'apply', '-var-file=variables.tfvars', '-auto-approve']
+  def execute_terraform_destroy(self, path, workspace=None):
+    def get_command(_attempt: int, parallelism: int | None) -> list[str]:
+      return (['terraform', 'destroy'] + self.get_workspace_options(workspace=workspace) +
+              ['-auto-approve', '-json'] + ([f'-parallelism={parallelism}'] if parallelism else []))
 
-    return True if self.execute_multi_thread(command=command, path=path, logger=self.logger) else False
+    stream: TerraformStream = self.execute_with_parallelism(
+      get_command=get_command, operation='destroy', path=path, workspace=workspace,
+      planned_resources=self.get_state_resource_count(path=path, workspace=workspace))
+    self.save_timings(stream=stream, operation='destroy', path=path, workspace=workspace)
 
-  def execute_terraform_destroy(self, path):
-    command = ['terraform', 'destroy', '-var-file=variables.tfvars', '-auto-approve']
+    self.fingerprint.remove(record_dir=self.get_record_dir(path=path, workspace=workspace))
+    self.unchanged.pop(self.get_record_dir(path=path, workspace=workspace), None)
 
-    return True if self.execute_multi_thread(command=command, path=path, logger=self.logger) else False
+    return stream.succeeded
@@ -0,0 +1,101 @@
+import os
+import json
+import hashlib
+
+
+class TerraformFingerprint:
+  """
+  Hash of everything a terraform apply of a module depends on.
+
+  The fingerprint covers the rendered tfvars, the module sources (including local modules it calls), the provider
+  lock file and the serial and lineage of the state. It is stored after every successful apply, and after every
+  plan that found nothing to change. While a run computes the same fingerprint, the cluster is exactly what
+  terraform would produce again, so get, init and plan can be skipped.
+  """
+
+  record_file: str = '.abstrakt-fingerprint.json'
+
+  def __init__(self, logger):
+    self.logger = logger
+
+  @staticmethod
+  def hash_file(digest, file_path: str):
+    if os.path.exists(file_path):
+      digest.update(os.path.basename(file_path).encode())
+
+      with open(file_path, 'rb') as source_file:
+        digest.update(source_file.read())
+
+  def hash_module(self, digest, module_path: str):
+    for name in sorted(os.listdir(module_path)):
+      if name.endswith('.tf') or name == '.terraform.lock.hcl':
+        self.hash_file(digest=digest, file_path=os.path.join(module_path, name))
+
+  @staticmethod
+  def get_local_modules(module_path: str, data_dir: str) -> list[str]:
+    # local module calls are not copied by init, they are read from their source directory on every plan
+    try:
+      with open(os.path.join(data_dir, 'modules', 'modules.json'), 'r') as manifest_file:
+        modules: list = json.load(manifest_file).get('Modules', [])
+    except (OSError, ValueError):
+      return []
+
+    return sorted({os.path.normpath(os.path.join(module_path, module['Dir'])) for module in modules
+                   if module.get('Key') and module.get('Source', '').startswith('.')})
+
+  @staticmethod
+  def get_state_version(state_path: str) -> dict | None:
+    try:
+      with open(state_path, 'r') as state_file:
+        state: dict = json.load(state_file)
+    except (OSError, ValueError):
+      return None
+
+    return {'serial': state.get('serial'), 'lineage': state.get('lineage')}
+
+  def get_fingerprint(self, module_path: str, tfvars_path: str, state_path: str, data_dir: str) -> str | None:
+    """
+    Returns the fingerprint, or None if the module was never applied.
+    """
+    state_version: dict | None = self.get_state_version(state_path=state_path)
+
+    if state_version is None:
+      return None
+
+    digest = hashlib.sha256(json.dumps(state_version, sort_keys=True).encode())
+
+    self.hash_file(digest=digest, file_path=tfvars_path)
+    self.hash_module(digest=digest, module_path=module_path)
+
+    for local_module in self.get_local_modules(module_path=module_path, data_dir=data_dir):
+      if os.path.isdir(local_module):
+        self.hash_module(digest=digest, module_path=local_module)
+
+    return digest.hexdigest()
+
+  def is_current(self, record_dir: str, **paths) -> bool:
+    try:
+      with open(os.path.join(record_dir, self.record_file), 'r') as record_file:
+        recorded: dict = json.load(record_file)
+    except (OSError, ValueError):
+      return False
+
+    fingerprint: str | None = self.get_fingerprint(**paths)
+
+    return fingerprint is not None and recorded.get('fingerprint') == fingerprint
+
+  def record(self, record_dir: str, **paths):
+    fingerprint: str | None = self.get_fingerprint(**paths)
+
+    if fingerprint is None:
+      return
+
+    try:
+      with open(os.path.join(record_dir, self.record_file), 'w') as record_file:
+        json.dump({'fingerprint': fingerprint}, record_file)
+    except OSError as e:
+      self.logger.error(f'{e}')
+
+  def remove(self, record_dir: str):
+    if os.path.exists(os.path.join(record_dir, self.record_file)):
+      os.remove(os.path.join(record_dir, self.record_file))
@@ -0,0 +1,114 @@
+import os
+import re
+import json
+import fcntl
+
+
+class TerraformParallelism:
+  """
+  Chooses terraform's -parallelism for a module.
+
+  A fixed value is passed through as is. In auto mode the value grows with the number of resources to change,
+  from terraform's default of 10 up to 32, and is capped by what the cloud APIs tolerated before: when throttling
+  diagnostics (rate exceeded, too many requests, ...) show up in an apply or destroy, half of the parallelism in
+  use becomes the cap for that module and the operation is retried with it. Every run without throttling raises the
+  cap again by 2. The caps are kept in $XDG_CACHE_HOME/abstrakt/terraform-parallelism.json.
+  """
+
+  default_parallelism: int = 10
+  max_parallelism: int = 32
+  min_parallelism: int = 2
+
+  throttling_pattern = re.compile(r'throttl|rate ?exceeded|rate limit|ratelimit|too ?many ?requests|\b429\b|'
+                                  r'requestlimitexceeded|slow ?down|quota exceeded', re.IGNORECASE)
+
+  def __init__(self, logger, parallelism: int | str | None = None, history_path: str | None = None):
+    self.logger = logger
+    self.parallelism: int | str | None = self.parse_parallelism(parallelism)
+
+    self.history_path: str = history_path or os.path.join(
+      os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'abstrakt', 'terraform-parallelism.json')
+
+  def parse_parallelism(self, parallelism: int | str | None) -> int | str | None:
+    if parallelism is None or str(parallelism).strip().lower() == 'auto':
+      return None if parallelism is None else 'auto'
+
+    try:
+      if int(parallelism) > 0:
+        return int(parallelism)
+    except ValueError:
+      pass
+
+    self.logger.error(f"Invalid terraform parallelism '{parallelism}', expected a positive number or auto. "
+                      f"Using terraform's default.")
+    return None
+
+  @property
+  def is_auto(self) -> bool:
+    return str(self.parallelism).lower() == 'auto'
+
+  @staticmethod
+  def get_module_key(module_path: str) -> str:
+    return os.path.normpath(os.path.abspath(module_path))
+
+  def load_history(self) -> dict[str, dict]:
+    try:
+      with open(self.history_path, 'r') as history_file:
+        return json.load(history_file)
+    except (OSError, ValueError):
+      return {}
+
+  def update_history(self, module_path: str, parallelism: int, throttled: bool):
+    os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+
+    # fleets of concurrent runs share the file
+    with open(f'{self.history_path}.lock', 'w') as lock_file:
+      fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+      history: dict[str, dict] = self.load_history()
+      entry: dict = history.get(self.get_module_key(module_path), {})
+
+      if throttled:
+        entry['cap'] = max(self.min_parallelism, parallelism // 2)
+        entry['throttled_runs'] = entry.get('throttled_runs', 0) + 1
+      elif 'cap' in entry:
+        entry['cap'] += 2
+
+        if entry['cap'] >= self.max_parallelism:
+          entry.pop('cap')
+
+      history[self.get_module_key(module_path)] = entry
+
+      with open(self.history_path, 'w') as history_file:
+        json.dump(history, history_file, indent=2)
+
+  def get_parallelism(self, module_path: str, planned_resources: int = 0) -> int | None:
+    """
+    Returns the -parallelism to use, or None to leave terraform's default.
+    """
+    if not self.parallelism:
+      return None
+
+    if not self.is_auto:
+      return self.parallelism
+
+    parallelism: int = min(self.max_parallelism, max(self.default_parallelism, planned_resources // 3))
+
+    cap: int | None = self.load_history().get(self.get_module_key(module_path), {}).get('cap')
+    if cap:
+      parallelism = min(parallelism, cap)
+
+    self.logger.info(f'Terraform parallelism {parallelism} for {planned_resources} planned resource/s of '
+                     f'{module_path}' + (f', capped at {cap} after earlier throttling' if cap else ''))
+
+    return parallelism
+
+  def get_backoff(self, parallelism: int) -> int | None:
+    # None once there is nothing left to back off to
+    backoff: int = max(self.min_parallelism, parallelism // 2)
+
+    return backoff if backoff < parallelism else None
+
+  def is_throttled(self, diagnostics: list[dict]) -> bool:
+    return any(self.throttling_pattern.search(f"{diagnostic.get('summary', '')} {diagnostic.get('detail', '')}")
+               for diagnostic in diagnostics)
@@ -0,0 +1,94 @@
+import os
+import json
+import fcntl
+import hashlib
+import contextlib
+
+
+class TerraformPluginCache:
+  """
+  Provider plugins shared by every terraform module and workspace, and the record of their last init.
+
+  Providers are downloaded once into $XDG_CACHE_HOME/abstrakt/terraform-plugins (or
+  ~/.cache/abstrakt/terraform-plugins, ABSTRAKT_TF_PLUGIN_CACHE to override, an existing TF_PLUGIN_CACHE_DIR wins)
+  and linked from there into each data directory. The first init of a module writes its .terraform.lock.hcl,
+  later inits only read it, so every cluster of a module runs the same provider versions. After a successful init
+  a fingerprint of the module files, the lock file and the data directory is stored; 'terraform get' and
+  'terraform init' are skipped while it still matches.
+  """
+
+  fingerprint_file: str = 'abstrakt-init.json'
+
+  def __init__(self, logger, cache_dir: str | None = None):
+    self.logger = logger
+
+    self.cache_dir: str = (cache_dir or os.environ.get('TF_PLUGIN_CACHE_DIR') or
+                           os.environ.get('ABSTRAKT_TF_PLUGIN_CACHE') or
+                           os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                                        'abstrakt', 'terraform-plugins'))
+
+  def get_environment(self) -> dict[str, str]:
+    os.makedirs(self.cache_dir, exist_ok=True)
+
+    return {'TF_PLUGIN_CACHE_DIR': self.cache_dir}
+
+  @contextlib.contextmanager
+  def lock(self):
+    # terraform does not guard the plugin cache or the lock file against concurrent inits
+    os.makedirs(self.cache_dir, exist_ok=True)
+
+    with open(os.path.join(self.cache_dir, '.abstrakt.lock'), 'w') as lock_file:
+      fcntl.flock(lock_file, fcntl.LOCK_EX)
+      yield
+
+  @staticmethod
+  def get_lock_file_path(module_path: str) -> str:
+    return os.path.join(module_path, '.terraform.lock.hcl')
+
+  def get_init_options(self, module_path: str) -> list[str]:
+    # the providers of a module are pinned by its lock file as soon as one exists
+    return ['-lockfile=readonly'] if os.path.exists(self.get_lock_file_path(module_path=module_path)) else []
+
+  def get_fingerprint(self, module_path: str, data_dir: str) -> str | None:
+    """
+    Returns a hash of everything 'terraform init' depends on, or None if the module was never initialised.
+    """
+    if not os.path.isdir(data_dir):
+      return None
+
+    digest = hashlib.sha256()
+
+    for name in sorted(os.listdir(module_path)):
+      if name.endswith('.tf') or name == '.terraform.lock.hcl':
+        with open(os.path.join(module_path, name), 'rb') as module_file:
+          digest.update(name.encode())
+          digest.update(module_file.read())
+
+    modules_manifest: str = os.path.join(data_dir, 'modules', 'modules.json')
+    if os.path.exists(modules_manifest):
+      with open(modules_manifest, 'rb') as manifest_file:
+        digest.update(manifest_file.read())
+
+    for root, _, files in sorted(os.walk(os.path.join(data_dir, 'providers'))):
+      for name in sorted(files):
+        digest.update(os.path.relpath(os.path.join(root, name), data_dir).encode())
+
+    return digest.hexdigest()
+
+  def is_initialised(self, module_path: str, data_dir: str) -> bool:
+    try:
+      with open(os.path.join(data_dir, self.fingerprint_file), 'r') as fingerprint_file:
+        recorded: dict = json.load(fingerprint_file)
+    except (OSError, ValueError):
+      return False
+
+    return recorded.get('fingerprint') == self.get_fingerprint(module_path=module_path, data_dir=data_dir)
+
+  def record_init(self, module_path: str, data_dir: str):
+    fingerprint: str | None = self.get_fingerprint(module_path=module_path, data_dir=data_dir)
+
+    if fingerprint is None:
+      return
+
+    with open(os.path.join(data_dir, self.fingerprint_file), 'w') as fingerprint_file:
+      json.dump({'module_path': os.path.abspath(module_path), 'fingerprint': fingerprint}, fingerprint_file)
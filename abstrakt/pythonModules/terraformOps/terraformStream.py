@@ -0,0 +1,159 @@
+import sys
+import json
+import time
+import shutil
+
+
+class TerraformStream:
+  """
+  Incremental reader of the machine-readable output of 'terraform plan|apply|destroy -json'.
+
+  Every line is one event. Resource start, progress and completion events drive a live status line with the
+  resources currently being changed and how long each has been running, completed resources are printed with
+  their duration, and diagnostics are printed as they arrive. The planned change summary, the per-resource
+  durations and all diagnostics stay available once the command has finished.
+  """
+
+  present_tense: dict[str, str] = {'create': 'Creating', 'update': 'Updating', 'replace': 'Replacing',
+                                   'delete': 'Destroying', 'read': 'Reading'}
+  past_tense: dict[str, str] = {'create': 'Created', 'update': 'Updated', 'replace': 'Replaced',
+                                'delete': 'Destroyed', 'read': 'Read'}
+
+  def __init__(self, logger, interactive: bool | None = None):
+    self.logger = logger
+    self.interactive: bool = sys.stdout.isatty() if interactive is None else interactive
+
+    self.running: dict[str, dict] = {}
+    self.resources: dict[str, dict] = {}
+    self.diagnostics: list[dict] = []
+    self.change_summary: dict | None = None
+    self.planned_changes: int = 0
+    self.drifted_resources: list[str] = []
+    self.start_time: float = time.time()
+    self.returncode: int | None = None
+
+  @staticmethod
+  def format_duration(seconds: float) -> str:
+    return f'{int(seconds) // 60}m{int(seconds) % 60:02d}s'
+
+  @property
+  def succeeded(self) -> bool:
+    return self.returncode == 0
+
+  @property
+  def has_changes(self) -> bool:
+    changes: dict = self.change_summary or {}
+
+    return any(changes.get(kind, 0) > 0 for kind in ('add', 'change', 'remove', 'import'))
+
+  def feed(self, line: str):
+    try:
+      message: dict = json.loads(line)
+    except ValueError:
+      # anything that is not an event, e.g. output of a provisioner
+      if line.strip():
+        self.logger.info(line.rstrip())
+      return
+
+    self.logger.info(message.get('@message', line.rstrip()))
+
+    handler = {'planned_change': self.on_planned_change,
+               'change_summary': self.on_change_summary,
+               'resource_drift': self.on_resource_drift,
+               'apply_start': self.on_apply_start,
+               'apply_complete': self.on_apply_complete,
+               'apply_errored': self.on_apply_errored,
+               'diagnostic': self.on_diagnostic}.get(message.get('type'))
+
+    if handler:
+      handler(message)
+
+    self.print_status()
+
+  def on_planned_change(self, message: dict):
+    if message.get('change', {}).get('action') not in (None, 'noop'):
+      self.planned_changes += 1
+
+  def on_resource_drift(self, message: dict):
+    self.drifted_resources.append(message.get('change', {}).get('resource', {}).get('addr', ''))
+
+  def on_change_summary(self, message: dict):
+    self.change_summary = message.get('changes', {})
+
+  def on_apply_start(self, message: dict):
+    hook: dict = message.get('hook', {})
+
+    self.running[hook['resource']['addr']] = {'action': hook.get('action'), 'start_time': time.time()}
+
+  def finish_resource(self, message: dict, status: str):
+    hook: dict = message.get('hook', {})
+    address: str = hook['resource']['addr']
+    started: dict = self.running.pop(address, {'action': hook.get('action'), 'start_time': time.time()})
+
+    duration: float = hook.get('elapsed_seconds', time.time() - started['start_time'])
+    self.resources[address] = {'action': started['action'], 'status': status, 'duration': duration}
+
+    verb: str = self.past_tense.get(started['action'], started['action'] or 'Changed')
+
+    self.clear_status()
+    if status == 'complete':
+      print(f'{verb} {address} in {self.format_duration(duration)}')
+    else:
+      print(f'Failed: {address} after {self.format_duration(duration)}')
+
+  def on_apply_complete(self, message: dict):
+    self.finish_resource(message=message, status='complete')
+
+  def on_apply_errored(self, message: dict):
+    self.finish_resource(message=message, status='errored')
+
+  def on_diagnostic(self, message: dict):
+    diagnostic: dict = message.get('diagnostic', {})
+    self.diagnostics.append(diagnostic)
+
+    self.clear_status()
+    print(f"{diagnostic.get('severity', 'error').capitalize()}: {diagnostic.get('summary', '')}")
+
+    if diagnostic.get('detail'):
+      print(f"  {diagnostic['detail']}")
+
+  def get_errors(self) -> list[dict]:
+    return [diagnostic for diagnostic in self.diagnostics if diagnostic.get('severity') == 'error']
+
+  def clear_status(self):
+    if self.interactive:
+      sys.stdout.write('\r\033[K')
+
+  def print_status(self):
+    if not self.interactive or not self.running:
+      return
+
+    done: str = f'{len(self.resources)}/{self.planned_changes}' if self.planned_changes else f'{len(self.resources)}'
+    running: str = ' | '.join(f"{self.present_tense.get(state['action'], state['action'])} {address} "
+                              f"{self.format_duration(time.time() - state['start_time'])}"
+                              for address, state in self.running.items())
+
+    status: str = f'[{done} done] {running}'
+    width: int = shutil.get_terminal_size().columns
+
+    sys.stdout.write(f'\r\033[K{status[:width - 1]}')
+    sys.stdout.flush()
+
+  def get_slowest_resources(self, count: int = 10) -> list[tuple[str, dict]]:
+    return sorted(self.resources.items(), key=lambda resource: resource[1]['duration'], reverse=True)[:count]
+
+  def print_timings(self, count: int = 10):
+    if not self.resources:
+      return
+
+    self.clear_status()
+    print(f"\n{'Resource':<70}{'Duration':>10}")
+
+    for address, resource in self.get_slowest_resources(count=count):
+      print(f"{address[:69]:<70}{self.format_duration(resource['duration']):>10}")
+
+    print(f"{'Total':<70}{self.format_duration(time.time() - self.start_time):>10}\n")
+
+  def get_timings(self) -> dict:
+    return {'duration': time.time() - self.start_time, 'returncode': self.returncode,
+            'change_summary': self.change_summary, 'resources': self.resources}
@@ -0,0 +1,127 @@
+import os
+import re
+import json
+import time
+import shutil
+
+
+class TerraformWorkspace:
+  """
+  Working directory of its own for one cluster created from a terraform module.
+
+  The module sources under abstrakt/terraformModules are only read. The tfvars file, the state and the terraform
+  data directory (providers, modules) of every cluster live in
+  $XDG_DATA_HOME/abstrakt/terraform/<module>/<cluster> (or ~/.local/share/abstrakt/terraform/...), so any
+  number of clusters can be created or destroyed concurrently from the same checkout. Set
+  ABSTRAKT_TF_WORKSPACES to keep the workspaces somewhere else.
+  """
+
+  modules_root: str = './abstrakt/terraformModules'
+  random_string_file: str = 'random-string.json'
+
+  def __init__(self, logger, module_path: str, name: str | None = None, base_dir: str | None = None):
+    self.logger = logger
+    self.module_path: str = os.path.abspath(module_path)
+    self.base_dir: str = base_dir or self.get_base_dir(module_path=module_path)
+    self.name: str = self.get_safe_name(name) if name else f'run-{time.strftime("%Y%m%d%H%M%S")}-{os.getpid()}'
+    self.path: str = os.path.join(self.base_dir, self.name)
+
+    self.tfvars_path: str = os.path.join(self.path, 'variables.tfvars')
+    self.state_path: str = os.path.join(self.path, 'terraform.tfstate')
+    self.data_dir: str = os.path.join(self.path, '.terraform')
+
+  @classmethod
+  def get_base_dir(cls, module_path: str) -> str:
+    root: str = os.environ.get('ABSTRAKT_TF_WORKSPACES') or os.path.join(
+      os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share'), 'abstrakt', 'terraform')
+
+    module: str = os.path.relpath(os.path.abspath(module_path), os.path.abspath(cls.modules_root))
+
+    return os.path.join(root, module.replace(os.sep, '-'))
+
+  @staticmethod
+  def get_safe_name(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9._-]', '-', name)
+
+  @classmethod
+  def list_workspaces(cls, logger, module_path: str) -> list['TerraformWorkspace']:
+    base_dir: str = cls.get_base_dir(module_path=module_path)
+
+    if not os.path.isdir(base_dir):
+      return []
+
+    return [cls(logger=logger, module_path=module_path, name=name) for name in sorted(os.listdir(base_dir))
+            if os.path.isdir(os.path.join(base_dir, name))]
+
+  @classmethod
+  def find(cls, logger, module_path: str, name: str | None = None) -> 'TerraformWorkspace | None':
+    """
+    Returns the workspace of an existing cluster.
+
+    Args:
+        module_path (str): Terraform module the cluster was created from.
+        name (str): Cluster name. If not given, the module's only workspace is returned.
+
+    Returns:
+        TerraformWorkspace | None: None if there is no such workspace, or no name was given and the module has
+        more than one.
+    """
+    if name:
+      workspace = cls(logger=logger, module_path=module_path, name=name)
+      return workspace if os.path.isdir(workspace.path) else None
+
+    workspaces: list = cls.list_workspaces(logger=logger, module_path=module_path)
+
+    if len(workspaces) == 1:
+      return workspaces[0]
+
+    if workspaces:
+      logger.info(f'{len(workspaces)} terraform workspaces found for {module_path}, a cluster name is needed')
+
+    return None
+
+  @classmethod
+  def find_random_string(cls, logger, module_path: str, cluster_name: str) -> str | None:
+    """
+    Returns the random suffix an existing cluster was created with.
+
+    Clusters with a random suffix have their workspace named after the suffixed name, so a re-run of the same
+    cluster has to reuse the suffix to find its state again instead of creating a second cluster.
+
+    Args:
+        module_path (str): Terraform module the cluster was created from.
+        cluster_name (str): Cluster name without the suffix.
+
+    Returns:
+        str | None: None if no workspace of the module was created for the cluster name.
+    """
+    for workspace in cls.list_workspaces(logger=logger, module_path=module_path):
+      try:
+        with open(os.path.join(workspace.path, cls.random_string_file), 'r') as random_string_file:
+          recorded: dict = json.load(random_string_file)
+      except (OSError, ValueError):
+        continue
+
+      if recorded.get('cluster_name') == cluster_name and recorded.get('random_string'):
+        logger.info(f"Reusing random string {recorded['random_string']} of cluster {cluster_name}")
+        return recorded['random_string']
+
+    return None
+
+  def save_random_string(self, cluster_name: str, random_string: str):
+    with open(os.path.join(self.path, self.random_string_file), 'w') as random_string_file:
+      json.dump({'cluster_name': cluster_name, 'random_string': random_string}, random_string_file)
+
+  def create(self) -> 'TerraformWorkspace':
+    os.makedirs(self.path, exist_ok=True)
+    self.logger.info(f'Using terraform workspace {self.path} for module {self.module_path}')
+
+    return self
+
+  def get_environment(self) -> dict:
+    return {**os.environ, 'TF_DATA_DIR': self.data_dir, 'TF_IN_AUTOMATION': '1'}
+
+  def remove(self):
+    # only after a successful destroy, the state of a live cluster must never be thrown away
+    shutil.rmtree(self.path, ignore_errors=True)
+    self.logger.info(f'Removed terraform workspace {self.path}')
@@ -1,12 +1,14 @@
 from abstrakt.pythonModules.terraformOps.convertToTFVars import ToTFVars
 from abstrakt.pythonModules.terraformOps.executeTerraform import ExecuteTerraform
+from abstrakt.pythonModules.terraformOps.terraformWorkspace import TerraformWorkspace
 from abstrakt.pythonModules.kubernetesOps.updateKubeConfig import UpdateKubeConfig
 from abstrakt.pythonModules.parseConfigFile.parseConfigFile import ParseConfigFile
 
 
 class EKSFargate:
-  def __init__(self, logger):
+  def __init__(self, logger, tf_parallelism: int | str | None = None):
     self.logger = logger
+    self.tf_parallelism = tf_parallelism
 
   def deploy_eks_fargate_cluster(self, cluster_name: str, vpc_name: str, region: str,
                                  asset_tags: str, random_string: str, config_file: str) -> str:
@@ -21,8 +23,18 @@ class EKSFargate:
     fargate_parameters, tags = parser.read_aws_k8s_cluster_config_file(cluster_type='EKS Fargate',
                                                                        config_file=config_file)
 
+    workspace_name: str = cluster_name or fargate_parameters['cluster_name']
+
     if fargate_parameters['random_string'].lower() != 'no':
-      fargate_parameters['random_string'] = random_string
+      # reuse the suffix of an earlier run of this cluster, see TerraformWorkspace.find_random_string
+      fargate_parameters['random_string'] = TerraformWorkspace.find_random_string(
+        logger=self.logger, module_path=path, cluster_name=workspace_name) or random_string
+
+      workspace = TerraformWorkspace(logger=self.logger, module_path=path,
+                                     name=workspace_name + fargate_parameters['random_string']).create()
+      workspace.save_random_string(cluster_name=workspace_name, random_string=fargate_parameters['random_string'])
+    else:
+      workspace = TerraformWorkspace(logger=self.logger, module_path=path, name=workspace_name).create()
 
     # convert eks managed node config file parameters to terraform tfvars format
     convert = ToTFVars(logger=self.logger)
@@ -31,28 +43,27 @@ class EKSFargate:
                                           region=region,
                                           asset_tags=asset_tags,
                                           terraform_variables=fargate_parameters,
-                                          common_tags=tags)
+                                          common_tags=tags,
+                                          tfvars_path=workspace.tfvars_path)
 
     print(' ')
     print('+' * 10)
     print('Terraform')
     print('+' * 10, '\n')
 
-    tf = ExecuteTerraform(logger=self.logger)
+    tf = ExecuteTerraform(logger=self.logger, parallelism=self.tf_parallelism)
 
     if (
-      tf.execute_terraform_get(path=path) and
-      tf.execute_terraform_init(path=path)
+      tf.execute_terraform_get(path=path, workspace=workspace) and
+      tf.execute_terraform_init(path=path, workspace=workspace)
     ):
-      plan_status = tf.execute_terraform_plan(path=path)
+      plan_status = tf.execute_terraform_plan(path=path, workspace=workspace)
 
       if plan_status == 0:
         print('Terraform execution to deploy eks fargate cluster failed. Exiting the program.\n')
         exit()
       elif plan_status == 1:
-        tf.execute_terraform_apply(path=path)
-
-        if tf.execute_terraform_apply(path=path):
+        if tf.execute_terraform_apply(path=path, workspace=workspace):
           print('Terraform execution to deploy eks fargate cluster completed successfully.\n')
 
           kube_config = UpdateKubeConfig(self.logger)
@@ -2,12 +2,14 @@ from abstrakt.pythonModules.parseConfigFile.parseConfigFile import ParseConfigFi
 from abstrakt.pythonModules.terraformOps.convertToTFVars import ToTFVars
 # from abstrakt.pythonModules.vendors.cloudServiceProviders.aws.awsCli.awsOps import AWSOps
 from abstrakt.pythonModules.terraformOps.executeTerraform import ExecuteTerraform
+from abstrakt.pythonModules.terraformOps.terraformWorkspace import TerraformWorkspace
 from abstrakt.pythonModules.kubernetesOps.updateKubeConfig import UpdateKubeConfig
 
 
 class EKSManagedNode:
-  def __init__(self, logger):
+  def __init__(self, logger, tf_parallelism: int | str | None = None):
     self.logger = logger
+    self.tf_parallelism = tf_parallelism
 
   def deploy_eks_managed_node_cluster(self, cluster_name: str, vpc_name: str, region: str,
                                       asset_tags: str, random_string: str, config_file: str):
@@ -17,8 +19,18 @@ class EKSManagedNode:
     conf = ParseConfigFile(logger=self.logger)
     managed_node_parameters, node_groups, common_tags = conf.read_eks_managed_node_config_file(config_file)
 
+    workspace_name: str = cluster_name or managed_node_parameters['cluster_name']
+
     if managed_node_parameters['random_string'].lower() != 'no':
-      managed_node_parameters['random_string'] = random_string
+      # a cluster created before keeps its suffix, so that a re-run updates it instead of creating another one
+      managed_node_parameters['random_string'] = TerraformWorkspace.find_random_string(
+        logger=self.logger, module_path=path, cluster_name=workspace_name) or random_string
+
+      workspace = TerraformWorkspace(logger=self.logger, module_path=path,
+                                     name=workspace_name + managed_node_parameters['random_string']).create()
+      workspace.save_random_string(cluster_name=workspace_name, random_string=managed_node_parameters['random_string'])
+    else:
+      workspace = TerraformWorkspace(logger=self.logger, module_path=path, name=workspace_name).create()
 
     # convert eks managed node config file parameters to terraform tfvars format
     convert = ToTFVars(logger=self.logger)
@@ -27,26 +39,27 @@ class EKSManagedNode:
                                                region=region,
                                                asset_tags=asset_tags,
                                                parameters=managed_node_parameters,
-                                               common_tags=common_tags)
+                                               common_tags=common_tags,
+                                               tfvars_path=workspace.tfvars_path)
 
     print(' ')
     print('+' * 10)
     print('Terraform')
     print('+' * 10, '\n')
 
-    tf = ExecuteTerraform(logger=self.logger)
+    tf = ExecuteTerraform(logger=self.logger, parallelism=self.tf_parallelism)
 
     if (
-      tf.execute_terraform_get(path=path) and
-      tf.execute_terraform_init(path=path)
+      tf.execute_terraform_get(path=path, workspace=workspace) and
+      tf.execute_terraform_init(path=path, workspace=workspace)
     ):
-      plan_status = tf.execute_terraform_plan(path=path)
+      plan_status = tf.execute_terraform_plan(path=path, workspace=workspace)
 
       if plan_status == 0:
         print('Terraform execution to deploy eks managed node cluster failed. Exiting the program.\n')
         exit()
       elif plan_status == 1:
-        if tf.execute_terraform_apply(path=path):
+        if tf.execute_terraform_apply(path=path, workspace=workspace):
           print('Terraform execution to deploy eks managed node cluster completed successfully.\n')
 
           kube_config = UpdateKubeConfig(self.logger)
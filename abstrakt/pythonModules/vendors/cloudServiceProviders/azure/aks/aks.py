@@ -6,13 +6,15 @@ from abstrakt.pythonModules.parseConfigFile.parseConfigFile import ParseConfigFi
 from abstrakt.pythonModules.terraformOps.convertToTFVars import ToTFVars
 from abstrakt.pythonModules.kubernetesOps.updateKubeConfig import UpdateKubeConfig
 from abstrakt.pythonModules.terraformOps.executeTerraform import ExecuteTerraform
+from abstrakt.pythonModules.terraformOps.terraformWorkspace import TerraformWorkspace
 from abstrakt.pythonModules.pythonOps.customPrint.customPrint import printf
 # from abstrakt.pythonModules.vendors.cloudServiceProviders.azure.azOps.azOps import AZOps
 
 
 class AKS:
-  def __init__(self, logger):
+  def __init__(self, logger, tf_parallelism: int | str | None = None):
     self.logger = logger
+    self.tf_parallelism = tf_parallelism
 
   def create_service_principal_with_contributor_role(self):
     while True:
@@ -106,7 +108,7 @@ class AKS:
     # Initialize necessary modules
     conf = ParseConfigFile(self.logger)
     convert = ToTFVars(self.logger)
-    tf = ExecuteTerraform(self.logger)
+    tf = ExecuteTerraform(self.logger, parallelism=self.tf_parallelism)
     # az = AZOps(logger=self.logger)
 
     printf('Deploying Azure AKS Cluster...\n', logger=self.logger)
@@ -118,6 +120,11 @@ class AKS:
       # Get AKS config file parameters
       aks_parameters, tags = conf.read_aks_config_file(config_file)
 
+      aks_terraform_code_path = './abstrakt/terraformModules/azure/aks/'
+
+      workspace = TerraformWorkspace(logger=self.logger, module_path=aks_terraform_code_path,
+                                     name=cluster_name or aks_parameters['cluster_name']).create()
+
       # service_principal_specs = self.create_service_principal_with_contributor_role()
 
       # Convert AKS config file parameters to Terraform tfvars format
@@ -127,21 +134,20 @@ class AKS:
                                     rg_location=rg_location,
                                     asset_tags=asset_tags,
                                     terraform_variables=aks_parameters,
-                                    common_tags=tags)
-
-      aks_terraform_code_path = './abstrakt/terraformModules/azure/aks/'
+                                    common_tags=tags,
+                                    tfvars_path=workspace.tfvars_path)
 
       if (
-        tf.execute_terraform_get(path=aks_terraform_code_path) and
-        tf.execute_terraform_init(path=aks_terraform_code_path)
+        tf.execute_terraform_get(path=aks_terraform_code_path, workspace=workspace) and
+        tf.execute_terraform_init(path=aks_terraform_code_path, workspace=workspace)
       ):
-        plan_status = tf.execute_terraform_plan(path=aks_terraform_code_path)
+        plan_status = tf.execute_terraform_plan(path=aks_terraform_code_path, workspace=workspace)
 
         if plan_status == 0:
           print('Terraform execution to deploy azure aks cluster failed. Exiting the program.\n')
           exit()
         elif plan_status == 1:
-          if tf.execute_terraform_apply(path=aks_terraform_code_path):
+          if tf.execute_terraform_apply(path=aks_terraform_code_path, workspace=workspace):
             kube_config = UpdateKubeConfig(self.logger)
 
             if cluster_name and rg_name:
@@ -1,18 +1,20 @@
 from abstrakt.pythonModules.terraformOps.convertToTFVars import ToTFVars
 from abstrakt.pythonModules.terraformOps.executeTerraform import ExecuteTerraform
+from abstrakt.pythonModules.terraformOps.terraformWorkspace import TerraformWorkspace
 from abstrakt.pythonModules.parseConfigFile.parseConfigFile import ParseConfigFile
 from abstrakt.pythonModules.kubernetesOps.updateKubeConfig import UpdateKubeConfig
 
 
 class GKE:
-  def __init__(self, logger):
+  def __init__(self, logger, tf_parallelism: int | str | None = None):
     self.logger = logger
+    self.tf_parallelism = tf_parallelism
 
   def deploy_gke_standard_cluster(self, cluster_name: str, vpc_network: str, region: str,
                                   asset_tags: str, config_file, project_id) -> str:
     conf = ParseConfigFile(self.logger)
     convert = ToTFVars(self.logger)
-    tf = ExecuteTerraform(self.logger)
+    tf = ExecuteTerraform(self.logger, parallelism=self.tf_parallelism)
 
     print('Deploying GKE Standard Cluster...\n')
 
@@ -20,26 +22,30 @@ class GKE:
       # gke_standard_parameters, tags = conf.read_gke_standard_config_file(config_file)
       gke_standard_parameters = conf.read_gke_standard_config_file(config_file)
 
+      gke_standard_terraform_code_path = './abstrakt/terraformModules/gcp/gke/standard/'
+
+      workspace = TerraformWorkspace(logger=self.logger, module_path=gke_standard_terraform_code_path,
+                                     name=cluster_name or gke_standard_parameters['cluster_name']).create()
+
       convert.convert_gke_standard_to_tfvars(cluster_name=cluster_name,
                                              vpc_network=vpc_network,
                                              region=region,
                                              asset_tags=asset_tags,
                                              terraform_variables=gke_standard_parameters,
-                                             project_id=project_id)
-
-      gke_standard_terraform_code_path = './abstrakt/terraformModules/gcp/gke/standard/'
+                                             project_id=project_id,
+                                             tfvars_path=workspace.tfvars_path)
 
       if (
-        tf.execute_terraform_get(path=gke_standard_terraform_code_path) and
-        tf.execute_terraform_init(path=gke_standard_terraform_code_path)
+        tf.execute_terraform_get(path=gke_standard_terraform_code_path, workspace=workspace) and
+        tf.execute_terraform_init(path=gke_standard_terraform_code_path, workspace=workspace)
       ):
-        plan_status = tf.execute_terraform_plan(path=gke_standard_terraform_code_path)
+        plan_status = tf.execute_terraform_plan(path=gke_standard_terraform_code_path, workspace=workspace)
 
         if plan_status == 0:
           print('Terraform execution to deploy GKE Standard cluster failed. Exiting the program.\n')
           exit()
         elif plan_status == 1:
-          if tf.execute_terraform_apply(path=gke_standard_terraform_code_path):
+          if tf.execute_terraform_apply(path=gke_standard_terraform_code_path, workspace=workspace):
             kube_config = UpdateKubeConfig(self.logger)
             if cluster_name and region:
               kube_config.update_kubeconfig(cloud='gcp', cluster_name=cluster_name,
@@ -77,32 +83,36 @@ class GKE:
                                    config_file, project_id) -> str:
     conf = ParseConfigFile(self.logger)
     convert = ToTFVars(self.logger)
-    tf = ExecuteTerraform(self.logger)
+    tf = ExecuteTerraform(self.logger, parallelism=self.tf_parallelism)
 
     print('Deploying GKE Autopilot Cluster...\n')
 
     try:
       gke_autopilot_parameters = conf.read_gke_autopilot_config_file(config_file)
 
+      gke_autopilot_terraform_code_path = './abstrakt/terraformModules/gcp/gke/autopilot/'
+
+      workspace = TerraformWorkspace(logger=self.logger, module_path=gke_autopilot_terraform_code_path,
+                                     name=cluster_name or gke_autopilot_parameters['cluster_name']).create()
+
       convert.convert_gke_autopilot_to_tfvars(cluster_name=cluster_name,
                                               vpc_network=vpc_network,
                                               region=region,
                                               terraform_variables=gke_autopilot_parameters,
-                                              project_id=project_id)
-
-      gke_autopilot_terraform_code_path = './abstrakt/terraformModules/gcp/gke/autopilot/'
+                                              project_id=project_id,
+                                              tfvars_path=workspace.tfvars_path)
 
       if (
-        tf.execute_terraform_get(path=gke_autopilot_terraform_code_path) and
-        tf.execute_terraform_init(path=gke_autopilot_terraform_code_path)
+        tf.execute_terraform_get(path=gke_autopilot_terraform_code_path, workspace=workspace) and
+        tf.execute_terraform_init(path=gke_autopilot_terraform_code_path, workspace=workspace)
       ):
-        plan_status = tf.execute_terraform_plan(path=gke_autopilot_terraform_code_path)
+        plan_status = tf.execute_terraform_plan(path=gke_autopilot_terraform_code_path, workspace=workspace)
 
         if plan_status == 0:
           print('Terraform execution to deploy GKE Autopilot cluster failed. Exiting the program.\n')
           exit()
         elif plan_status == 1:
-          if tf.execute_terraform_apply(path=gke_autopilot_terraform_code_path):
+          if tf.execute_terraform_apply(path=gke_autopilot_terraform_code_path, workspace=workspace):
             kube_config = UpdateKubeConfig(self.logger)
 
             if cluster_name and region:
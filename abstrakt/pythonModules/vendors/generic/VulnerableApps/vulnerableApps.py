@@ -55,11 +55,14 @@ class VulnerableApps:
       print("Deploying Vulnerable Apps...")
 
       with MultiProcessing() as mp:
-        if mp.execute_with_progress_indicator(self.vulnerable_app_thread, logger,0.5, 300):
+        if mp.execute_with_progress_indicator(self.vulnerable_app_thread, logger,0.5, 300) is True:
           print("Vulnerable apps deployed successfully.\n")
+          return True
         else:
           print('Vulnerable apps did not deploy successfully. Check log files under /var/logs/crowdstrike for more '
                 'details')
+          return False
     except Exception as e:
       logger.error(e)
       print('Vulnerable apps deployment failed with errors\n')
+      return False
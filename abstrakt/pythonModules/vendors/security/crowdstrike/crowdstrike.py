@@ -5,13 +5,18 @@ import random
 import base64
 import inspect
 
-import requests
 import subprocess
 from typing import Optional, Tuple
+from urllib.parse import urljoin
 
 from requests import Response
-from falconpy import SensorDownload
-from requests.auth import HTTPBasicAuth
+
+from abstrakt.pythonModules.httpOps.httpClient import HttpClient
+from abstrakt.pythonModules.kubernetesOps.helmOps import HelmOps
+from abstrakt.pythonModules.kubernetesOps.helmChartCache import HelmChartCache
+from abstrakt.pythonModules.kubernetesOps.helmRepoManager import HelmRepoManager
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconCredentials import FalconCredentials
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconTagCatalogue import FalconTagCatalogue
 
 
 class CrowdStrike:
@@ -21,6 +26,15 @@ class CrowdStrike:
     self.falcon_client_id: str = falcon_client_id
     self.falcon_client_secret: str = falcon_client_secret
     self.logger = logger
+    self.http_client: HttpClient = HttpClient(logger=logger)
+    self.tag_catalogue: FalconTagCatalogue = FalconTagCatalogue(logger=logger)
+    self.helm_repo_manager: HelmRepoManager = HelmRepoManager(logger=logger)
+    self.helm_chart_cache: HelmChartCache = HelmChartCache(logger=logger)
+    self.helm_ops: HelmOps = HelmOps(logger=logger)
+
+    # credentials are resolved once per client id and shared by every installer in this process
+    self.falcon_credentials: FalconCredentials = FalconCredentials.get_context(
+      falcon_client_id=falcon_client_id, falcon_client_secret=falcon_client_secret, logger=logger)
 
     self.falcon_cid: str = self.get_falcon_cid()
     self.falcon_region: str = self.get_falcon_region(logger=self.logger)
@@ -32,89 +46,32 @@ class CrowdStrike:
   def get_falcon_response(self, logger=None) -> dict[str, int | dict] | None:
     logger = logger or self.logger
 
-    try:
-      falcon: SensorDownload = SensorDownload(client_id=self.falcon_client_id, client_secret=self.falcon_client_secret)
-
-      return falcon.get_sensor_installer_ccid()
-    except Exception as e:
-      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-      logger.error(f'{e}')
-      return None
+    return self.falcon_credentials.get_sensor_installer_ccid(logger=logger)
 
   def get_falcon_cid(self, logger=None) -> str | None:
     logger = logger or self.logger
-    try:
-      response: dict[str, int | dict] = self.get_falcon_response()
 
-      return response["body"]["resources"][0].strip()
-    except Exception as e:
-      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-      logger.error(f'{e}')
-      return None
+    return self.falcon_credentials.get_falcon_cid(logger=logger)
 
   def get_falcon_api(self, logger=None) -> str | None:
     logger = logger or self.logger
 
-    try:
-      response: dict[str, int | dict] = self.get_falcon_response()
-
-      if response['headers']['X-Cs-Region'] == 'us-2':
-        return 'api.us-2.crowdstrike.com'
-      elif response['headers']['X-Cs-Region'] == 'eu-1':
-        return 'api.eu-1.crowdstrike.com'
-      else:
-        return 'api.crowdstrike.com'
-    except Exception as e:
-      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-      logger.error(f'{e}')
-      return None
+    return self.falcon_credentials.get_falcon_api(logger=logger)
 
   def get_falcon_region(self, logger=None) -> str | None:
     logger = logger or self.logger
 
-    try:
-      response: dict[str, int | dict] = self.get_falcon_response()
-
-      return response['headers']['X-Cs-Region'].strip()
-    except Exception as e:
-      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-      logger.error(f'{e}')
-      return None
+    return self.falcon_credentials.get_falcon_region(logger=logger)
 
   def get_falcon_api_bearer_token(self, logger=None) -> str | None:
     logger = logger or self.logger
 
-    try:
-      token_url: str = f"https://{self.falcon_api}/oauth2/token"
-      token_data: dict = {
-        "client_id": self.falcon_client_id,
-        "client_secret": self.falcon_client_secret,
-      }
-      response = requests.post(token_url, data=token_data,
-                               headers={"Content-Type": "application/x-www-form-urlencoded"})
-      falcon_api_bearer_token: str = response.json()['access_token']
-
-      return falcon_api_bearer_token
-    except Exception as e:
-      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-      logger.error(f'{e}')
-      return None
+    return self.falcon_credentials.get_falcon_api_bearer_token(logger=logger)
 
   def get_falcon_art_password(self, logger=None) -> str | None:
     logger = logger or self.logger
 
-    try:
-      falcon_api_bearer_token: str = self.get_falcon_api_bearer_token()
-
-      if falcon_api_bearer_token:
-        url: str = f"https://{self.falcon_api}/container-security/entities/image-registry-credentials/v1"
-        headers: dict[str, str] = {"authorization": f"Bearer {falcon_api_bearer_token}"}
-        response: Response = requests.get(url, headers=headers)
-        return response.json()['resources'][0]['token']
-    except Exception as e:
-      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-      logger.error(f'{e}')
-      return None
+    return self.falcon_credentials.get_falcon_art_password(logger=logger)
 
   def get_falcon_art_username(self, logger=None) -> str | None:
     logger = logger or self.logger
@@ -126,32 +83,21 @@ class CrowdStrike:
       logger.error(f'{e}')
       return None
 
+  def get_crowdstrike_repository(self, sensor_type: str) -> str:
+    if sensor_type == 'daemonset':
+      return f"falcon-sensor/{self.falcon_region}/release/falcon-sensor"
+    elif sensor_type == 'sidecar':
+      return f"falcon-container/{self.falcon_region}/release/falcon-sensor"
+    else:
+      return f"{sensor_type}/{self.falcon_region}/release/{sensor_type}"
+
   def get_registry_bearer_token(self, sensor_type: str, logger=None) -> str | None:
     logger = logger or self.logger
 
     try:
       if self.falcon_art_username and self.falcon_art_password:
-        if sensor_type == 'daemonset':
-          registry_bearer_url = (
-            f"https://registry.crowdstrike.com/v2/token?={self.falcon_art_username}&scope=repository"
-            f":falcon-sensor/{self.falcon_region}/release/falcon-sensor:pull&service=registry."
-            f"crowdstrike.com")
-        elif sensor_type == 'sidecar':
-          registry_bearer_url = (
-            f"https://registry.crowdstrike.com/v2/token?={self.falcon_art_username}&scope=repository"
-            f":falcon-container/{self.falcon_region}/release/falcon-sensor:pull&service=registry."
-            f"crowdstrike.com")
-        else:
-          registry_bearer_url = (
-            f"https://registry.crowdstrike.com/v2/token?={self.falcon_art_username}&scope=repository"
-            f":{sensor_type}/{self.falcon_region}/release/{sensor_type}:pull&service=registry."
-            f"crowdstrike.com")
-
-        response = requests.get(registry_bearer_url, auth=HTTPBasicAuth(self.falcon_art_username,
-                                                                        self.falcon_art_password))
-        registry_bearer: str = response.json()['token']
-
-        return registry_bearer
+        return self.falcon_credentials.get_registry_bearer_token(
+          repository=self.get_crowdstrike_repository(sensor_type=sensor_type), logger=logger)
       else:
         return None
     except Exception as e:
@@ -172,33 +118,18 @@ class CrowdStrike:
   def add_crowdstrike_helm_repo(self, logger=None) -> bool:
     logger = logger or self.logger
 
-    try:
-      command: list = ["helm", "repo", "add", "crowdstrike", "https://crowdstrike.github.io/falcon-helm"]
-      process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-      if process.stdout:
-        logger.info(process.stdout)
-      if process.stderr:
-        logger.info(process.stderr)
-
-      return True
-    except Exception as e:
-      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-      logger.error(f'{e}')
-      return False
+    # added once per run, and its index is only refreshed when older than the helm repo TTL
+    return self.helm_repo_manager.ensure_repos(repo_names=['crowdstrike'], logger=logger)
 
   def get_crowdstrike_partial_pull_token(self, logger=None) -> str | None:
     logger = logger or self.logger
 
     try:
-      if self.add_crowdstrike_helm_repo() is True:
-        # Generate partial pull token
-        partial_pull_token: str = (base64.b64encode(
-          f"{self.falcon_art_username}:{self.get_falcon_art_password()}".encode()).decode()
-                                   )
-        return partial_pull_token
-      else:
-        return None
+      # Generate partial pull token
+      partial_pull_token: str = (base64.b64encode(
+        f"{self.falcon_art_username}:{self.get_falcon_art_password()}".encode()).decode()
+                                 )
+      return partial_pull_token
     except Exception as e:
       logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
       logger.error(f'{e}')
@@ -250,35 +181,61 @@ class CrowdStrike:
       return (f"https://registry.crowdstrike.com/v2/{sensor_type}/{self.falcon_region}/release"
               f"/{sensor_type}/tags/list")
 
-  def verify_crowdstrike_sensor_image_tag(self, image_tag: str, sensor_type: str, logger=None) -> bool:
+  def get_crowdstrike_sensor_tags(self, sensor_type: str, logger=None) -> list | None:
     logger = logger or self.logger
 
     try:
-      if sensor_type == 'daemonset':
-        registry_bearer: str = self.get_registry_bearer_token(sensor_type='daemonset')
-      elif sensor_type == 'sidecar':
-        registry_bearer: str = self.get_registry_bearer_token(sensor_type='sidecar')
-      elif sensor_type == 'falcon-kac':
-        registry_bearer: str = self.get_registry_bearer_token(sensor_type='falcon-kac')
-      elif sensor_type == 'falcon-imageanalyzer':
-        registry_bearer: str = self.get_registry_bearer_token(sensor_type='falcon-imageanalyzer')
-      else:
-        return False
+      tags: list = []
+      url: str | None = self.get_crowdstrike_sensor_tag_list_url(sensor_type=sensor_type)
+      retried: bool = False
+
+      while url:
+        registry_bearer: str = self.get_registry_bearer_token(sensor_type=sensor_type)
+
+        if not registry_bearer:
+          return None
 
-      if registry_bearer:
         headers: dict[str, str] = {"authorization": f"Bearer {registry_bearer}"}
-        response: Response = requests.get(
-          self.get_crowdstrike_sensor_tag_list_url(sensor_type=sensor_type), headers=headers)
+        response: Response = self.http_client.get(url, headers=headers)
+
+        # a 401 means the registry token expired or came from a stale cache entry, so retry once
+        if response.status_code == 401 and not retried:
+          self.falcon_credentials.invalidate_registry_bearer_token(
+            repository=self.get_crowdstrike_repository(sensor_type=sensor_type), logger=logger)
+          retried = True
+          continue
+
+        tags.extend(response.json()['tags'] or [])
+
+        # the registry paginates large tag lists through the Link header
+        next_page: dict | None = response.links.get('next')
+        url = urljoin(url, next_page['url']) if next_page else None
+
+      return tags
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
 
-        sensors: dict = response.json()['tags']
-        sensor_tags: list = []
+  def get_crowdstrike_tag_index(self, sensor_type: str, logger=None) -> dict | None:
+    logger = logger or self.logger
 
-        for sensor in sensors:
-          if 'sha256' not in sensor:
-            sensor_tags.append(sensor)
+    return self.tag_catalogue.get_tag_index(
+      repository=self.get_crowdstrike_repository(sensor_type=sensor_type),
+      fetch_tags=lambda: self.get_crowdstrike_sensor_tags(sensor_type=sensor_type, logger=logger),
+      logger=logger)
 
-        if image_tag in sensor_tags:
-          return True
+  def verify_crowdstrike_sensor_image_tag(self, image_tag: str, sensor_type: str, logger=None) -> bool:
+    logger = logger or self.logger
+
+    try:
+      if sensor_type not in ('daemonset', 'sidecar', 'falcon-kac', 'falcon-imageanalyzer'):
+        return False
+
+      tag_index: dict | None = self.get_crowdstrike_tag_index(sensor_type=sensor_type, logger=logger)
+
+      if tag_index and self.tag_catalogue.is_tag_available(index=tag_index, image_tag=image_tag):
+        return True
       else:
         logger.error(f'{image_tag} does not match CrowdStrike image tag pattern.')
         return False
@@ -297,28 +254,15 @@ class CrowdStrike:
         else:
           return None
 
-      registry_bearer: str = self.get_registry_bearer_token(sensor_type=sensor_type)
-
-      if registry_bearer:
-        headers: dict[str, str] = {"authorization": f"Bearer {registry_bearer}"}
-
-        response: Response = requests.get(
-          self.get_crowdstrike_sensor_tag_list_url(sensor_type=sensor_type), headers=headers)
-
-        sensors: dict = response.json()['tags']
-
-        sensor_tags = [sensor for sensor in sensors if all(
-          tag not in sensor for tag in ['sha256', '_aarch64', '_x86_64'])]
+      tag_index: dict | None = self.get_crowdstrike_tag_index(sensor_type=sensor_type, logger=logger)
 
+      if tag_index:
         if '-' in image_tag:
           version_number: int = int(image_tag.split('-')[1])
         else:
           version_number: int = 0
 
-        if sensor_type == 'falcon-imageanalyzer':
-          sensor_tags.sort(key=lambda s: [int(part) for part in s.split('.')])
-
-        return sensor_tags[-version_number - 1]
+        return self.tag_catalogue.get_latest_tag(index=tag_index, offset=version_number)
       else:
         return None
     except Exception as e:
@@ -398,6 +342,50 @@ class CrowdStrike:
       logger.error(f"Unexpected error occurred: {e}")
       return None, str(e)
 
+  def run_helm_upgrade(self, command: str, logger=None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Runs a 'helm upgrade --install' command unless the release is already deployed with the same chart version and
+    values, in which case nothing is restarted.
+
+    Args:
+        command (str): The helm upgrade command to run.
+        logger: Logger
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The standard output and error of the command.
+    """
+    logger = logger or self.logger
+
+    if not self.helm_ops.is_upgrade_needed(command=command, logger=logger):
+      return 'Helm release is up to date, upgrade skipped', None
+
+    return self.run_command(command=command, logger=logger)
+
+  def install_helm_release(self, command: str, logger=None) -> bool:
+    """
+    Runs a 'helm upgrade --install' command like run_helm_upgrade.
+
+    Returns:
+        bool: False if helm failed, True if the release was installed, upgraded or is up to date.
+    """
+    logger = logger or self.logger
+
+    output, error = self.run_helm_upgrade(command=command, logger=logger)
+
+    # run_command returns no output for a failed command, helm prints its release notes on success
+    if output is None and error is not None:
+      return False
+
+    helm_command: dict | None = self.helm_ops.parse_helm_command(command=command)
+
+    if helm_command is not None:
+      self.helm_ops.release_index.record_install(release_name=helm_command['release'],
+                                                 namespace=helm_command['namespace'],
+                                                 chart=self.helm_ops.get_chart_version(chart=helm_command['chart'],
+                                                                                      version=helm_command['version']))
+
+    return True
+
   # def run_command(self, command: str) -> Tuple[Optional[str], Optional[str]]:
   #   """
   #   Executes a shell command and captures its output in real-time.
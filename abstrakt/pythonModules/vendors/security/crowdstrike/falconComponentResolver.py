@@ -0,0 +1,81 @@
+import time
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from abstrakt.pythonModules.vendors.security.crowdstrike.crowdstrike import CrowdStrike
+
+
+class FalconComponentResolver(CrowdStrike):
+  """
+  Resolves the CrowdStrike registry URI, image tag and image pull token of every requested component up front.
+
+  Lookups for different components run concurrently in a thread pool. The results are cached in the shared
+  Falcon credential context and tag catalogue, which the component installers inherit, so each installer only
+  re-reads warm values instead of waiting on the registry again.
+  """
+
+  def __init__(self, falcon_client_id: str,
+               falcon_client_secret: str,
+               logger,
+               max_workers: int = 4):
+    super().__init__(falcon_client_id,
+                     falcon_client_secret,
+                     logger)
+    self.max_workers: int = max_workers
+
+  def resolve_component(self, component: str, sensor_type: str, image_tag: str, logger=None) -> dict:
+    logger = logger or self.logger
+    start_time: float = time.time()
+
+    try:
+      resolved_tag: str | None = self.get_crowdstrike_sensor_image_tag(sensor_type=sensor_type,
+                                                                       image_tag=image_tag,
+                                                                       logger=logger)
+
+      return {
+        'component': component,
+        'sensor_type': sensor_type,
+        'registry': self.get_crowdstrike_registry(sensor_type=sensor_type),
+        'image_tag': resolved_tag,
+        'duration': time.time() - start_time
+      }
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return {'component': component, 'sensor_type': sensor_type, 'registry': None, 'image_tag': None,
+              'duration': time.time() - start_time}
+
+  def resolve_components(self, components: dict[str, tuple[str, str]], logger=None) -> dict[str, dict]:
+    """
+    Resolves registry, image tag and pull token for several components concurrently.
+
+    Args:
+        components (dict): Maps a component name (e.g. 'sensor', 'kac', 'iar') to a (sensor_type, image_tag)
+                           tuple, where image_tag may be 'latest' or 'latest-N'.
+        logger: Logger object
+
+    Returns:
+        dict[str, dict]: Maps each component name to its resolved registry, image_tag, pull_token and the
+                         time the lookup took.
+    """
+    logger = logger or self.logger
+
+    if not components:
+      return {}
+
+    with ThreadPoolExecutor(max_workers=min(self.max_workers, len(components) + 1)) as executor:
+      # the pull token is the same for every component, so it is requested once alongside the tag lookups
+      pull_token_future = executor.submit(self.get_crowdstrike_image_pull_token, logger)
+
+      futures = {
+        component: executor.submit(self.resolve_component, component, sensor_type, image_tag, logger)
+        for component, (sensor_type, image_tag) in components.items()
+      }
+
+      resolved_components: dict[str, dict] = {component: future.result() for component, future in futures.items()}
+      pull_token: str | None = pull_token_future.result()
+
+    for resolved_component in resolved_components.values():
+      resolved_component['pull_token'] = pull_token
+
+    return resolved_components
@@ -0,0 +1,301 @@
+import json
+import time
+import inspect
+import threading
+
+from falconpy import SensorDownload
+from requests.auth import HTTPBasicAuth
+
+from abstrakt.pythonModules.httpOps.httpClient import HttpClient
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconTokenCache import FalconTokenCache
+
+
+class FalconCredentials:
+  """
+  Process-wide Falcon credential context.
+
+  One context exists per Falcon client id. It resolves the CID, region, API host, OAuth bearer token and
+  registry password once and hands the cached values to every CrowdStrike installer created afterwards.
+  All lookups are guarded by a lock, so installers running in threads share the same values.
+
+  When the on-disk token cache is enabled, resolved values are also persisted so later runs skip the
+  authentication round-trips entirely. A 401 from the Falcon API or the registry drops the stale token and
+  retries once with a fresh one.
+  """
+
+  # seconds before the advertised expiry at which a bearer token is considered stale
+  token_expiry_margin: int = 60
+  # lifetime of cached values the API does not put an expiry on (CID, region and registry password)
+  static_value_ttl: int = 43200
+
+  _contexts: dict = {}
+  _contexts_lock = threading.Lock()
+
+  def __init__(self, falcon_client_id: str, falcon_client_secret: str, logger):
+    self.falcon_client_id: str = falcon_client_id
+    self.falcon_client_secret: str = falcon_client_secret
+    self.logger = logger
+
+    self._lock = threading.RLock()
+    self._ccid_response: dict | None = None
+    self._bearer_token: str | None = None
+    self._bearer_token_expiry: float = 0.0
+    self._art_password: str | None = None
+    self._registry_bearer_tokens: dict[str, tuple[str, float]] = {}
+    self._registry_locks: dict[str, threading.Lock] = {}
+
+    self.http_client: HttpClient = HttpClient(logger=logger)
+    self.token_cache: FalconTokenCache = FalconTokenCache(falcon_client_id=falcon_client_id,
+                                                          falcon_client_secret=falcon_client_secret,
+                                                          logger=logger)
+
+  @classmethod
+  def get_context(cls, falcon_client_id: str, falcon_client_secret: str, logger) -> 'FalconCredentials':
+    """
+    Returns the shared credential context for a client id, creating it on first use.
+
+    Args:
+        falcon_client_id (str): Falcon API client id.
+        falcon_client_secret (str): Falcon API client secret.
+        logger: Logger object
+
+    Returns:
+        FalconCredentials: The context shared by every installer using the same client id.
+    """
+    with cls._contexts_lock:
+      context = cls._contexts.get(falcon_client_id)
+
+      if context is None or context.falcon_client_secret != falcon_client_secret:
+        context = cls(falcon_client_id=falcon_client_id, falcon_client_secret=falcon_client_secret, logger=logger)
+        cls._contexts[falcon_client_id] = context
+
+      return context
+
+  @classmethod
+  def clear_contexts(cls):
+    with cls._contexts_lock:
+      cls._contexts.clear()
+
+  def get_sensor_installer_ccid(self, logger=None) -> dict[str, int | dict] | None:
+    logger = logger or self.logger
+
+    with self._lock:
+      if self._ccid_response is not None:
+        return self._ccid_response
+
+      try:
+        cached_ccid: str | None = self.token_cache.get_token(scope='ccid', region='', logger=logger)
+
+        if cached_ccid:
+          cid, region = json.loads(cached_ccid)
+          self._ccid_response = {'status_code': 200,
+                                 'headers': {'X-Cs-Region': region},
+                                 'body': {'resources': [cid]}}
+          return self._ccid_response
+
+        falcon: SensorDownload = SensorDownload(client_id=self.falcon_client_id,
+                                                client_secret=self.falcon_client_secret)
+        response: dict[str, int | dict] = falcon.get_sensor_installer_ccid()
+
+        if response and response.get('status_code') == 200:
+          self._ccid_response = response
+          self.token_cache.set_token(scope='ccid', region='',
+                                     token=json.dumps([response['body']['resources'][0],
+                                                       response['headers']['X-Cs-Region']]),
+                                     expires_in=self.static_value_ttl, logger=logger)
+
+        return response
+      except Exception as e:
+        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+        logger.error(f'{e}')
+        return None
+
+  def get_falcon_cid(self, logger=None) -> str | None:
+    logger = logger or self.logger
+
+    try:
+      return self.get_sensor_installer_ccid(logger=logger)["body"]["resources"][0].strip()
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  def get_falcon_region(self, logger=None) -> str | None:
+    logger = logger or self.logger
+
+    try:
+      return self.get_sensor_installer_ccid(logger=logger)['headers']['X-Cs-Region'].strip()
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  def get_falcon_api(self, logger=None) -> str | None:
+    logger = logger or self.logger
+
+    region: str = self.get_falcon_region(logger=logger)
+
+    if region is None:
+      return None
+    elif region == 'us-2':
+      return 'api.us-2.crowdstrike.com'
+    elif region == 'eu-1':
+      return 'api.eu-1.crowdstrike.com'
+    else:
+      return 'api.crowdstrike.com'
+
+  def get_falcon_api_bearer_token(self, logger=None) -> str | None:
+    logger = logger or self.logger
+
+    with self._lock:
+      if self._bearer_token and time.time() < self._bearer_token_expiry - self.token_expiry_margin:
+        return self._bearer_token
+
+      try:
+        region: str = self.get_falcon_region(logger=logger)
+        cached_token: str | None = self.token_cache.get_token(scope='oauth2', region=region, logger=logger)
+
+        if cached_token:
+          # the on-disk entry expires with the token, so the in-process copy only needs a short lifetime
+          self._bearer_token = cached_token
+          self._bearer_token_expiry = time.time() + self.token_expiry_margin * 2
+          return self._bearer_token
+
+        token_url: str = f"https://{self.get_falcon_api(logger=logger)}/oauth2/token"
+        token_data: dict = {
+          "client_id": self.falcon_client_id,
+          "client_secret": self.falcon_client_secret,
+        }
+        response = self.http_client.post(token_url, data=token_data,
+                                         headers={"Content-Type": "application/x-www-form-urlencoded"})
+        token: dict = response.json()
+        expires_in: int = int(token.get('expires_in', 1799))
+
+        self._bearer_token = token['access_token']
+        self._bearer_token_expiry = time.time() + expires_in
+        self.token_cache.set_token(scope='oauth2', region=region, token=self._bearer_token,
+                                   expires_in=expires_in - self.token_expiry_margin, logger=logger)
+
+        return self._bearer_token
+      except Exception as e:
+        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+        logger.error(f'{e}')
+        return None
+
+  def invalidate_falcon_api_bearer_token(self, logger=None):
+    logger = logger or self.logger
+
+    with self._lock:
+      self._bearer_token = None
+      self._bearer_token_expiry = 0.0
+      self.token_cache.invalidate_token(scope='oauth2', region=self.get_falcon_region(logger=logger),
+                                        logger=logger)
+
+  def get_falcon_art_password(self, logger=None) -> str | None:
+    logger = logger or self.logger
+
+    with self._lock:
+      if self._art_password is not None:
+        return self._art_password
+
+      try:
+        region: str = self.get_falcon_region(logger=logger)
+        self._art_password = self.token_cache.get_token(scope='registry-password', region=region, logger=logger)
+
+        if self._art_password:
+          return self._art_password
+
+        url: str = (f"https://{self.get_falcon_api(logger=logger)}/container-security/entities/"
+                    f"image-registry-credentials/v1")
+
+        # a 401 means the bearer token was revoked or came from a stale cache entry, so retry once
+        for attempt in range(2):
+          falcon_api_bearer_token: str = self.get_falcon_api_bearer_token(logger=logger)
+
+          if not falcon_api_bearer_token:
+            return None
+
+          headers: dict[str, str] = {"authorization": f"Bearer {falcon_api_bearer_token}"}
+          response = self.http_client.get(url, headers=headers)
+
+          if response.status_code == 401 and attempt == 0:
+            self.invalidate_falcon_api_bearer_token(logger=logger)
+            continue
+
+          self._art_password = response.json()['resources'][0]['token']
+          break
+
+        self.token_cache.set_token(scope='registry-password', region=region, token=self._art_password,
+                                   expires_in=self.static_value_ttl, logger=logger)
+
+        return self._art_password
+      except Exception as e:
+        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+        logger.error(f'{e}')
+        return None
+
+  def get_registry_bearer_token(self, repository: str, logger=None) -> str | None:
+    """
+    Returns a pull token for a registry.crowdstrike.com repository.
+
+    Args:
+        repository (str): Repository path, e.g. falcon-sensor/us-1/release/falcon-sensor.
+        logger: Logger object
+
+    Returns:
+        str | None: Registry bearer token, or None if it could not be obtained.
+    """
+    logger = logger or self.logger
+
+    # one lock per repository, so tokens for different repositories can be requested concurrently
+    with self._lock:
+      registry_lock: threading.Lock = self._registry_locks.setdefault(repository, threading.Lock())
+
+    with registry_lock:
+      cached_token: tuple[str, float] | None = self._registry_bearer_tokens.get(repository)
+
+      if cached_token and time.time() < cached_token[1]:
+        return cached_token[0]
+
+      try:
+        region: str = self.get_falcon_region(logger=logger)
+        scope: str = f'registry:{repository}'
+        registry_bearer: str | None = self.token_cache.get_token(scope=scope, region=region, logger=logger)
+
+        if registry_bearer:
+          self._registry_bearer_tokens[repository] = (registry_bearer, time.time() + self.token_expiry_margin)
+          return registry_bearer
+
+        username: str = f"fc-{self.get_falcon_cid(logger=logger).lower().split('-')[0]}"
+        password: str = self.get_falcon_art_password(logger=logger)
+
+        if not password:
+          return None
+
+        registry_bearer_url = (f"https://registry.crowdstrike.com/v2/token?={username}&scope=repository"
+                               f":{repository}:pull&service=registry.crowdstrike.com")
+
+        response = self.http_client.get(registry_bearer_url, auth=HTTPBasicAuth(username, password))
+        token: dict = response.json()
+
+        registry_bearer = token['token']
+        expires_in: int = int(token.get('expires_in', 300))
+
+        self._registry_bearer_tokens[repository] = (registry_bearer,
+                                                    time.time() + expires_in - self.token_expiry_margin)
+        self.token_cache.set_token(scope=scope, region=region, token=registry_bearer,
+                                   expires_in=expires_in - self.token_expiry_margin, logger=logger)
+
+        return registry_bearer
+      except Exception as e:
+        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+        logger.error(f'{e}')
+        return None
+
+  def invalidate_registry_bearer_token(self, repository: str, logger=None):
+    logger = logger or self.logger
+
+    with self._lock:
+      self._registry_bearer_tokens.pop(repository, None)
+      self.token_cache.invalidate_token(scope=f'registry:{repository}', region=self.get_falcon_region(logger=logger),
+                                        logger=logger)
@@ -0,0 +1,478 @@
+import re
+import json
+import time
+import hashlib
+import inspect
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from requests import Response
+from requests.auth import HTTPBasicAuth
+
+from abstrakt.pythonModules.httpOps.httpClient import HttpClient
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconOciCache import FalconOciCache
+
+
+class FalconImageMirror:
+  """
+  Copies CrowdStrike images into private registries (ECR, ACR, Artifact Registry) concurrently.
+
+  Each mirror job is a dict with the keys:
+      name         display name, e.g. 'falcon-kac'
+      source       source image reference without tag, e.g. registry.crowdstrike.com/falcon-kac/us-1/release/falcon-kac
+      tag          source image tag
+      target       target image reference without tag
+      target_tag   target image tag (defaults to tag)
+      src_creds    'username:password' for the source registry, optional
+      dest_creds   'username:password' for the target registry, optional
+      platforms    architectures to mirror, e.g. ['amd64'], optional (all by default)
+
+  Jobs run in a bounded thread pool. Each copy is retried with exponential backoff. Progress is printed as
+  each image finishes, with its size and duration.
+
+  Before copying, the source and target manifest digests are compared with registry HEAD requests and the
+  copy is skipped when they match. When they differ, layers already pushed to another repository of the same
+  target registry are cross-mounted first, so skopeo only uploads the blobs the target is really missing.
+
+  Source images are pulled once per digest into the local OCI cache and pushed to every target from there, so
+  the same image can be fanned out to several registries (jobs with the same source and different targets)
+  for the cost of one download.
+  """
+
+  manifest_media_types: str = ', '.join([
+    'application/vnd.oci.image.index.v1+json',
+    'application/vnd.docker.distribution.manifest.list.v2+json',
+    'application/vnd.oci.image.manifest.v1+json',
+    'application/vnd.docker.distribution.manifest.v2+json'
+  ])
+
+  def __init__(self, logger, max_workers: int = 3, retries: int = 2, oci_cache: FalconOciCache | None = None):
+    self.logger = logger
+    self.max_workers: int = max_workers
+    self.retries: int = retries
+    self.oci_cache: FalconOciCache = oci_cache or FalconOciCache(logger=logger)
+
+    self.http_client: HttpClient = HttpClient(logger=logger)
+
+    self._lock = threading.Lock()
+    self._registry_tokens: dict[tuple, str] = {}
+    # target registry -> blob digest -> repository it was pushed to during this run
+    self._mirrored_blobs: dict[str, dict[str, str]] = {}
+
+  @staticmethod
+  def normalize_platforms(platforms: str | list | None) -> list[str] | None:
+    """
+    Normalizes 'linux/amd64,arm64' style platform lists to architecture names (amd64, arm64).
+    """
+    if not platforms:
+      return None
+
+    if isinstance(platforms, str):
+      platforms = platforms.split(',')
+
+    aliases: dict[str, str] = {'x86_64': 'amd64', 'aarch64': 'arm64'}
+    architectures: list[str] = []
+
+    for platform in platforms:
+      architecture: str = platform.strip().lower().split('/')[-1 if platform.count('/') < 2 else 1]
+      architecture = aliases.get(architecture, architecture)
+
+      if architecture and architecture not in architectures:
+        architectures.append(architecture)
+
+    return architectures or None
+
+  @staticmethod
+  def split_reference(reference: str) -> tuple[str, str]:
+    registry, _, repository = reference.partition('/')
+
+    return registry, repository
+
+  def get_registry_token(self, challenge: str, creds: str | None, scopes: list[str], logger=None) -> str | None:
+    logger = logger or self.logger
+
+    try:
+      parameters: dict = dict(re.findall(r'(\w+)="([^"]*)"', challenge))
+      auth = HTTPBasicAuth(*creds.split(':', 1)) if creds else None
+
+      response: Response = self.http_client.get(parameters['realm'],
+                                                params={'service': parameters.get('service'), 'scope': scopes},
+                                                auth=auth)
+      token: dict = response.json()
+
+      return token.get('token') or token.get('access_token')
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  def request_registry(self, method: str, registry: str, path: str, creds: str | None, scopes: list[str],
+                       headers: dict | None = None, logger=None, **kwargs) -> Response | None:
+    """
+    Sends a registry v2 API request, answering bearer or basic authentication challenges as needed.
+    """
+    logger = logger or self.logger
+
+    try:
+      url: str = path if path.startswith('https://') else f'https://{registry}{path}'
+      token_key: tuple = (registry, ' '.join(scopes))
+      request_headers: dict = dict(headers or {})
+
+      with self._lock:
+        token: str | None = self._registry_tokens.get(token_key)
+
+      if token:
+        request_headers['Authorization'] = f'Bearer {token}'
+
+      response: Response = self.http_client.request(method, url, headers=request_headers, **kwargs)
+
+      if response.status_code != 401:
+        return response
+
+      challenge: str = response.headers.get('WWW-Authenticate', '')
+
+      if challenge.lower().startswith('bearer'):
+        token = self.get_registry_token(challenge=challenge, creds=creds, scopes=scopes, logger=logger)
+
+        if not token:
+          return response
+
+        with self._lock:
+          self._registry_tokens[token_key] = token
+
+        request_headers['Authorization'] = f'Bearer {token}'
+
+        return self.http_client.request(method, url, headers=request_headers, **kwargs)
+      elif creds:
+        request_headers.pop('Authorization', None)
+
+        return self.http_client.request(method, url, headers=request_headers,
+                                        auth=HTTPBasicAuth(*creds.split(':', 1)), **kwargs)
+
+      return response
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  def get_manifest_digest(self, image: str, tag: str, creds: str | None = None, logger=None) -> str | None:
+    """
+    Returns the manifest digest of image:tag with a HEAD request, or None if the tag does not exist.
+    """
+    logger = logger or self.logger
+
+    registry, repository = self.split_reference(image)
+    scopes: list[str] = [f'repository:{repository}:pull']
+    headers: dict[str, str] = {'Accept': self.manifest_media_types}
+
+    response: Response | None = self.request_registry('HEAD', registry, f'/v2/{repository}/manifests/{tag}',
+                                                      creds=creds, scopes=scopes, headers=headers, logger=logger)
+
+    if response is None or response.status_code != 200:
+      return None
+
+    digest: str | None = response.headers.get('Docker-Content-Digest')
+
+    if digest:
+      return digest
+
+    # some registries omit the digest header on HEAD, so hash the manifest body instead
+    response = self.request_registry('GET', registry, f'/v2/{repository}/manifests/{tag}',
+                                     creds=creds, scopes=scopes, headers=headers, logger=logger)
+
+    if response is None or response.status_code != 200:
+      return None
+
+    return f'sha256:{hashlib.sha256(response.content).hexdigest()}'
+
+  def mount_blobs(self, target: str, blobs: list[dict], creds: str | None = None, logger=None) -> int:
+    """
+    Cross-mounts blobs already pushed to other repositories of the target registry during this run.
+
+    Returns:
+        int: Number of blobs mounted.
+    """
+    logger = logger or self.logger
+
+    registry, repository = self.split_reference(target)
+
+    with self._lock:
+      known_blobs: dict[str, str] = dict(self._mirrored_blobs.get(registry, {}))
+
+    mounted: int = 0
+
+    for blob in blobs:
+      source_repository: str | None = known_blobs.get(blob['digest'])
+
+      if not source_repository or source_repository == repository:
+        continue
+
+      scopes: list[str] = [f'repository:{repository}:pull,push', f'repository:{source_repository}:pull']
+      response: Response | None = self.request_registry(
+        'POST', registry, f"/v2/{repository}/blobs/uploads/?mount={blob['digest']}&from={source_repository}",
+        creds=creds, scopes=scopes, logger=logger)
+
+      if response is None:
+        continue
+
+      if response.status_code == 201:
+        mounted += 1
+      elif response.status_code == 202 and response.headers.get('Location'):
+        # the registry does not support mounting and opened an upload session instead, so cancel it
+        location: str = response.headers['Location']
+        location = location if location.startswith('https://') else f'https://{registry}{location}'
+        self.request_registry('DELETE', registry, location, creds=creds, scopes=scopes, logger=logger)
+
+    return mounted
+
+  def record_mirrored_blobs(self, target: str, blobs: list[dict]):
+    registry, repository = self.split_reference(target)
+
+    with self._lock:
+      registry_blobs: dict[str, str] = self._mirrored_blobs.setdefault(registry, {})
+
+      for blob in blobs:
+        registry_blobs.setdefault(blob['digest'], repository)
+
+  def run_skopeo(self, arguments: list, logger=None) -> tuple[str | None, str | None]:
+    logger = logger or self.logger
+
+    try:
+      process = subprocess.run(['skopeo'] + arguments, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+      if process.returncode != 0:
+        return None, process.stderr
+
+      return process.stdout, None
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None, str(e)
+
+  def get_raw_manifest(self, reference: str, creds: str | None = None, logger=None) -> dict | None:
+    logger = logger or self.logger
+
+    arguments: list = ['inspect', '--raw']
+
+    if creds:
+      arguments += ['--creds', creds]
+
+    output, error = self.run_skopeo(arguments=arguments + [f'docker://{reference}'], logger=logger)
+
+    if output is None:
+      logger.error(f'Failed to inspect {reference}: {error}')
+      return None
+
+    return json.loads(output)
+
+  def get_image_blobs(self, image: str, tag: str, creds: str | None = None, platforms: list[str] | None = None,
+                      logger=None) -> list[dict]:
+    """
+    Returns the layer and config blobs (digest and compressed size) of an image, over every platform of a
+    multi-arch index, or only the given platforms.
+    """
+    logger = logger or self.logger
+
+    try:
+      manifest: dict | None = self.get_raw_manifest(reference=f'{image}:{tag}', creds=creds, logger=logger)
+
+      if manifest is None:
+        return []
+
+      if 'manifests' in manifest:
+        child_manifests: list = [self.get_raw_manifest(reference=f"{image}@{child['digest']}", creds=creds,
+                                                       logger=logger)
+                                 for child in manifest['manifests']
+                                 if not platforms or child.get('platform', {}).get('architecture') in platforms]
+      else:
+        child_manifests: list = [manifest]
+
+      blobs: dict[str, dict] = {}
+
+      for child in child_manifests:
+        if not child:
+          continue
+
+        for blob in child.get('layers', []) + [child.get('config', {})]:
+          if blob.get('digest'):
+            blobs[blob['digest']] = {'digest': blob['digest'], 'size': blob.get('size', 0)}
+
+      return list(blobs.values())
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return []
+
+  def get_platform_selection(self, job: dict, source_digest: str | None, logger=None) -> tuple:
+    """
+    Works out how to copy only the requested platforms of a job's image.
+
+    Returns:
+        tuple: (expected target digest, skopeo copy options, platform key for the cache), or
+               (None, None, None) if the image has none of the requested platforms.
+    """
+    logger = logger or self.logger
+
+    platforms: list[str] | None = job.get('platforms')
+
+    if not platforms:
+      return source_digest, ['--multi-arch', 'all'], None
+
+    manifest: dict | None = self.get_raw_manifest(reference=f"{job['source']}:{job['tag']}",
+                                                  creds=job.get('src_creds'), logger=logger)
+
+    if manifest is None or 'manifests' not in manifest:
+      # single-platform image, nothing to filter
+      return source_digest, ['--multi-arch', 'all'], None
+
+    children: list = manifest['manifests']
+    matching: list = [child for child in children if child.get('platform', {}).get('architecture') in platforms]
+
+    if not matching:
+      logger.error(f"{job['source']}:{job['tag']} has no manifest for platform/s {', '.join(platforms)}")
+      return None, None, None
+
+    if len(matching) == len(children):
+      return source_digest, ['--multi-arch', 'all'], None
+
+    if len(matching) > 1:
+      # skopeo can only narrow an index down to a single platform, so keep the whole index here
+      logger.info(f"Copying all platforms of {job['source']}:{job['tag']} as more than one was requested")
+      return source_digest, ['--multi-arch', 'all'], None
+
+    platform: dict = matching[0]['platform']
+    copy_options: list = ['--multi-arch', 'system', '--override-os', platform.get('os', 'linux'),
+                          '--override-arch', platform['architecture']]
+
+    if platform.get('variant'):
+      copy_options += ['--override-variant', platform['variant']]
+
+    return matching[0]['digest'], copy_options, platform['architecture']
+
+  def copy_image(self, job: dict, logger=None) -> dict:
+    logger = logger or self.logger
+
+    target_tag: str = job.get('target_tag') or job['tag']
+
+    result: dict = {'name': job['name'], 'status': False, 'skipped': False, 'bytes': 0, 'mounted': 0,
+                    'duration': 0.0, 'attempts': 0, 'error': None}
+    start_time: float = time.time()
+
+    source_digest: str | None = self.get_manifest_digest(image=job['source'], tag=job['tag'],
+                                                         creds=job.get('src_creds'), logger=logger)
+    expected_digest, copy_options, platform = self.get_platform_selection(job=job, source_digest=source_digest,
+                                                                          logger=logger)
+
+    if copy_options is None:
+      result.update({'error': 'no matching platform', 'duration': time.time() - start_time})
+      return result
+
+    target_digest: str | None = self.get_manifest_digest(image=job['target'], tag=target_tag,
+                                                         creds=job.get('dest_creds'), logger=logger)
+
+    if expected_digest and expected_digest == target_digest:
+      logger.info(f"{job['target']}:{target_tag} already matches {expected_digest}. Skipping copy.")
+      result.update({'status': True, 'skipped': True, 'duration': time.time() - start_time})
+      return result
+
+    blobs: list[dict] = self.get_image_blobs(image=job['source'], tag=job['tag'], creds=job.get('src_creds'),
+                                             platforms=[platform] if platform else None, logger=logger)
+    result['mounted'] = self.mount_blobs(target=job['target'], blobs=blobs, creds=job.get('dest_creds'),
+                                         logger=logger)
+
+    filled: bool = self.oci_cache.ensure_image(source=job['source'], tag=job['tag'], digest=source_digest,
+                                               src_creds=job.get('src_creds'), platform=platform,
+                                               copy_options=copy_options, logger=logger) is not None
+
+    direct_arguments: list = ['copy'] + copy_options
+
+    if job.get('src_creds'):
+      direct_arguments += ['--src-creds', job['src_creds']]
+
+    dest_arguments: list = ['--dest-creds', job['dest_creds']] if job.get('dest_creds') else []
+    target_reference: str = f"docker://{job['target']}:{target_tag}"
+    result['source_digest'] = source_digest
+
+    # the shared lock keeps other runs from evicting the entry until the push is done
+    with self.oci_cache.read_entry(digest=source_digest if filled else None, platform=platform) as cached:
+      for attempt in range(self.retries + 1):
+        result['attempts'] = attempt + 1
+
+        if cached:
+          # unchanged manifests, so the target gets the source digest and the next run skips the copy
+          arguments: list = ['copy', '--preserve-digests', '--multi-arch', 'all'] + dest_arguments + [
+            self.oci_cache.get_oci_reference(digest=source_digest, platform=platform), target_reference]
+        else:
+          arguments: list = direct_arguments + dest_arguments + [f"docker://{job['source']}:{job['tag']}",
+                                                                 target_reference]
+
+        logger.info(f"Copying {job['source']}:{job['tag']} to {job['target']}:{target_tag} (attempt {attempt + 1})")
+        output, error = self.run_skopeo(arguments=arguments, logger=logger)
+
+        if output is not None:
+          result['status'] = True
+          result['error'] = None
+          break
+
+        result['error'] = error
+        logger.error(f"Failed to copy {job['name']}: {error}")
+
+        # retries copy straight from the source, in case skopeo refuses to push the cached image unchanged
+        cached = False
+
+        if attempt < self.retries:
+          time.sleep(2 ** (attempt + 1))
+
+    result['duration'] = time.time() - start_time
+
+    if result['status']:
+      result['bytes'] = sum(blob['size'] for blob in blobs)
+      self.record_mirrored_blobs(target=job['target'], blobs=blobs)
+
+    return result
+
+  def mirror_images(self, jobs: list[dict], logger=None) -> dict[str, dict]:
+    """
+    Copies every job's image concurrently. Job names must be unique, e.g. include the target when fanning one
+    image out to several registries.
+
+    Args:
+        jobs (list[dict]): Mirror jobs as described in the class docstring.
+        logger: Logger object
+
+    Returns:
+        dict[str, dict]: Maps each job name to its status, bytes, duration, attempts and last error.
+    """
+    logger = logger or self.logger
+
+    if not jobs:
+      return {}
+
+    print(f'Mirroring {len(jobs)} image/s to private registry...')
+
+    results: dict[str, dict] = {}
+
+    with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+      futures = {executor.submit(self.copy_image, job, logger): job for job in jobs}
+
+      for future in as_completed(futures):
+        result: dict = future.result()
+        results[result['name']] = result
+
+        if result['skipped']:
+          print(f"[{len(results)}/{len(jobs)}] {result['name']}: up to date, skipping copy")
+          continue
+
+        status: str = 'copied' if result['status'] else 'failed'
+        print(f"[{len(results)}/{len(jobs)}] {result['name']}: {status} "
+              f"({result['bytes'] / 1048576:.1f} MB in {result['duration']:.1f} seconds, "
+              f"{result['mounted']} layer/s mounted, {result['attempts']} attempt/s)")
+
+    print()
+
+    # evict only once every push of this run is done, so no in-use cache entry is removed
+    self.oci_cache.evict(keep=[result['source_digest'] for result in results.values() if result.get('source_digest')],
+                         logger=logger)
+
+    return results
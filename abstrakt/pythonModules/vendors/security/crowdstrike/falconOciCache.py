@@ -0,0 +1,229 @@
+import os
+import fcntl
+import shutil
+import inspect
+import contextlib
+import threading
+import subprocess
+
+
+class FalconOciCache:
+  """
+  Local content-addressed cache of CrowdStrike images in OCI layout.
+
+  Every image is stored once per manifest digest under $XDG_CACHE_HOME/abstrakt/oci (or ~/.cache/abstrakt/oci)
+  and becomes the source for every push of that digest, so mirroring one image to several registries costs one
+  download. Images are cached and pushed with --preserve-digests, so the target ends up with the source's
+  manifest digest; images skopeo can't store in OCI layout unchanged (Docker schema2 manifests) are not cached.
+  Entries are evicted least recently used first once the cache grows past ABSTRAKT_OCI_CACHE_MAX_SIZE gigabytes
+  (default 20), except those a push still reads from. Set ABSTRAKT_OCI_CACHE=0 to disable the cache.
+  """
+
+  default_max_size: float = 20
+  image_reference: str = 'image'
+  complete_marker: str = '.complete-preserved'
+  # entries filled before digests were preserved, never used again and evicted first
+  legacy_complete_marker: str = '.complete'
+
+  _digest_locks: dict[str, threading.Lock] = {}
+  _digest_locks_lock = threading.Lock()
+
+  def __init__(self, logger, cache_dir: str | None = None, max_size: float | None = None):
+    self.logger = logger
+
+    self.enabled: bool = os.environ.get('ABSTRAKT_OCI_CACHE', '1').lower() not in ('0', 'false', 'no')
+    self.cache_dir: str = cache_dir or os.path.join(
+      os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'abstrakt', 'oci')
+
+    max_size = max_size if max_size is not None else float(os.environ.get('ABSTRAKT_OCI_CACHE_MAX_SIZE',
+                                                                          self.default_max_size))
+    self.max_size_bytes: int = int(max_size * 1024 ** 3)
+
+  def get_entry_path(self, digest: str, platform: str | None = None) -> str:
+    entry_name: str = digest.replace(':', '-')
+
+    return os.path.join(self.cache_dir, f'{entry_name}-{platform}' if platform else entry_name)
+
+  def get_oci_reference(self, digest: str, platform: str | None = None) -> str:
+    return f'oci:{self.get_entry_path(digest=digest, platform=platform)}:{self.image_reference}'
+
+  def is_cached(self, digest: str, platform: str | None = None) -> bool:
+    return os.path.exists(os.path.join(self.get_entry_path(digest=digest, platform=platform), self.complete_marker))
+
+  def touch_entry(self, digest: str, platform: str | None = None):
+    os.utime(os.path.join(self.get_entry_path(digest=digest, platform=platform), self.complete_marker))
+
+  def get_digest_lock(self, digest: str) -> threading.Lock:
+    with self._digest_locks_lock:
+      return self._digest_locks.setdefault(digest, threading.Lock())
+
+  def ensure_image(self, source: str, tag: str, digest: str, src_creds: str | None = None,
+                   platform: str | None = None, copy_options: list | None = None, logger=None) -> str | None:
+    """
+    Returns an OCI layout reference holding source:tag, downloading it only if the digest is not cached yet.
+
+    Args:
+        source (str): Source image reference without tag.
+        tag (str): Source image tag.
+        digest (str): Manifest digest of source:tag, used as the cache key.
+        src_creds (str): 'username:password' for the source registry.
+        platform (str): Architecture when only one platform of a multi-arch image is cached.
+        copy_options (list): skopeo copy options selecting that platform.
+        logger: Logger object
+
+    Returns:
+        str | None: A skopeo 'oci:' reference, or None if the image could not be cached.
+    """
+    logger = logger or self.logger
+
+    if not self.enabled or not digest:
+      return None
+
+    entry_path: str = self.get_entry_path(digest=digest, platform=platform)
+
+    try:
+      os.makedirs(self.cache_dir, exist_ok=True)
+
+      # the thread lock guards workers in this process, the file lock guards concurrent abstrakt runs
+      with self.get_digest_lock(digest=entry_path), open(f'{entry_path}.lock', 'a') as lock_file:
+        # shared first, so a cached entry is found while other pushes are reading it
+        fcntl.flock(lock_file, fcntl.LOCK_SH)
+
+        if self.is_cached(digest=digest, platform=platform):
+          logger.info(f'Using cached image {digest} for {source}:{tag}')
+          self.touch_entry(digest=digest, platform=platform)
+          return self.get_oci_reference(digest=digest, platform=platform)
+
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        if self.is_cached(digest=digest, platform=platform):
+          self.touch_entry(digest=digest, platform=platform)
+          return self.get_oci_reference(digest=digest, platform=platform)
+
+        shutil.rmtree(entry_path, ignore_errors=True)
+
+        command: list = ['skopeo', 'copy', '--preserve-digests'] + (copy_options or ['--multi-arch', 'all'])
+
+        if src_creds:
+          command += ['--src-creds', src_creds]
+
+        command += [f'docker://{source}@{digest}', self.get_oci_reference(digest=digest, platform=platform)]
+
+        logger.info(f'Caching {source}:{tag} ({digest}) in {entry_path}')
+        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+        if process.returncode != 0:
+          # also when the image can only be stored converted, it is then copied straight from its source
+          logger.error(process.stderr)
+          shutil.rmtree(entry_path, ignore_errors=True)
+          return None
+
+        open(os.path.join(entry_path, self.complete_marker), 'w').close()
+
+      return self.get_oci_reference(digest=digest, platform=platform)
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  @contextlib.contextmanager
+  def read_entry(self, digest: str | None, platform: str | None = None):
+    """
+    Holds a shared lock on an entry while a push reads from it, so that evict leaves it alone.
+
+    Yields:
+        bool: True if the entry is cached and locked, False if it is gone (e.g. evicted by another run).
+    """
+    if not self.enabled or not digest:
+      yield False
+      return
+
+    entry_path: str = self.get_entry_path(digest=digest, platform=platform)
+
+    with open(f'{entry_path}.lock', 'a') as lock_file:
+      fcntl.flock(lock_file, fcntl.LOCK_SH)
+
+      if not self.is_cached(digest=digest, platform=platform):
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        yield False
+        return
+
+      yield True
+
+  def get_marker(self, entry_path: str) -> str | None:
+    for marker in (self.complete_marker, self.legacy_complete_marker):
+      if os.path.exists(os.path.join(entry_path, marker)):
+        return os.path.join(entry_path, marker)
+
+    return None
+
+  @staticmethod
+  def get_directory_size(path: str) -> int:
+    size: int = 0
+
+    for root, _, files in os.walk(path):
+      for file in files:
+        try:
+          size += os.path.getsize(os.path.join(root, file))
+        except OSError:
+          pass
+
+    return size
+
+  def evict(self, keep: list[str] | None = None, logger=None) -> int:
+    """
+    Removes least recently used entries until the cache fits its size cap. Entries that are being filled or
+    pushed from, in this or any other abstrakt run, are skipped.
+
+    Args:
+        keep (list[str]): Digests that must not be evicted, e.g. the image about to be pushed.
+        logger: Logger object
+
+    Returns:
+        int: Number of bytes freed.
+    """
+    logger = logger or self.logger
+
+    try:
+      if not os.path.isdir(self.cache_dir):
+        return 0
+
+      protected: set = {self.get_entry_path(digest=digest) for digest in keep or []}
+      entries: list = []
+
+      for entry in os.listdir(self.cache_dir):
+        entry_path: str = os.path.join(self.cache_dir, entry)
+        marker: str | None = self.get_marker(entry_path=entry_path) if os.path.isdir(entry_path) else None
+
+        if marker:
+          last_used: float = 0 if marker.endswith(self.legacy_complete_marker) else os.path.getmtime(marker)
+          entries.append((last_used, entry_path, self.get_directory_size(entry_path)))
+
+      total_size: int = sum(size for _, _, size in entries)
+      freed: int = 0
+
+      for last_used, entry_path, size in sorted(entries):
+        if total_size - freed <= self.max_size_bytes:
+          break
+
+        # single-platform entries carry an -<architecture> suffix after the digest
+        if any(entry_path == path or entry_path.startswith(f'{path}-') for path in protected):
+          continue
+
+        with open(f'{entry_path}.lock', 'a') as lock_file:
+          try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+          except BlockingIOError:
+            logger.info(f'Not evicting {entry_path}, it is in use')
+            continue
+
+          logger.info(f'Evicting {entry_path} from image cache ({size / 1048576:.1f} MB)')
+          shutil.rmtree(entry_path, ignore_errors=True)
+
+        freed += size
+
+      return freed
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return 0
@@ -0,0 +1,170 @@
+import os
+import re
+import json
+import time
+import hashlib
+import inspect
+import threading
+from typing import Callable
+
+
+class FalconTagCatalogue:
+  """
+  Indexed, TTL-cached catalogue of CrowdStrike registry image tags.
+
+  Each repository's tag list is fetched once, then indexed into a set for membership checks and into
+  version-sorted lists per architecture for latest-N lookups. Indexes are kept in memory for the lifetime of
+  the process and persisted under $XDG_CACHE_HOME/abstrakt/tags (or ~/.cache/abstrakt/tags), so warm runs
+  resolve tags without touching the registry until ABSTRAKT_TAG_CACHE_TTL seconds (default 900) have passed.
+  """
+
+  default_ttl: int = 900
+  architectures: tuple = ('x86_64', 'aarch64')
+
+  _indexes: dict[str, tuple[dict, float]] = {}
+  _indexes_lock = threading.Lock()
+  _repository_locks: dict[str, threading.Lock] = {}
+
+  def __init__(self, logger, ttl: int | None = None):
+    self.logger = logger
+
+    self.ttl: int = ttl if ttl is not None else int(os.environ.get('ABSTRAKT_TAG_CACHE_TTL', self.default_ttl))
+    self.cache_dir: str = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                                       'abstrakt', 'tags')
+
+  @staticmethod
+  def get_version_key(tag: str) -> list[int]:
+    return [int(number) for number in re.findall(r'\d+', tag)]
+
+  def build_index(self, tags: list) -> dict:
+    """
+    Builds a tag index from a raw registry tag list.
+
+    Args:
+        tags (list): Tags as returned by the registry tags/list endpoint.
+
+    Returns:
+        dict: 'tags' holds every non-digest tag, 'versions' maps 'multi', 'x86_64' and 'aarch64' to
+              version-sorted tag lists.
+    """
+    image_tags: list = [tag for tag in tags if 'sha256' not in tag]
+    versions: dict[str, list] = {'multi': []}
+
+    for architecture in self.architectures:
+      versions[architecture] = []
+
+    for tag in image_tags:
+      for architecture in self.architectures:
+        if f'_{architecture}' in tag:
+          versions[architecture].append(tag)
+          break
+      else:
+        versions['multi'].append(tag)
+
+    for architecture_tags in versions.values():
+      architecture_tags.sort(key=self.get_version_key)
+
+    return {'tags': set(image_tags), 'versions': versions}
+
+  def get_cache_path(self, repository: str) -> str:
+    return os.path.join(self.cache_dir, f"{hashlib.sha256(repository.encode()).hexdigest()}.json")
+
+  def read_cached_tags(self, repository: str, logger=None) -> list | None:
+    logger = logger or self.logger
+
+    try:
+      cache_path: str = self.get_cache_path(repository=repository)
+
+      if not os.path.exists(cache_path):
+        return None
+
+      with open(cache_path, 'r') as cache_file:
+        entry: dict = json.load(cache_file)
+
+      if entry.get('repository') != repository or time.time() - entry['fetched_at'] >= self.ttl:
+        return None
+
+      return entry['tags']
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  def write_cached_tags(self, repository: str, tags: list, logger=None):
+    logger = logger or self.logger
+
+    try:
+      os.makedirs(self.cache_dir, exist_ok=True)
+
+      cache_path: str = self.get_cache_path(repository=repository)
+      temp_path: str = f'{cache_path}.{os.getpid()}'
+
+      with open(temp_path, 'w') as cache_file:
+        json.dump({'repository': repository, 'fetched_at': time.time(), 'tags': tags}, cache_file)
+
+      os.replace(temp_path, cache_path)
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+
+  def get_tag_index(self, repository: str, fetch_tags: Callable[[], list | None], logger=None) -> dict | None:
+    """
+    Returns the tag index for a repository, fetching the tag list only on a cache miss.
+
+    Args:
+        repository (str): Registry repository path, used as the cache key.
+        fetch_tags (Callable): Returns the full tag list of the repository from the registry.
+        logger: Logger object
+
+    Returns:
+        dict | None: Tag index as built by build_index, or None if the tags could not be fetched.
+    """
+    logger = logger or self.logger
+
+    # one lock per repository, so different repositories can be fetched concurrently
+    with self._indexes_lock:
+      repository_lock: threading.Lock = self._repository_locks.setdefault(repository, threading.Lock())
+
+    with repository_lock:
+      cached_index: tuple[dict, float] | None = self._indexes.get(repository)
+
+      if cached_index and time.time() - cached_index[1] < self.ttl:
+        return cached_index[0]
+
+      tags: list | None = self.read_cached_tags(repository=repository, logger=logger)
+
+      if tags is None:
+        tags = fetch_tags()
+
+        if tags is None:
+          return None
+
+        self.write_cached_tags(repository=repository, tags=tags, logger=logger)
+
+      index: dict = self.build_index(tags=tags)
+
+      with self._indexes_lock:
+        self._indexes[repository] = (index, time.time())
+
+      return index
+
+  @staticmethod
+  def is_tag_available(index: dict, image_tag: str) -> bool:
+    return image_tag in index['tags']
+
+  @staticmethod
+  def get_latest_tag(index: dict, offset: int = 0, architecture: str = 'multi') -> str | None:
+    """
+    Returns the tag that is offset versions behind the newest one, i.e. latest-<offset>.
+    """
+    architecture_tags: list = index['versions'].get(architecture, [])
+
+    if offset >= len(architecture_tags):
+      return None
+
+    return architecture_tags[-offset - 1]
+
+  @classmethod
+  def clear_indexes(cls):
+    with cls._indexes_lock:
+      cls._indexes.clear()
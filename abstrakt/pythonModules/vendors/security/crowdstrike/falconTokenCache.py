@@ -0,0 +1,120 @@
+import os
+import json
+import time
+import base64
+import hashlib
+import inspect
+
+from cryptography.fernet import Fernet, InvalidToken
+
+
+class FalconTokenCache:
+  """
+  Encrypted on-disk cache for Falcon OAuth tokens and registry credentials.
+
+  The cache is opt-in and is enabled by setting ABSTRAKT_TOKEN_CACHE=1. Entries live under
+  $XDG_CONFIG_HOME/abstrakt/tokens (or ~/.config/abstrakt/tokens), one file per client id, scope and region.
+  Each entry is encrypted with a key derived from the Falcon client id and secret, so a file can only be read
+  back with the credentials that wrote it.
+  """
+
+  enable_variable: str = 'ABSTRAKT_TOKEN_CACHE'
+
+  def __init__(self, falcon_client_id: str, falcon_client_secret: str, logger):
+    self.falcon_client_id: str = falcon_client_id
+    self.logger = logger
+
+    self.enabled: bool = os.environ.get(self.enable_variable, '').lower() in ('1', 'true', 'yes')
+    self.cache_dir: str = os.path.join(os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser('~/.config'),
+                                       'abstrakt', 'tokens')
+
+    key: bytes = hashlib.pbkdf2_hmac('sha256', falcon_client_secret.encode(), falcon_client_id.encode(), 100000)
+    self.fernet: Fernet = Fernet(base64.urlsafe_b64encode(key))
+
+  def get_entry_path(self, scope: str, region: str) -> str:
+    entry_name: str = hashlib.sha256(f'{self.falcon_client_id}:{scope}:{region}'.encode()).hexdigest()
+
+    return os.path.join(self.cache_dir, f'{entry_name}.token')
+
+  def get_token(self, scope: str, region: str, logger=None) -> str | None:
+    """
+    Returns the cached token for a scope and region if it exists and has not expired.
+
+    Args:
+        scope (str): Token scope, e.g. 'oauth2' or a registry repository path.
+        region (str): Falcon cloud region.
+        logger: Logger object
+
+    Returns:
+        str | None: The cached token, or None on a miss.
+    """
+    logger = logger or self.logger
+
+    if not self.enabled:
+      return None
+
+    entry_path: str = self.get_entry_path(scope=scope, region=region)
+
+    try:
+      if not os.path.exists(entry_path):
+        return None
+
+      with open(entry_path, 'rb') as entry_file:
+        entry: dict = json.loads(self.fernet.decrypt(entry_file.read()))
+
+      if time.time() >= entry['expires_at']:
+        self.invalidate_token(scope=scope, region=region, logger=logger)
+        return None
+
+      return entry['token']
+    except InvalidToken:
+      logger.info(f'Discarding unreadable token cache entry {entry_path}')
+      self.invalidate_token(scope=scope, region=region, logger=logger)
+      return None
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return None
+
+  def set_token(self, scope: str, region: str, token: str, expires_in: int, logger=None) -> bool:
+    logger = logger or self.logger
+
+    if not self.enabled or not token:
+      return False
+
+    entry_path: str = self.get_entry_path(scope=scope, region=region)
+
+    try:
+      os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+
+      entry: bytes = self.fernet.encrypt(json.dumps({'token': token,
+                                                     'expires_at': time.time() + int(expires_in)}).encode())
+
+      # write to a private temporary file first so concurrent readers never see a partial entry
+      temp_path: str = f'{entry_path}.{os.getpid()}'
+      file_descriptor: int = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+      with os.fdopen(file_descriptor, 'wb') as entry_file:
+        entry_file.write(entry)
+
+      os.replace(temp_path, entry_path)
+
+      return True
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
+      return False
+
+  def invalidate_token(self, scope: str, region: str, logger=None):
+    logger = logger or self.logger
+
+    if not self.enabled:
+      return
+
+    try:
+      os.remove(self.get_entry_path(scope=scope, region=region))
+    except FileNotFoundError:
+      pass
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
@@ -46,6 +46,8 @@ class DetectionsContainer:
       if process.stderr:
         logger.info(process.stderr)
 
+    return True
+
   def deploy_detections_containers(self, cluster_type, mode, logger=None):
     logger = logger or self.logger
 
@@ -57,7 +59,8 @@ class DetectionsContainer:
 
     if k8s.namespace_exists(namespace_name='crowdstrike-detections'):
       captured_pods, status = k8s.find_pods_with_status(pod_string='detections-container',
-                                                        namespace='crowdstrike-detections')
+                                                        namespace='crowdstrike-detections',
+                                                        label_selector='run=detections-container')
 
       if (status is True) and (len(captured_pods['running']) > 0):
         print('Detections container found up and running in crowdstrike-detections namespace. Not proceeding with '
@@ -67,23 +70,31 @@ class DetectionsContainer:
           print(pod)
 
         print()
-        return
+        return True
 
     try:
       with MultiProcessing() as mp:
-        mp.execute_with_progress_indicator(self.detections_containers_thread, logger, 0.5, 900)
+        status = mp.execute_with_progress_indicator(self.detections_containers_thread, logger, 0.5, 900)
+
+      if status is not True:
+        print('Detections containers installation failed\n')
+        return False
 
       printf('All Detections containers installation successful\n', logger=self.logger)
 
       container = ContainerOps(logger=logger)
 
-      detections_containers = ['detections-container', 'vulnerable.example.com', 'generic-tools']
+      # pod name -> label set on the pod template by its manifest in conf/crowdstrike/detections-container
+      detections_containers = {'detections-container': 'run=detections-container',
+                               'vulnerable.example.com': 'run=vulnerable.example.com',
+                               'generic-tools': 'app=generic-tools'}
       pods: dict = {}
 
-      for detections_container in detections_containers:
+      for detections_container, label_selector in detections_containers.items():
         pods[detections_container] = container.pod_checker(pod_name=detections_container,
                                                            namespace='crowdstrike-detections',
-                                                           kubeconfig_path='~/.kube/config')
+                                                           kubeconfig_path='~/.kube/config',
+                                                           label_selector=label_selector)
         print()
 
       print('Retrieving ip address of vulnerable app service object...\n')
@@ -113,8 +124,10 @@ class DetectionsContainer:
           print('Neither vulnerable container nor detections container found. Artificial detections will not appear '
                 'on the console.\n')
 
+      return True
     except Exception as e:
       logger.error(f'Error: {e}')
+      return False
 
   def generate_sh_detections(self, detections_container, logger=None):
     logger = logger or self.logger
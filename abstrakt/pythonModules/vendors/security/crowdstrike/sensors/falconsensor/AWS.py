@@ -8,6 +8,7 @@ from pathlib import Path
 from botocore.exceptions import ClientError
 
 from abstrakt.pythonModules.customLogging.customLogging import CustomLogger
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconImageMirror import FalconImageMirror
 from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.CrowdStrikeSensors import CrowdStrikeSensors
 
 
@@ -158,27 +159,24 @@ class AWS(CrowdStrikeSensors):
     logger = logger or self.logger
     partial_pull_token: str = self.get_ecr_partial_pull_token(region=registry.split('.')[3])
 
-    if self.add_crowdstrike_helm_repo() is True:
-      try:
-        if partial_pull_token != 'None':
-          falcon_image_pull_data = {
-            "auths": {
-              f"{registry}": {
-                "auth": partial_pull_token
-              }
+    try:
+      if partial_pull_token != 'None':
+        falcon_image_pull_data = {
+          "auths": {
+            f"{registry}": {
+              "auth": partial_pull_token
             }
           }
+        }
 
-          falcon_image_pull_token: str = base64.b64encode(json.dumps(falcon_image_pull_data).encode()).decode()
+        falcon_image_pull_token: str = base64.b64encode(json.dumps(falcon_image_pull_data).encode()).decode()
 
-          return falcon_image_pull_token
-        else:
-          return None
-      except Exception as e:
-        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-        logger.error(f'{e}')
+        return falcon_image_pull_token
+      else:
         return None
-    else:
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
       return None
 
   def copy_crowdstrike_image_to_ecr(self, source_registry: str, target_registry: str,
@@ -212,6 +210,54 @@ class AWS(CrowdStrikeSensors):
       logger.error(f"{e.stderr}")
       return False
 
+  def mirror_crowdstrike_images(self, images: dict[str, str], platforms: list[str] | None = None,
+                                logger=None) -> dict[str, dict]:
+    """
+    Copies the CrowdStrike images of several components to ECR concurrently.
+
+    Args:
+        images (dict[str, str]): Maps sensor type (daemonset, sidecar, falcon-kac, falcon-imageanalyzer) to a
+                                 resolved image tag.
+        platforms (list[str]): Architectures to mirror (e.g. ['amd64']). All platforms are mirrored if None.
+        logger: Logger object
+
+    Returns:
+        dict[str, dict]: Per-image mirror results. Images whose ECR digest already matches are skipped.
+    """
+    logger = logger or self.logger
+
+    registry: str = self.registry
+
+    if self.check_registry_type(registry=registry, logger=logger) != 'ecr':
+      return {}
+
+    if not self.check_ecr_registry_exists(registry=registry, logger=logger):
+      return {}
+
+    ecr_password, error = self.run_command(command=f"aws ecr get-login-password --region {registry.split('.')[3]}",
+                                           logger=logger)
+
+    if not ecr_password:
+      return {}
+
+    jobs: list[dict] = []
+
+    for sensor_type, image_tag in images.items():
+      repository: str = self.repository or self.get_default_repository_name(sensor_type=sensor_type)
+
+      if not self.check_ecr_repository_exists(registry=registry, repository=repository, logger=logger):
+        self.create_ecr_repository(registry=registry, repository=repository, sensor_type=sensor_type, logger=logger)
+
+      jobs.append({'name': sensor_type,
+                   'source': self.get_crowdstrike_registry(sensor_type=sensor_type),
+                   'tag': image_tag,
+                   'target': f'{registry}/{repository}',
+                   'src_creds': f'{self.falcon_art_username}:{self.falcon_art_password}',
+                   'dest_creds': f'AWS:{ecr_password.strip()}',
+                   'platforms': platforms})
+
+    return FalconImageMirror(logger=logger).mirror_images(jobs=jobs)
+
   def get_image_registry(self, registry: str, registry_type: str, sensor_type: str) -> str | None:
     if registry:
       if registry_type == 'ecr':
@@ -1,5 +1,6 @@
 import inspect
 
+from abstrakt.pythonModules.kubernetesOps.helmOps import HelmOps
 from abstrakt.pythonModules.kubernetesOps.kubectlOps import KubectlOps
 from abstrakt.pythonModules.kubernetesOps.containerOps import ContainerOps
 from abstrakt.pythonModules.multiProcess.multiProcessing import MultiProcessing
@@ -7,12 +8,18 @@ from abstrakt.pythonModules.multiProcess.multiProcessing import MultiProcessing
 
 class AWSFalconSensor:
   @staticmethod
-  def check_falcon_sensor_installation(sensor_names: list, namespace: str, logger) -> bool:
+  def check_falcon_sensor_installation(sensor_names: list, namespace: str, logger,
+                                       release_name: str | None = None) -> bool:
     k8s = KubectlOps(logger=logger)
 
+    # sensors of the release abstrakt installed are upgraded in place only if their values changed
+    if release_name and HelmOps(logger=logger).is_helm_chart_deployed(release_name=release_name, namespace=namespace):
+      return False
+
     for falcon_sensor in sensor_names:
       if k8s.namespace_exists(namespace_name=namespace):
-        captured_pods, status = k8s.find_pods_with_status(pod_string=falcon_sensor, namespace=namespace)
+        captured_pods, status = k8s.find_pods_with_status(pod_string=falcon_sensor, namespace=namespace,
+                                                          label_selector='app.kubernetes.io/name=falcon-sensor')
 
         if (status is True) and (len(captured_pods['running']) > 0):
           print('Falcon sensors found up and running in falcon-system namespace. Skipping installation...')
@@ -28,13 +35,15 @@ class AWSFalconSensor:
   @staticmethod
   def check_falcon_sensor_pods(pod_name: str, namespace: str, logger):
     container = ContainerOps(logger=logger)
-    container.pod_checker(pod_name=pod_name, namespace=namespace, kubeconfig_path='~/.kube/config')
+    container.pod_checker(pod_name=pod_name, namespace=namespace, kubeconfig_path='~/.kube/config',
+                          label_selector='app.kubernetes.io/name=falcon-sensor')
 
   @staticmethod
   def execute_helm_chart(thread, logger) -> bool:
     try:
       with MultiProcessing() as mp:
-        return True if mp.execute_with_progress_indicator(thread, logger, 0.5, 600) else False
+        # a crashed or timed out thread comes back as a message instead of the thread's result
+        return mp.execute_with_progress_indicator(thread, logger, 0.5, 600) is True
     except Exception as e:
       logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
       logger.error(f'Error: {e}')
@@ -7,6 +7,7 @@ from azure.identity import DefaultAzureCredential
 from azure.containerregistry import ContainerRegistryClient
 from azure.mgmt.containerregistry import ContainerRegistryManagementClient
 
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconImageMirror import FalconImageMirror
 from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.CrowdStrikeSensors import CrowdStrikeSensors
 
 
@@ -325,6 +326,50 @@ class Azure(CrowdStrikeSensors):
 
     return True if output is not None else False
 
+  def mirror_crowdstrike_images(self, images: dict[str, str], sp_name: str, sp_pass: str,
+                                platforms: list[str] | None = None, logger=None) -> dict[str, dict]:
+    """
+    Copies the CrowdStrike images of several components to ACR concurrently.
+
+    Args:
+        images (dict[str, str]): Maps sensor type (daemonset, falcon-kac, falcon-imageanalyzer) to a resolved
+                                 image tag.
+        sp_name (str): Service principal used to push to ACR.
+        sp_pass (str): Service principal password.
+        platforms (list[str]): Architectures to mirror (e.g. ['amd64']). All platforms are mirrored if None.
+        logger: Logger object
+
+    Returns:
+        dict[str, dict]: Per-image mirror results. Images whose ACR digest already matches are skipped.
+    """
+    logger = logger or self.logger
+
+    registry: str = self.registry
+
+    if self.check_registry_type(registry=registry, logger=logger) != 'acr':
+      return {}
+
+    az_username, az_password = self.get_service_principal_credentials(registry=registry, sp_name=sp_name,
+                                                                      sp_pass=sp_pass, logger=logger)
+
+    if az_username is None or az_password is None:
+      return {}
+
+    jobs: list[dict] = []
+
+    for sensor_type, image_tag in images.items():
+      repository: str = self.repository or self.get_default_repository_name(sensor_type=sensor_type)
+
+      jobs.append({'name': sensor_type,
+                   'source': self.get_crowdstrike_registry(sensor_type=sensor_type),
+                   'tag': image_tag,
+                   'target': f'{registry}/{repository}',
+                   'src_creds': f'{self.falcon_art_username}:{self.falcon_art_password}',
+                   'dest_creds': f'{az_username}:{az_password}',
+                   'platforms': platforms})
+
+    return FalconImageMirror(logger=logger).mirror_images(jobs=jobs)
+
   def get_image_registry(self, registry: str, registry_type: str, sensor_type: str) -> str | None:
     if registry:
       if registry_type == 'acr':
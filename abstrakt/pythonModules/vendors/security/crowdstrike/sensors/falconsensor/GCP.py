@@ -5,6 +5,7 @@ import subprocess
 from time import sleep
 from typing import Optional
 
+from abstrakt.pythonModules.vendors.security.crowdstrike.falconImageMirror import FalconImageMirror
 from abstrakt.pythonModules.vendors.security.crowdstrike.sensors.CrowdStrikeSensors import CrowdStrikeSensors
 
 
@@ -595,29 +596,71 @@ class GCP(CrowdStrikeSensors):
 
     partial_pull_token: str = self.get_artifact_partial_pull_token(access_token=access_token)
 
-    if self.add_crowdstrike_helm_repo(logger=logger) is True:
-      try:
-        if partial_pull_token != 'None':
-          falcon_image_pull_data = {
-            "auths": {
-              f"{registry}": {
-                "auth": partial_pull_token
-              }
+    try:
+      if partial_pull_token != 'None':
+        falcon_image_pull_data = {
+          "auths": {
+            f"{registry}": {
+              "auth": partial_pull_token
             }
           }
+        }
 
-          falcon_image_pull_token: str = base64.b64encode(json.dumps(falcon_image_pull_data).encode()).decode()
+        falcon_image_pull_token: str = base64.b64encode(json.dumps(falcon_image_pull_data).encode()).decode()
 
-          return falcon_image_pull_token
-        else:
-          return None
-      except Exception as e:
-        logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
-        logger.error(f'{e}')
+        return falcon_image_pull_token
+      else:
         return None
-    else:
+    except Exception as e:
+      logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
+      logger.error(f'{e}')
       return None
 
+  def mirror_crowdstrike_images(self, images: dict[str, str], platforms: list[str] | None = None,
+                                logger=None) -> dict[str, dict]:
+    """
+    Copies the CrowdStrike images of several components to Google Artifact Registry concurrently.
+
+    Args:
+        images (dict[str, str]): Maps sensor type (daemonset, falcon-kac, falcon-imageanalyzer) to a resolved
+                                 image tag.
+        platforms (list[str]): Architectures to mirror (e.g. ['amd64']). All platforms are mirrored if None.
+        logger: Logger object
+
+    Returns:
+        dict[str, dict]: Per-image mirror results. Images whose digest already matches are skipped.
+    """
+    logger = logger or self.logger
+
+    registry: str = self.registry
+
+    if self.check_registry_type(registry=registry, logger=logger) != 'artifact':
+      return {}
+
+    access_tokens: dict[str, str | None] = {}
+    jobs: list[dict] = []
+
+    for sensor_type, image_tag in images.items():
+      repository: str = self.repository or self.get_default_repository_name(sensor_type=sensor_type)
+
+      # the access token call also creates the repository and its IAM bindings, so run it once per repository
+      if repository not in access_tokens:
+        access_tokens[repository] = self.get_access_token(repository=repository, location=self.location,
+                                                          service_account=self.service_account, logger=logger)
+
+      if not access_tokens[repository]:
+        continue
+
+      jobs.append({'name': sensor_type,
+                   'source': self.get_crowdstrike_registry(sensor_type=sensor_type),
+                   'tag': image_tag,
+                   'target': f'{registry}/{self.project_id}/{repository}/{image_tag.lower()}',
+                   'src_creds': f'{self.falcon_art_username}:{self.falcon_art_password}',
+                   'dest_creds': f'oauth2accesstoken:{access_tokens[repository]}',
+                   'platforms': platforms})
+
+    return FalconImageMirror(logger=logger).mirror_images(jobs=jobs)
+
   def get_image_registry(self, registry: str, registry_type: str, sensor_type: str) -> Optional[str]:
     """
     Determines the image registry URL based on the registry type and sensor type.
@@ -104,9 +104,13 @@ class AWSDaemonsetInstall(AWS, AWSFalconSensor):
 
     pull_token: str = self.get_daemonset_image_pull_token(registry=registry)
 
+    self.add_crowdstrike_helm_repo(logger=logger)
+
     if registry and image_tag and pull_token:
+      falcon_sensor_chart: str = self.helm_chart_cache.get_chart(chart='crowdstrike/falcon-sensor', logger=logger)
+
       helm_chart: list = [
-        "helm", "upgrade", "--install", "daemonset-falcon-sensor", "crowdstrike/falcon-sensor",
+        "helm", "upgrade", "--install", "daemonset-falcon-sensor", falcon_sensor_chart,
         "-n", "falcon-system", "--create-namespace",
         "--set", f"falcon.cid={self.falcon_cid}",
         "--set", f"node.image.tag={image_tag}",
@@ -145,8 +149,7 @@ class AWSDaemonsetInstall(AWS, AWSFalconSensor):
 
     if helm_chart:
       logger.info(f'Running command: {helm_chart}')
-      if self.run_command(command=helm_chart):
-        return True
+      return self.install_helm_release(command=helm_chart, logger=logger)
     else:
       return False
 
@@ -161,12 +164,17 @@ class AWSDaemonsetInstall(AWS, AWSFalconSensor):
                                                            'falcon-helm-falcon-sensor',
                                                            'falcon-sensor'],
                                              namespace='falcon-system',
-                                             logger=logger):
-      return
+                                             logger=logger,
+                                             release_name='daemonset-falcon-sensor'):
+      return True
 
     if self.execute_helm_chart(self.execute_daemonset_falcon_sensor_thread, logger=logger):
       print("Falcon sensor installation successful\n")
 
       self.check_falcon_sensor_pods(pod_name='falcon-sensor', namespace='falcon-system', logger=logger)
+
+      return True
     else:
       print("Falcon sensor installation failed\n")
+
+      return False
@@ -86,9 +86,13 @@ class AzureDaemonset(Azure):
       self.logger.error('No image pull token found.')
       return False
 
+    self.add_crowdstrike_helm_repo(logger=logger)
+
     if registry and image_tag and image_pull_token:
+      falcon_sensor_chart: str = self.helm_chart_cache.get_chart(chart='crowdstrike/falcon-sensor', logger=logger)
+
       helm_chart = [
-        "helm", "upgrade", "--install", "daemonset-falcon-sensor", "crowdstrike/falcon-sensor",
+        "helm", "upgrade", "--install", "daemonset-falcon-sensor", falcon_sensor_chart,
         "-n", "falcon-system", "--create-namespace",
         "--set", f"falcon.cid={self.falcon_cid}",
         "--set", f"node.image.tag={image_tag}",
@@ -129,9 +133,7 @@ class AzureDaemonset(Azure):
       command = ' '.join(helm_chart)
 
       self.logger.info(f'Running command: {command}')
-      self.run_command(command=command, logger=logger)
-
-      return True
+      return self.install_helm_release(command=command, logger=logger)
     else:
       return False
 
@@ -140,10 +142,10 @@ class AzureDaemonset(Azure):
 
     try:
       with MultiProcessing() as mp:
-        return True if mp.execute_with_progress_indicator(self.azure_daemonset_falcon_sensor_thread,
-                                                          logger,
-                                                          0.5,
-                                                          900) else False
+        return mp.execute_with_progress_indicator(self.azure_daemonset_falcon_sensor_thread,
+                                                  logger,
+                                                  0.5,
+                                                  900) is True
       # with MultiThreading() as mt:
       #   return True if mt.run_with_progress_indicator(self.azure_daemonset_falcon_sensor_thread, 1, 300) else False
     except Exception as e:
@@ -165,21 +167,31 @@ class AzureDaemonset(Azure):
 
     for falcon_sensor in falcon_sensor_names:
       if k8s.namespace_exists(namespace_name='falcon-system'):
-        captured_pods, status = k8s.find_pods_with_status(pod_string=falcon_sensor, namespace='falcon-system')
+        captured_pods, status = k8s.find_pods_with_status(pod_string=falcon_sensor, namespace='falcon-system',
+                                                          label_selector='app.kubernetes.io/name=falcon-sensor')
+
+        # running pods of the release abstrakt installed are upgraded in place only if their values changed
+        managed_release: bool = self.helm_ops.is_helm_chart_deployed(release_name='daemonset-falcon-sensor',
+                                                                     namespace='falcon-system')
 
-        if (status is True) and (len(captured_pods['running']) > 0):
+        if (status is True) and (len(captured_pods['running']) > 0) and not managed_release:
           print('Falcon sensors found up and running in falcon-system namespace. Not proceeding with installation.')
 
           for pod in captured_pods['running']:
             print(pod)
 
           print(' ')
-          return
+          return True
 
     if self.execute_helm_chart(logger=logger):
       print("Falcon sensor installation successful\n")
 
       container = ContainerOps(logger=logger)
-      container.pod_checker(pod_name='falcon-sensor', namespace='falcon-system', kubeconfig_path='~/.kube/config')
+      container.pod_checker(pod_name='falcon-sensor', namespace='falcon-system', kubeconfig_path='~/.kube/config',
+                            label_selector='app.kubernetes.io/name=falcon-sensor')
+
+      return True
     else:
       print("Falcon sensor installation failed\n")
+
+      return False
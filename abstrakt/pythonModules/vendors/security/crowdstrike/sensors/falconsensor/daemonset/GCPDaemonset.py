@@ -72,9 +72,13 @@ class GCPDaemonset(GCP):
 
     pull_token: str = self.get_image_pull_token(registry=registry, access_token=access_token, logger=logger)
 
+    self.add_crowdstrike_helm_repo(logger=logger)
+
     if registry and image_tag and pull_token:
+      falcon_sensor_chart: str = self.helm_chart_cache.get_chart(chart='crowdstrike/falcon-sensor', logger=logger)
+
       helm_chart = [
-        "helm", "upgrade", "--install", "daemonset-falcon-sensor", "crowdstrike/falcon-sensor",
+        "helm", "upgrade", "--install", "daemonset-falcon-sensor", falcon_sensor_chart,
         "-n", "falcon-system", "--create-namespace",
         "--set", f"falcon.cid={self.falcon_cid}",
         "--set", f"node.image.tag={image_tag}",
@@ -140,7 +144,7 @@ class GCPDaemonset(GCP):
       command = ' '.join(helm_chart)
 
       logger.info(f'Running command: {command}')
-      self.run_command(command=command, logger=logger)
+      installed: bool = self.install_helm_release(command=command, logger=logger)
 
       if cluster_type == 'gke-autopilot':
         command = 'kubectl delete -f abstrakt/conf/crowdstrike/detections-container/default-vulnerable-app.yaml'
@@ -148,7 +152,7 @@ class GCPDaemonset(GCP):
         logger.info(f'Running command: {command}')
         self.run_command(command=command, logger=logger)
 
-      return True
+      return installed
     else:
       return False
 
@@ -159,11 +163,11 @@ class GCPDaemonset(GCP):
       # with MultiThreading() as mt:
       #   return True if mt.run_with_progress_indicator(self.daemonset_thread, 1, 300, cluster_type) else False
       with MultiProcessing() as mp:
-        return True if mp.execute_with_progress_indicator(self.daemonset_thread,
-                                                          logger,
-                                                          0.5,
-                                                          900,
-                                                          cluster_type) else False
+        return mp.execute_with_progress_indicator(self.daemonset_thread,
+                                                  logger,
+                                                  0.5,
+                                                  900,
+                                                  cluster_type) is True
     except Exception as e:
       logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
       logger.error(f'Error: {e}')
@@ -180,7 +184,8 @@ class GCPDaemonset(GCP):
       self.execute_default_app()
 
       container = ContainerOps(logger=logger)
-      container.pod_checker(pod_name='vulnerable-example-com', namespace='default', kubeconfig_path='~/.kube/config')
+      container.pod_checker(pod_name='vulnerable-example-com', namespace='default', kubeconfig_path='~/.kube/config',
+                            label_selector='run=vulnerable-example-com')
 
       print('\nAll these pods are temporary, were created to spin up nodes, and will be deleted in a few moments.\n')
 
@@ -194,21 +199,31 @@ class GCPDaemonset(GCP):
 
     for falcon_sensor in falcon_sensor_names:
       if k8s.namespace_exists(namespace_name='falcon-system'):
-        captured_pods, status = k8s.find_pods_with_status(pod_string=falcon_sensor, namespace='falcon-system')
+        captured_pods, status = k8s.find_pods_with_status(pod_string=falcon_sensor, namespace='falcon-system',
+                                                          label_selector='app.kubernetes.io/name=falcon-sensor')
+
+        # running pods of the release abstrakt installed are upgraded in place only if their values changed
+        managed_release: bool = self.helm_ops.is_helm_chart_deployed(release_name='daemonset-falcon-sensor',
+                                                                     namespace='falcon-system')
 
-        if (status is True) and (len(captured_pods['running']) > 0):
+        if (status is True) and (len(captured_pods['running']) > 0) and not managed_release:
           print('Falcon sensors found up and running in falcon-system namespace. Not proceeding with installation.')
 
           for pod in captured_pods['running']:
             print(pod)
 
           print(' ')
-          return
+          return True
 
     if self.execute_helm_chart(cluster_type=self.cluster_type):
       print("Falcon sensor installation successful\n")
 
       container = ContainerOps(logger=logger)
-      container.pod_checker(pod_name='falcon-sensor', namespace='falcon-system', kubeconfig_path='~/.kube/config')
+      container.pod_checker(pod_name='falcon-sensor', namespace='falcon-system', kubeconfig_path='~/.kube/config',
+                            label_selector='app.kubernetes.io/name=falcon-sensor')
+
+      return True
     else:
       print("Falcon sensor installation failed\n")
+
+      return False
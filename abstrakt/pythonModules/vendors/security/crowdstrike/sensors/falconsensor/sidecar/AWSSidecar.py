@@ -120,9 +120,13 @@ class AWSSidecar(AWSSpecs, AWSFalconSensor):
 
       pull_token: str = self.get_sidecar_image_pull_token(registry=registry)
 
+      self.add_crowdstrike_helm_repo(logger=logger)
+
       if registry and image_tag and pull_token:
+        falcon_sensor_chart: str = self.helm_chart_cache.get_chart(chart='crowdstrike/falcon-sensor', logger=logger)
+
         helm_chart = [
-          "helm", "upgrade", "--install", "sidecar-falcon-sensor", "crowdstrike/falcon-sensor",
+          "helm", "upgrade", "--install", "sidecar-falcon-sensor", falcon_sensor_chart,
           "-n", "falcon-system", "--create-namespace",
           "--set", "node.enabled=false",
           "--set", "container.enabled=true",
@@ -266,8 +270,7 @@ class AWSSidecar(AWSSpecs, AWSFalconSensor):
       if helm_chart:
         command = ' '.join(helm_chart)
         logger.info(f'Running command: {command}')
-        self.run_command(command=command, logger=logger)
-        return True
+        return self.install_helm_release(command=command, logger=logger)
       else:
         logger.error('Helm chart not found.')
         return False
@@ -286,12 +289,17 @@ class AWSSidecar(AWSSpecs, AWSFalconSensor):
     if self.check_falcon_sensor_installation(sensor_names=['sidecar-falcon-sensor', 'falcon-sensor-injector',
                                                            'falcon-sensor'],
                                              namespace='falcon-system',
-                                             logger=logger):
-      return
+                                             logger=logger,
+                                             release_name='sidecar-falcon-sensor'):
+      return True
 
     if self.execute_helm_chart(self.execute_sidecar_falcon_sensor_thread, logger=logger):
       print("Falcon sensor installation successful\n")
 
       self.check_falcon_sensor_pods(pod_name='falcon-sensor', namespace='falcon-system', logger=logger)
+
+      return True
     else:
       print("Falcon sensor installation failed\n")
+
+      return False
@@ -74,8 +74,7 @@ class GCPIAR(GCP):
         logger.error('No image pull token found.')
         return False
 
-      self.run_command("helm repo add crowdstrike https://crowdstrike.github.io/falcon-helm", logger=logger)
-      self.run_command("helm repo update", logger=logger)
+      self.add_crowdstrike_helm_repo(logger=logger)
       self.run_command("kubectl create namespace falcon-image-analyzer", logger=logger)
       self.run_command("kubectl label --overwrite ns falcon-image-analyzer "
                        "pod-security.kubernetes.io/enforce=privileged", logger=logger)
@@ -91,7 +90,9 @@ class GCPIAR(GCP):
           if 'certificate-authority-data' not in x:
             cluster_name = x
 
-      iar_helm_chart = f"""helm upgrade --install image-analyzer crowdstrike/falcon-image-analyzer \
+      iar_chart: str = self.helm_chart_cache.get_chart(chart='crowdstrike/falcon-image-analyzer', logger=logger)
+
+      iar_helm_chart = f"""helm upgrade --install image-analyzer {iar_chart} \
                           -n falcon-image-analyzer --create-namespace \
                           --set deployment.enabled=true \
                           --set crowdstrikeConfig.cid="{self.falcon_cid}" \
@@ -107,9 +108,7 @@ class GCPIAR(GCP):
       elif registry_type == 'artifact':
         iar_helm_chart += f' --set image.repository={registry}/{self.project_id}/{repository}/{image_tag.lower()}'
 
-      self.run_command(iar_helm_chart, logger=logger)
-
-      return True
+      return self.install_helm_release(iar_helm_chart, logger=logger)
     except Exception as e:
       logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
       logger.error(f'{e}')
@@ -125,19 +124,24 @@ class GCPIAR(GCP):
     k8s = KubectlOps(logger=logger)
 
     if k8s.namespace_exists(namespace_name='falcon-image-analyzer'):
-      captured_pods, status = k8s.find_pods_with_status(pod_string='image-analyzer', namespace='falcon-image-analyzer')
+      captured_pods, status = k8s.find_pods_with_status(pod_string='image-analyzer', namespace='falcon-image-analyzer',
+                                                        label_selector='app.kubernetes.io/instance=image-analyzer')
+
+      # running pods of the release abstrakt installed are upgraded in place only if their values changed
+      managed_release: bool = self.helm_ops.is_helm_chart_deployed(release_name='image-analyzer',
+                                                                   namespace='falcon-image-analyzer')
 
-      if (status is True) and (len(captured_pods['running']) > 0):
+      if (status is True) and (len(captured_pods['running']) > 0) and not managed_release:
         print('Falcon Image Analyzer found up and running in falcon-image-analyzer namespace. Skipping installation...')
 
         for pod in captured_pods['running']:
           print(pod)
 
         print(' ')
-        return
+        return True
 
     with MultiProcessing() as mp:
-      status = mp.execute_with_progress_indicator(self.execute_iar_installation_process, logger, 0.5, 900)
+      status = mp.execute_with_progress_indicator(self.execute_iar_installation_process, logger, 0.5, 900) is True
     # with MultiThreading() as mt:
     #   status = mt.run_with_progress_indicator(self.execute_iar_installation_process, 1, 300)
 
@@ -146,6 +150,11 @@ class GCPIAR(GCP):
 
       container = ContainerOps(logger=logger)
       container.pod_checker(pod_name='image-analyzer', namespace='falcon-image-analyzer',
-                            kubeconfig_path='~/.kube/config', logger=logger)
+                            kubeconfig_path='~/.kube/config',
+                            label_selector='app.kubernetes.io/instance=image-analyzer', logger=logger)
+
+      return True
     else:
       print('IAR installation failed\n')
+
+      return False
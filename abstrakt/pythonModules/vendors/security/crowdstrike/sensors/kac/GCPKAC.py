@@ -76,18 +76,12 @@ class GCPKAC(GCP):
       return False
 
     # Install Helm repository and release
-    command = 'helm repo add crowdstrike https://crowdstrike.github.io/falcon-helm'
-    self.run_command(command=command, logger=logger)
+    self.add_crowdstrike_helm_repo(logger=logger)
 
-    command = 'helm repo update'
-    self.run_command(command=command, logger=logger)
+    falcon_kac_repo = self.helm_chart_cache.get_chart(chart='crowdstrike/falcon-kac', logger=logger)
 
-    command = 'helm repo list'
-    self.run_command(command=command, logger=logger)
-
-    falcon_kac_repo = "crowdstrike/falcon-kac"
-
-    kac_helm_chart = ["helm", "install", "falcon-kac", falcon_kac_repo, "-n", "falcon-kac", "--create-namespace",
+    kac_helm_chart = ["helm", "upgrade", "--install", "falcon-kac", falcon_kac_repo,
+                      "-n", "falcon-kac", "--create-namespace",
                       "--set", f"falcon.cid={self.falcon_cid}",
                       "--set", f"image.tag={image_tag}",
                       "--set", f"image.registryConfigJSON={pull_token}"]
@@ -106,7 +100,7 @@ class GCPKAC(GCP):
 
     command = ' '.join(kac_helm_chart)
 
-    self.run_command(command=command, logger=logger)
+    return self.install_helm_release(command=command, logger=logger)
 
   def deploy_falcon_kac(self, logger=None):
     logger = logger or self.logger
@@ -118,35 +112,48 @@ class GCPKAC(GCP):
     k8s = KubectlOps(logger=logger)
 
     if k8s.namespace_exists(namespace_name='falcon-kac'):
-      captured_pods, status = k8s.find_pods_with_status(pod_string='falcon-kac', namespace='falcon-kac')
+      captured_pods, status = k8s.find_pods_with_status(pod_string='falcon-kac', namespace='falcon-kac',
+                                                        label_selector='app.kubernetes.io/name=falcon-kac')
 
-      if (status is True) and (len(captured_pods['running']) > 0):
+      # running pods of the release abstrakt installed are upgraded in place only if their values changed
+      managed_release: bool = self.helm_ops.is_helm_chart_deployed(release_name='falcon-kac', namespace='falcon-kac')
+
+      if (status is True) and (len(captured_pods['running']) > 0) and not managed_release:
         print('Kubernetes Admission Controller found up and running in falcon-kac namespace. Skipping installation...')
 
         for pod in captured_pods['running']:
           print(pod)
 
         print(' ')
-        return
+        return True
 
     try:
       with MultiProcessing() as mp:
-        mp.execute_with_progress_indicator(self.aws_daemonset_kac_thread, logger, 0.5, 900)
+        installed: bool = mp.execute_with_progress_indicator(self.aws_daemonset_kac_thread, logger, 0.5, 900) is True
       # with MultiThreading() as mt:
       #   mt.run_with_progress_indicator(self.aws_daemonset_kac_thread, 1, 300)
 
+      if not installed:
+        print('Kubernetes admission controller installation failed\n')
+        return False
+
       print('Kubernetes admission controller installed successfully.\n')
 
       container = ContainerOps(logger=logger)
       container.pod_checker(pod_name='falcon-kac', namespace='falcon-kac',
-                            kubeconfig_path='~/.kube/config', logger=logger)
+                            kubeconfig_path='~/.kube/config', label_selector='app.kubernetes.io/name=falcon-kac',
+                            logger=logger)
+
+      return True
     except subprocess.CalledProcessError as e:
       logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
       logger.error(f'{e}')
       logger.error(f"Command output: {e.stdout}")
       logger.error(f"Command error: {e.stderr}")
       logger.error(f'Kubernetes admission controller installation failed\n')
+      return False
     except Exception as e:
       logger.error(f'Error in function {inspect.currentframe().f_back.f_code.co_name}')
       logger.error(f'{e}')
       logger.error(f'Kubernetes admission controller installation failed\n')
+      return False
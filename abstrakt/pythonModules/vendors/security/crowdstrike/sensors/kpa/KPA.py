@@ -1,5 +1,4 @@
 import subprocess
-import json
 import random
 import string
 
@@ -20,45 +19,28 @@ class FalconKPA(CrowdStrike):
     self.falcon_client_secret = falcon_client_secret
     self.logger = logger
 
-  def get_api_access_token(self, falcon_cloud_api):
-    try:
-      result = subprocess.run([
-        "curl", "-sL", "-X", "POST", f"https://{falcon_cloud_api}/oauth2/token",
-        "-H", "Content-Type: application/x-www-form-urlencoded",
-        "--data-urlencode", f"client_id={self.falcon_client_id}",
-        "--data-urlencode", f"client_secret={self.falcon_client_secret}"
-      ], capture_output=True, text=True)
-
-      access_token = json.loads(result.stdout)['access_token']
-      return access_token
-    except Exception as e:
-      self.logger.error(e)
-      return ""
-
   def execute_kpa_installation_process(self):
-    access_token = self.get_api_access_token(self.falcon_api)
+    # reuse the bearer token already held by the shared Falcon credential context
+    access_token = self.get_falcon_api_bearer_token()
 
     if access_token:
       try:
-        kpa_password_command = [
-          "curl", "-sL", "-X", "GET",
-          f"https://{self.falcon_api}/"
-          f"kubernetes-protection/entities/integration/agent/v1?cluster_name=&is_self_managed_cluster=true",
-          "-H", "Accept: application/yaml",
-          "-H", f"Authorization: Bearer {access_token}"
-        ]
+        kpa_password_url = (f"https://{self.falcon_api}/kubernetes-protection/entities/integration/agent/v1"
+                            f"?cluster_name=&is_self_managed_cluster=true")
 
         # Debug Log
-        self.logger.info(kpa_password_command)
+        self.logger.info(kpa_password_url)
 
-        kpa_password_result = subprocess.run(kpa_password_command, capture_output=True, text=True)
+        kpa_password_result = self.http_client.get(kpa_password_url,
+                                                   headers={"Accept": "application/yaml",
+                                                            "Authorization": f"Bearer {access_token}"})
 
-        if kpa_password_result.stdout:
-          self.logger.info(kpa_password_result.stdout)
-        if kpa_password_result.stderr:
-          self.logger.error(kpa_password_result.stderr)
+        if kpa_password_result.text:
+          self.logger.info(kpa_password_result.text)
+        if not kpa_password_result.ok:
+          self.logger.error(f'{kpa_password_result.status_code} {kpa_password_result.reason}')
 
-        falcon_kpa_password = kpa_password_result.stdout.split('dockerAPIToken:')[1].strip()
+        falcon_kpa_password = kpa_password_result.text.split('dockerAPIToken:')[1].strip()
 
         # Debug Log
         self.logger.info(falcon_kpa_password)
@@ -80,26 +62,13 @@ class FalconKPA(CrowdStrike):
               cluster_name = x
               self.logger.info(cluster_name)
 
-        command = ["helm", "repo", "add", "kpagent-helm", "https://registry.crowdstrike.com/kpagent-helm"]
-
-        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
-
-        if process.stdout:
-          self.logger.info(process.stdout)
-        if process.stderr:
-          self.logger.error(process.stderr)
-
-        command = ["helm", "repo", "update"]
-
-        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
+        self.helm_repo_manager.ensure_repos(repo_names=['kpagent-helm'], logger=self.logger)
 
-        if process.stdout:
-          self.logger.info(process.stdout)
-        if process.stderr:
-          self.logger.error(process.stderr)
+        kpa_chart: str = self.helm_chart_cache.get_chart(chart='kpagent-helm/cs-k8s-protection-agent',
+                                                         logger=self.logger)
 
         command = [
-          "helm", "upgrade", "--install", "kpagent", "kpagent-helm/cs-k8s-protection-agent",
+          "helm", "upgrade", "--install", "kpagent", kpa_chart,
           "-n", "falcon-kubernetes-protection", "--create-namespace",
           "--set", f"crowdstrikeConfig.clientID={self.falcon_client_id}",
           "--set", f"crowdstrikeConfig.clientSecret={self.falcon_client_secret}",
@@ -111,6 +80,9 @@ class FalconKPA(CrowdStrike):
 
         self.logger.info(command)
 
+        if not self.helm_ops.is_upgrade_needed(command=command, logger=self.logger):
+          return True
+
         # Run Helm upgrade/install command
         process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
 
@@ -134,9 +106,14 @@ class FalconKPA(CrowdStrike):
     k8s = KubectlOps(logger=self.logger)
 
     if k8s.namespace_exists(namespace_name='falcon-kubernetes-protection'):
-      captured_pods, status = k8s.find_pods_with_status(pod_string='kpagent', namespace='falcon-kubernetes-protection')
+      captured_pods, status = k8s.find_pods_with_status(pod_string='kpagent', namespace='falcon-kubernetes-protection',
+                                                        label_selector='app.kubernetes.io/instance=kpagent')
+
+      # running pods of the release abstrakt installed are upgraded in place only if their values changed
+      managed_release: bool = self.helm_ops.is_helm_chart_deployed(release_name='kpagent',
+                                                                   namespace='falcon-kubernetes-protection')
 
-      if (status is True) and (len(captured_pods['running']) > 0):
+      if (status is True) and (len(captured_pods['running']) > 0) and not managed_release:
         print('Kubernetes Protection Agent found up and running in falcon-kubernetes-protection namespace. Skipping '
               'installation...')
 
@@ -144,7 +121,7 @@ class FalconKPA(CrowdStrike):
           print(pod)
 
         print()
-        return
+        return True
 
     with MultiThreading() as mt:
       status = mt.run_with_progress_indicator(self.execute_kpa_installation_process, 1, 300)
@@ -154,6 +131,10 @@ class FalconKPA(CrowdStrike):
 
       container = ContainerOps(logger=self.logger)
       container.pod_checker(pod_name='kpagent', namespace='falcon-kubernetes-protection',
-                            kubeconfig_path='~/.kube/config')
+                            kubeconfig_path='~/.kube/config', label_selector='app.kubernetes.io/instance=kpagent')
+
+      return True
     else:
       print('Failed to install kubernetes protection agent\n')
+
+      return False